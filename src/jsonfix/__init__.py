@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
-from .parser import can_parse, get_repairs, load_relaxed, loads_relaxed
-from .repairs import Repair, RepairKind
+from .parser import (
+    IncrementalRelaxedParser,
+    can_parse,
+    clear_repair_cache,
+    get_repairs,
+    load_relaxed,
+    loads_relaxed,
+    loads_relaxed_iter,
+)
+from .repairs import Repair, RepairKind, RepairLog
 
 __version__ = "0.1.0"
 
@@ -11,8 +19,12 @@ __all__ = [
     "__version__",
     "Repair",
     "RepairKind",
+    "RepairLog",
     "loads_relaxed",
     "load_relaxed",
+    "loads_relaxed_iter",
+    "IncrementalRelaxedParser",
     "can_parse",
     "get_repairs",
+    "clear_repair_cache",
 ]
@@ -8,7 +8,7 @@ import sys
 from pathlib import Path
 from typing import TextIO
 
-from . import __version__, get_repairs, loads_relaxed
+from . import RepairLog, __version__, loads_relaxed
 
 
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
@@ -119,13 +119,12 @@ def process_file(
         err_stream.write(f"Error reading {path}: {e}\n")
         return False
 
-    # Get repairs to show what was fixed
-    repairs = get_repairs(content)
-
-    # Parse and re-serialize to get fixed JSON
+    # Parse once, collecting the repairs to show what was fixed, and
+    # re-serialize to get fixed JSON
+    repairs = RepairLog()
     try:
         import json
-        data = loads_relaxed(content)
+        data = loads_relaxed(content, repair_log=repairs)
         fixed = json.dumps(data, indent=2, ensure_ascii=False)
         # Add trailing newline for files
         if output_path != "-" and not (path == "-" and output_path is None):
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import re
+from collections.abc import MutableSequence
 
-from .repairs import Repair, RepairKind, create_repair
+from .repairs import LineIndex, Repair, RepairKind, create_repair
 
 # Smart/curly quote mappings to straight quotes
 SMART_DOUBLE_QUOTES: dict[str, str] = {
@@ -34,10 +35,108 @@ SMART_SINGLE_QUOTES: dict[str, str] = {
 # Combined mapping for all quote normalizations
 ALL_QUOTE_MAPPINGS: dict[str, str] = {**SMART_DOUBLE_QUOTES, **SMART_SINGLE_QUOTES}
 
+# A pattern matching any character the mapping replaces
+_SMART_QUOTE_RE = re.compile("[" + re.escape("".join(ALL_QUOTE_MAPPINGS)) + "]")
+
+# A whole double-quoted string literal, including an unterminated one that
+# runs to the end of the text. The trigger patterns of the scanning
+# normalizers list it as their first alternative, so the regex engine steps
+# over string bodies without returning to Python and a match whose text
+# starts with a double quote is simply skipped.
+STRING_LITERAL_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*(?:"|\\?\Z)'
+
+_STRING_LITERAL_RE = re.compile(STRING_LITERAL_PATTERN, re.DOTALL)
+# The body of a string after its opening quote: stops at the next quote
+# that is not escaped, or before a backslash that ends the text
+_STRING_BODY_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# Text up to the first string whose closing quote fix_unescaped_quotes
+# would have to weigh: every quote before it is followed by a colon, a
+# closing bracket, the end of the text, or a comma before another value
+_CLOSED_STRINGS_RE = re.compile(
+    r'[^"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"'
+    r'(?=[ \t\n\r]*(?:[:}\]]|\Z|,[ \t\n\r]*(?:["{\[\d-]|true|false|null|\Z)))'
+    r'[^"]*)*',
+    re.DOTALL,
+)
+# A key with no escapes in it, up to its colon
+_SIMPLE_KEY_RE = re.compile(r'"[^"\\]*"[ \t\n\r]*:')
+_KEY_CONTEXT_RE = re.compile(STRING_LITERAL_PATTERN + r'|[{,]', re.DOTALL)
+# A double-quoted string, a backslash escape or a single quote; and a
+# whole single-quoted string, whose escaped characters include quotes
+_SINGLE_QUOTE_CONTEXT_RE = re.compile(STRING_LITERAL_PATTERN + r"|\\.|'", re.DOTALL)
+_SINGLE_QUOTED_RE = re.compile(r"'([^'\\]*(?:\\.[^'\\]*)*)'", re.DOTALL)
+_PYTHON_LITERAL_OR_STRING_RE = re.compile(
+    STRING_LITERAL_PATTERN + r'|True|False|None', re.DOTALL
+)
+# Text up to the next ellipsis marker (... or …) outside strings, or to the
+# end of the text
+_UP_TO_ELLIPSIS_RE = re.compile(
+    r'[^".\u2026]*(?:(?:' + STRING_LITERAL_PATTERN + r'|\.(?!\.\.))[^".\u2026]*)*',
+    re.DOTALL,
+)
+# An opening bracket or comma followed by another comma, which is captured
+_DOUBLE_COMMA_RE = re.compile(r'[{\[,](?=[ \t\n\r]*(,))')
+_DOUBLE_COMMA_OR_STRING_RE = re.compile(
+    STRING_LITERAL_PATTERN + '|' + _DOUBLE_COMMA_RE.pattern, re.DOTALL
+)
+_JAVASCRIPT_VALUE_OR_STRING_RE = re.compile(
+    STRING_LITERAL_PATTERN + r'|[-+]?Infinity|NaN|undefined', re.DOTALL
+)
+_NUMBER_FORMAT_OR_STRING_RE = re.compile(
+    STRING_LITERAL_PATTERN + r'|-?0[xXoObB][0-9a-fA-F]+',
+    re.DOTALL,
+)
+# Any radix prefix, in or out of strings; its absence rules out the pass
+_NUMBER_PREFIX_RE = re.compile(r'0[xXoObB]')
+
+# Bracket scanning for extract_json_from_text: the first opening bracket,
+# and the text split into pieces that each run up to and including the
+# next bracket of one kind, with complete string literals skipped. Where
+# no such bracket follows, for instance after an unterminated string, the
+# last piece is the rest of the text.
+_OPENING_BRACKET_RE = re.compile(r'[{\[]')
+_UP_TO_BRACE_RE = re.compile(
+    r'[^{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}"]*)*[{}]|.+', re.DOTALL
+)
+_UP_TO_SQUARE_BRACKET_RE = re.compile(
+    r'[^\[\]"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^\[\]"]*)*[\[\]]|.+', re.DOTALL
+)
+
+# Brackets, plus whole strings so that their bodies are skipped
+_BRACKET_OR_STRING_RE = re.compile(
+    STRING_LITERAL_PATTERN + r'|[{}\[\]]', re.DOTALL
+)
+
+# A run of whitespace, possibly empty
+_WHITESPACE_RE = re.compile(r'\s*')
+# Control characters other than newline, which escape_newlines_in_strings
+# handles, and a string body up to its closing quote or the next of them
+_CONTROL_CHARACTERS = tuple(chr(code) for code in range(0x20) if code != 0x0A)
+_STRING_BODY_TO_CONTROL_RE = re.compile(
+    r'[^"\\\x00-\x09\x0b-\x1f]*(?:\\.[^"\\\x00-\x09\x0b-\x1f]*)*', re.DOTALL
+)
+# The control characters that have a short escape sequence
+_CONTROL_CHAR_ESCAPES = {
+    '\t': '\\t',  # Tab
+    '\r': '\\r',  # Carriage return (also handled by newline escaper)
+    '\f': '\\f',  # Form feed
+    '\b': '\\b',  # Backspace
+}
+# A run of string content up to the next quote or backslash
+_STRING_PLAIN_RUN_RE = re.compile(r'[^"\\]*')
+# A non-empty run of characters that cannot change fix_missing_commas'
+# state: ASCII other than quotes, brackets, commas, colons, digits, minus
+# signs and the first letters of true, false and null. Non-ASCII characters
+# are checked one at a time, since str.isdigit accepts other scripts' digits
+_COMMA_NEUTRAL_RUN_RE = re.compile(r'[^"{}\[\],:0-9tfn\x80-\U0010ffff-]+')
+
+# Language tags accepted on an opening markdown fence, in any case
+_FENCE_LANGUAGES = frozenset(("json", "jsonc", "javascript", "js"))
+
 
 def normalize_quotes(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Normalize smart/curly quotes to straight quotes.
 
@@ -54,31 +153,30 @@ def normalize_quotes(
     if not text:
         return text
 
-    result_chars: list[str] = []
-    i = 0
-
-    while i < len(text):
-        char = text[i]
-
-        if char in ALL_QUOTE_MAPPINGS:
-            replacement = ALL_QUOTE_MAPPINGS[char]
-            result_chars.append(replacement)
-
-            if repair_log is not None:
-                repair = create_repair(
-                    kind=RepairKind.SMART_QUOTE,
-                    text=text,
-                    position=i,
-                    original=char,
-                    replacement=replacement,
-                )
-                repair_log.append(repair)
-        else:
-            result_chars.append(char)
+    # Nothing to translate: return the input without copying it
+    if _SMART_QUOTE_RE.search(text) is None:
+        return text
 
-        i += 1
+    if repair_log is not None:
+        lines = LineIndex(text)
+        for match in _SMART_QUOTE_RE.finditer(text):
+            char = match.group()
+            repair = create_repair(
+                kind=RepairKind.SMART_QUOTE,
+                lines=lines,
+                position=match.start(),
+                original=char,
+                replacement=ALL_QUOTE_MAPPINGS[char],
+            )
+            repair_log.append(repair)
 
-    return "".join(result_chars)
+    # One str.replace per quote character present rather than str.translate,
+    # which maps a non-ASCII string one character at a time in Python
+    # objects; each replace is a C-level search over the text
+    for smart_quote, straight_quote in ALL_QUOTE_MAPPINGS.items():
+        if smart_quote in text:
+            text = text.replace(smart_quote, straight_quote)
+    return text
 
 
 def has_smart_quotes(text: str) -> bool:
@@ -90,12 +188,43 @@ def has_smart_quotes(text: str) -> bool:
     Returns:
         True if text contains smart quotes that would be normalized
     """
-    return any(char in ALL_QUOTE_MAPPINGS for char in text)
+    return _SMART_QUOTE_RE.search(text) is not None
+
+
+def skip_string(text: str, start: int) -> int:
+    """Find the end of the double-quoted string opening at ``start``.
+
+    Jumps between quote characters with str.find instead of stepping
+    through the string body one character at a time. A quote preceded by
+    an odd run of backslashes is escaped and does not close the string.
+
+    Args:
+        text: The full text
+        start: Position of the opening double quote
+
+    Returns:
+        Position just past the closing quote, or len(text) if the string
+        is unterminated
+    """
+    i = start + 1
+    while True:
+        end = text.find('"', i)
+        if end == -1:
+            return len(text)
+
+        # Count the backslashes immediately before the quote
+        j = end - 1
+        while text[j] == "\\":
+            j -= 1
+        if (end - 1 - j) % 2 == 0:
+            return end + 1
+
+        i = end + 1
 
 
 def convert_single_quote_strings(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Convert single-quoted strings to double-quoted strings.
 
@@ -111,114 +240,63 @@ def convert_single_quote_strings(
     Returns:
         Text with single-quoted strings converted to double quotes
     """
-    if not text:
+    if "'" not in text:
         return text
 
     result: list[str] = []
+    copied = 0  # text[:copied] is already in result
     i = 0
-    in_double_string = False
-    escape_next = False
+    lines = LineIndex(text)
 
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
-
-        if char == "\\":
-            result.append(char)
-            escape_next = True
-            i += 1
+    while True:
+        # Step over double-quoted strings and backslash escapes to the next
+        # single quote outside them
+        match = _SINGLE_QUOTE_CONTEXT_RE.search(text, i)
+        if match is None:
+            break
+        start_pos = match.start()
+        i = match.end()
+        if text[start_pos] != "'":
             continue
 
-        # Track double-quoted string boundaries
-        if char == '"' and not in_double_string:
-            in_double_string = True
-            result.append(char)
-            i += 1
+        single = _SINGLE_QUOTED_RE.match(text, start_pos)
+        if single is None:
+            # No closing quote found - leave as-is
             continue
-        elif char == '"' and in_double_string:
-            in_double_string = False
-            result.append(char)
-            i += 1
-            continue
-
-        # Convert single-quoted strings when outside double strings
-        if char == "'" and not in_double_string:
-            # Find the closing single quote
-            start_pos = i
-            j = i + 1
-            string_content: list[str] = []
-            escape_in_single = False
-
-            while j < len(text):
-                c = text[j]
-                if escape_in_single:
-                    if c == "'":
-                        # Escaped single quote inside single-quoted string
-                        string_content.append("'")
-                    elif c == '"':
-                        # Escaped double quote - keep the escape
-                        string_content.append('\\"')
-                    else:
-                        # Keep other escapes as-is
-                        string_content.append("\\")
-                        string_content.append(c)
-                    escape_in_single = False
-                    j += 1
-                    continue
-
-                if c == "\\":
-                    escape_in_single = True
-                    j += 1
-                    continue
-
-                if c == "'":
-                    # Found closing quote
-                    original = text[start_pos : j + 1]
-                    # Escape any unescaped double quotes in the content
-                    converted_content = "".join(string_content).replace(
-                        '"', '\\"'
-                    )
-                    # But don't double-escape already escaped quotes
-                    converted_content = converted_content.replace('\\\\"', '\\"')
-                    replacement = '"' + converted_content + '"'
 
-                    if repair_log is not None:
-                        repair = create_repair(
-                            kind=RepairKind.SINGLE_QUOTE_STRING,
-                            text=text,
-                            position=start_pos,
-                            original=original,
-                            replacement=replacement,
-                        )
-                        repair_log.append(repair)
+        original = single.group()
+        # Unescape single quotes; other escapes are kept as they are
+        content = single.group(1).replace("\\'", "'")
+        # Escape any unescaped double quotes in the content
+        converted_content = content.replace('"', '\\"')
+        # But don't double-escape already escaped quotes
+        converted_content = converted_content.replace('\\\\"', '\\"')
+        replacement = '"' + converted_content + '"'
 
-                    result.append(replacement)
-                    i = j + 1
-                    break
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.SINGLE_QUOTE_STRING,
+                lines=lines,
+                position=start_pos,
+                original=original,
+                replacement=replacement,
+            )
+            repair_log.append(repair)
 
-                string_content.append(c)
-                j += 1
-            else:
-                # No closing quote found - leave as-is
-                result.append(char)
-                i += 1
-            continue
+        result.append(text[copied:start_pos])
+        result.append(replacement)
+        copied = i = single.end()
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def quote_unquoted_keys(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Add quotes around unquoted object keys.
 
@@ -235,89 +313,67 @@ def quote_unquoted_keys(
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    match = _KEY_CONTEXT_RE.search(text)
+    lines = LineIndex(text)
+
+    while match is not None:
+        # Skip over strings in one step
+        if match.group()[0] == '"':
+            match = _KEY_CONTEXT_RE.search(text, match.end())
             continue
 
-        if char == "\\" and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
+        # Look for unquoted keys after { or ,
+        i = match.end()
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
+        # Skip whitespace
+        while i < length and text[i] in " \t\n\r":
             i += 1
-            continue
 
-        # Look for unquoted keys after { or ,
-        if not in_string and char in "{,":
-            result.append(char)
-            i += 1
+        if i >= length:
+            break
 
-            # Skip whitespace
-            while i < len(text) and text[i] in " \t\n\r":
-                result.append(text[i])
-                i += 1
+        # Check if next is an identifier (unquoted key)
+        if text[i].isalpha() or text[i] in "_$":
+            key_start = i
+            j = i
+            # Read identifier: [a-zA-Z_$][a-zA-Z0-9_$]*
+            while j < length and (text[j].isalnum() or text[j] in "_$"):
+                j += 1
 
-            if i >= len(text):
-                break
+            # Skip whitespace after identifier
+            k = j
+            while k < length and text[k] in " \t\n\r":
+                k += 1
 
-            # Check if next is an identifier (unquoted key)
-            if text[i].isalpha() or text[i] in "_$":
-                key_start = i
-                j = i
-                # Read identifier: [a-zA-Z_$][a-zA-Z0-9_$]*
-                while j < len(text) and (
-                    text[j].isalnum() or text[j] in "_$"
-                ):
-                    j += 1
-
-                # Skip whitespace after identifier
-                k = j
-                while k < len(text) and text[k] in " \t\n\r":
-                    k += 1
-
-                # Check if followed by colon (making it a key)
-                if k < len(text) and text[k] == ":":
-                    key = text[key_start:j]
-                    original = key
+            # Check if followed by colon (making it a key)
+            if k < length and text[k] == ":":
+                key = text[key_start:j]
+                original = key
 
-                    if repair_log is not None:
-                        repair = create_repair(
-                            kind=RepairKind.UNQUOTED_KEY,
-                            text=text,
-                            position=key_start,
-                            original=original,
-                            replacement=f'"{key}"',
-                        )
-                        repair_log.append(repair)
+                if repair_log is not None:
+                    repair = create_repair(
+                        kind=RepairKind.UNQUOTED_KEY,
+                        lines=lines,
+                        position=key_start,
+                        original=original,
+                        replacement=f'"{key}"',
+                    )
+                    repair_log.append(repair)
 
-                    result.append('"')
-                    result.append(key)
-                    result.append('"')
-                    # Add whitespace between key and colon
-                    result.append(text[j:k])
-                    i = k
-                    continue
+                result.append(text[copied:key_start])
+                result.append('"')
+                result.append(key)
+                result.append('"')
+                copied = i = j
 
-            continue
+        match = _KEY_CONTEXT_RE.search(text, i)
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
@@ -331,7 +387,7 @@ PYTHON_LITERALS: dict[str, str] = {
 
 def convert_python_literals(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Convert Python literals to JSON equivalents.
 
@@ -346,76 +402,51 @@ def convert_python_literals(
     Returns:
         Text with Python literals converted to JSON
     """
-    if not text:
+    if 'True' not in text and 'False' not in text and 'None' not in text:
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    lines = LineIndex(text)
 
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+    for match in _PYTHON_LITERAL_OR_STRING_RE.finditer(text):
+        py_literal = match.group()
+        if py_literal[0] == '"':
             continue
 
-        if char == "\\" and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
+        # Check word boundaries
+        i = match.start()
+        after_pos = match.end()
+        before_ok = i == 0 or not text[i - 1].isalnum()
+        after_ok = after_pos >= length or not text[after_pos].isalnum()
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
-            continue
+        if before_ok and after_ok:
+            json_literal = PYTHON_LITERALS[py_literal]
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.PYTHON_LITERAL,
+                    lines=lines,
+                    position=i,
+                    original=py_literal,
+                    replacement=json_literal,
+                )
+                repair_log.append(repair)
 
-        # Look for Python literals outside strings
-        if not in_string:
-            for py_literal, json_literal in PYTHON_LITERALS.items():
-                if text[i:].startswith(py_literal):
-                    # Check word boundaries
-                    before_ok = i == 0 or not text[i - 1].isalnum()
-                    after_pos = i + len(py_literal)
-                    after_ok = after_pos >= len(text) or not text[
-                        after_pos
-                    ].isalnum()
-
-                    if before_ok and after_ok:
-                        if repair_log is not None:
-                            repair = create_repair(
-                                kind=RepairKind.PYTHON_LITERAL,
-                                text=text,
-                                position=i,
-                                original=py_literal,
-                                replacement=json_literal,
-                            )
-                            repair_log.append(repair)
-
-                        result.append(json_literal)
-                        i += len(py_literal)
-                        break
-            else:
-                result.append(char)
-                i += 1
-            continue
+            result.append(text[copied:i])
+            result.append(json_literal)
+            copied = after_pos
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def escape_newlines_in_strings(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Escape literal newlines inside strings.
 
@@ -428,65 +459,65 @@ def escape_newlines_in_strings(
     Returns:
         Text with newlines in strings escaped
     """
-    if not text:
+    if '\n' not in text and '\r' not in text:
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    start = text.find('"')
+    lines = LineIndex(text)
+
+    # Only string bodies can change, so jump from string to string and
+    # walk a body character by character only if it holds a line break
+    while start != -1:
+        end = skip_string(text, start)
+
+        if text.find("\n", start, end) != -1 or text.find("\r", start, end) != -1:
+            i = start + 1
+            while i < end:
+                char = text[i]
 
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
+                # Handle escape sequences
+                if char == "\\":
+                    i += 2
+                    continue
 
-        if char == "\\" and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
+                # Escape literal newlines inside strings
+                if char in "\n\r":
+                    if repair_log is not None:
+                        repair = create_repair(
+                            kind=RepairKind.UNESCAPED_NEWLINE,
+                            lines=lines,
+                            position=i,
+                            original=repr(char)[1:-1],  # '\n' or '\r'
+                            replacement="\\n" if char == "\n" else "\\r",
+                        )
+                        repair_log.append(repair)
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
-            continue
+                    result.append(text[copied:i])
+                    if char == "\n":
+                        result.append("\\n")
+                    else:  # \r
+                        result.append("\\r")
+                    copied = i + 1
 
-        # Escape literal newlines inside strings
-        if in_string and char in "\n\r":
-            if repair_log is not None:
-                repair = create_repair(
-                    kind=RepairKind.UNESCAPED_NEWLINE,
-                    text=text,
-                    position=i,
-                    original=repr(char)[1:-1],  # '\n' or '\r'
-                    replacement="\\n" if char == "\n" else "\\r",
-                )
-                repair_log.append(repair)
+                i += 1
 
-            if char == "\n":
-                result.append("\\n")
-            else:  # \r
-                result.append("\\r")
-            i += 1
-            continue
+        if end >= length:
+            break
+        start = text.find('"', end)
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def remove_ellipsis_markers(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Remove truncation markers like ... from arrays/objects.
 
@@ -499,104 +530,60 @@ def remove_ellipsis_markers(
     Returns:
         Text with ellipsis markers removed
     """
-    if not text:
+    if '...' not in text and '\u2026' not in text:
         return text
 
     result: list[str] = []
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
     i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
+    # Past the last marker the strings that remain need not be walked
+    last_marker = max(text.rfind('...'), text.rfind('\u2026'))
+    lines = LineIndex(text)
+
+    while i <= last_marker:
+        # Jump over strings and other text to the next marker
+        match = _UP_TO_ELLIPSIS_RE.match(text, i)
+        assert match is not None  # The pattern can match empty
+        i = start_pos = match.end()
+        if i >= length:
+            break
+        end = i + 1 if text[i] == '\u2026' else i + 3
+        removed = text[i:end]
+        result.append(text[copied:i])
+
+        # Look back to remove a preceding comma (with optional whitespace)
+        j = len(result) - 1
+        while j >= 0 and not result[j].rstrip(" \t\n\r"):
+            j -= 1
+        if j >= 0:
+            kept = result[j].rstrip(" \t\n\r")
+            if kept.endswith(","):
+                # Remove the comma and whitespace
+                result[j] = kept[:-1]
+                del result[j + 1 :]
+                removed = ", " + removed
 
-        if char == "\\" and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.TRUNCATION_MARKER,
+                lines=lines,
+                position=start_pos,
+                original=removed,
+                replacement="",
+            )
+            repair_log.append(repair)
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
+        i = end
+        # Skip whitespace after ellipsis
+        while i < length and text[i] in " \t\n\r":
             i += 1
-            continue
-
-        # Look for ellipsis markers outside strings
-        if not in_string:
-            # Check for ASCII ellipsis ...
-            if text[i : i + 3] == "...":
-                # Look back to remove preceding comma
-                removed = "..."
-                start_pos = i
-
-                # Check if there's a comma before (with optional whitespace)
-                j = len(result) - 1
-                while j >= 0 and result[j] in " \t\n\r":
-                    j -= 1
-                if j >= 0 and result[j] == ",":
-                    # Remove the comma and whitespace
-                    while len(result) > j:
-                        result.pop()
-                    removed = ", ..."
-
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.TRUNCATION_MARKER,
-                        text=text,
-                        position=start_pos,
-                        original=removed,
-                        replacement="",
-                    )
-                    repair_log.append(repair)
-
-                i += 3
-                # Skip whitespace after ellipsis
-                while i < len(text) and text[i] in " \t\n\r":
-                    i += 1
-                continue
-
-            # Check for Unicode ellipsis …
-            if char == "…":
-                removed = "…"
-                start_pos = i
+        copied = i
 
-                # Check if there's a comma before
-                j = len(result) - 1
-                while j >= 0 and result[j] in " \t\n\r":
-                    j -= 1
-                if j >= 0 and result[j] == ",":
-                    while len(result) > j:
-                        result.pop()
-                    removed = ", …"
-
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.TRUNCATION_MARKER,
-                        text=text,
-                        position=start_pos,
-                        original=removed,
-                        replacement="",
-                    )
-                    repair_log.append(repair)
-
-                i += 1
-                # Skip whitespace after ellipsis
-                while i < len(text) and text[i] in " \t\n\r":
-                    i += 1
-                continue
-
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
@@ -605,9 +592,18 @@ def remove_ellipsis_markers(
 # =============================================================================
 
 
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    # A match object rather than a Python loop or a stripped copy; \s
+    # matches exactly the characters for which str.isspace() is true
+    match = _WHITESPACE_RE.match(text, pos)
+    assert match is not None  # The pattern can match empty
+    return match.end()
+
+
 def remove_markdown_fences(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Remove markdown code fences from around JSON.
 
@@ -615,6 +611,7 @@ def remove_markdown_fences(
     - ```json ... ```
     - ```javascript ... ```
     - ```js ... ```
+    - ```jsonc ... ```
     - ``` ... ``` (plain fence)
 
     Args:
@@ -624,39 +621,51 @@ def remove_markdown_fences(
     Returns:
         Text with markdown fences removed
     """
-    if not text:
+    # Text can only open with a fence if it starts with a backtick or
+    # whitespace; most input starts with a bracket and stops here
+    if not text or (text[0] != '`' and not text[0].isspace()):
         return text
 
-    # Pattern to match markdown fence at start
-    # Allows: ```json, ```JSON, ```javascript, ```js, ``` (with optional space)
-    fence_start_pattern = re.compile(
-        r'^(\s*)```\s*(?:json|javascript|js)?\s*\n',
-        re.IGNORECASE
-    )
-
-    # Check for opening fence
-    match = fence_start_pattern.match(text)
-    if not match:
+    # Check for an opening fence: optional whitespace, ```, optional
+    # whitespace and language tag, then the rest of the line
+    fence = _skip_whitespace(text, 0)
+    if not text.startswith("```", fence):
         return text
+    tag_start = _skip_whitespace(text, fence + 3)
+    tag_end = tag_start
+    while tag_end < len(text) and text[tag_end].isascii() and text[tag_end].isalpha():
+        tag_end += 1
+
+    # The content starts after the last newline of the whitespace that
+    # follows the tag or, failing that, the backticks
+    newline = -1
+    if text[tag_start:tag_end].lower() in _FENCE_LANGUAGES:
+        newline = text.rfind("\n", tag_end, _skip_whitespace(text, tag_end))
+    if newline == -1:
+        newline = text.rfind("\n", fence + 3, tag_start)
+        if newline == -1:
+            return text
+    start_pos = newline + 1
+
+    # Find the closing fence: the first ``` followed by nothing but
+    # whitespace up to the end of its line
+    end_pos = len(text)
+    fence = text.find("```", start_pos)
+    while fence != -1:
+        after = _skip_whitespace(text, fence + 3)
+        if after == len(text) or text.find("\n", fence + 3, after) != -1:
+            end_pos = fence
+            break
+        fence = text.find("```", fence + 1)
 
-    # Find the closing fence
-    start_pos = match.end()
-    fence_end_pattern = re.compile(r'\n?\s*```\s*$', re.MULTILINE)
-    end_match = fence_end_pattern.search(text, start_pos)
-
-    if end_match:
-        # Extract content between fences
-        content = text[start_pos:end_match.start()]
-        extracted = content.strip()
-    else:
-        # No closing fence - extract content after opening fence
-        content = text[start_pos:]
-        extracted = content.strip()
+    # Extract content between fences, or after the opening fence when
+    # there is no closing one
+    extracted = text[start_pos:end_pos].strip()
 
     if repair_log is not None:
         repair = create_repair(
             kind=RepairKind.MARKDOWN_FENCE_REMOVED,
-            text=text,
+            lines=LineIndex(text),
             position=0,
             original=text,
             replacement=extracted,
@@ -668,7 +677,7 @@ def remove_markdown_fences(
 
 def extract_json_from_text(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Extract JSON from text with surrounding preamble/postamble.
 
@@ -701,51 +710,37 @@ def extract_json_from_text(
     if text.startswith('//') or text.startswith('#') or text.startswith('/*'):
         return text
 
-    # Find the first { or [
-    json_start = -1
-    for i, char in enumerate(text):
-        if char in '{[':
-            json_start = i
-            break
-
-    if json_start == -1:
+    # Find the first { or [. Most input starts with one, which the search
+    # finds at once.
+    start_match = _OPENING_BRACKET_RE.search(text)
+    if start_match is None:
         # No JSON structure found
         return text
+    json_start = start_match.start()
 
-    # Find the matching closing bracket
-    opening = text[json_start]
-    closing = '}' if opening == '{' else ']'
+    # Find the matching closing bracket, jumping from one bracket of the
+    # opening kind to the next
+    if text[json_start] == '{':
+        opening, bracket_re = '{', _UP_TO_BRACE_RE
+    else:
+        opening, bracket_re = '[', _UP_TO_SQUARE_BRACKET_RE
 
-    # Track bracket nesting, accounting for strings
+    # findall() hands back plain strings rather than a match object per
+    # bracket; their lengths give the position. The last piece may instead
+    # be the rest of the text, with no bracket outside strings. Counting it
+    # as a closing bracket can only end the value at the end of the text,
+    # which is where it runs to anyway.
     bracket_count = 0
-    in_string = False
-    escape_next = False
     json_end = -1
-
-    for i in range(json_start, len(text)):
-        char = text[i]
-
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == opening:
+    i = json_start
+    for piece in bracket_re.findall(text, json_start):
+        i += len(piece)
+        if piece[-1] == opening:
             bracket_count += 1
-        elif char == closing:
+        else:
             bracket_count -= 1
             if bracket_count == 0:
-                json_end = i + 1
+                json_end = i
                 break
 
     if json_end == -1:
@@ -755,17 +750,18 @@ def extract_json_from_text(
     else:
         # Check if postamble starts with a comment marker
         # If so, include it so the comment stripper can handle it
-        postamble_raw = text[json_end:]
-        postamble = postamble_raw.strip()
+        # The text is already stripped, so any postamble ends with a
+        # non-whitespace character; it is inspected in place, not copied
+        postamble_start = _skip_whitespace(text, json_end)
 
         # Check if postamble is actually a comment (should be processed by comment stripper)
-        if postamble.startswith('//') or postamble.startswith('#') or postamble.startswith('/*'):
+        if text.startswith(('//', '#', '/*'), postamble_start):
             # Include the postamble - it's a comment, not plain text
             extracted = text[json_start:]
             has_postamble = False  # Don't log as extraction, let comment stripper log it
         else:
             extracted = text[json_start:json_end]
-            has_postamble = bool(postamble)
+            has_postamble = postamble_start < len(text)
 
     has_preamble = json_start > 0
 
@@ -775,7 +771,7 @@ def extract_json_from_text(
             preamble = text[:json_start] if json_start > 0 else ""
             repair = create_repair(
                 kind=RepairKind.JSON_EXTRACTED,
-                text=original_text,
+                lines=LineIndex(original_text),
                 position=0,
                 original=preamble,
                 replacement="",
@@ -785,6 +781,75 @@ def extract_json_from_text(
     return extracted
 
 
+def auto_close_brackets(
+    text: str,
+    repair_log: MutableSequence[Repair] | None = None,
+) -> str:
+    """Add missing closing brackets at end of input.
+
+    Tracks bracket nesting and adds any missing closing brackets
+    at the end of the string.
+
+    Args:
+        text: JSON text possibly with missing closing brackets
+        repair_log: Optional list to append Repair objects to
+
+    Returns:
+        JSON text with missing closing brackets added
+    """
+    if not text:
+        return text
+
+    # Stack of opening brackets
+    bracket_stack: list[str] = []
+
+    # Jump straight from one bracket to the next instead of dispatching on
+    # every character; string bodies are skipped whole. findall() hands back
+    # plain strings, so no match object is built per bracket.
+    for char in _BRACKET_OR_STRING_RE.findall(text):
+        if char[0] == '"':
+            continue
+
+        # Track brackets outside strings
+        if char == '{':
+            bracket_stack.append('{')
+        elif char == '[':
+            bracket_stack.append('[')
+        elif char == '}':
+            if bracket_stack and bracket_stack[-1] == '{':
+                bracket_stack.pop()
+        elif bracket_stack and bracket_stack[-1] == '[':
+            bracket_stack.pop()
+
+    # Add missing closing brackets
+    if not bracket_stack:
+        return text
+
+    closing_brackets: list[str] = []
+    end_position = len(text)
+    lines = LineIndex(text)
+
+    for bracket in reversed(bracket_stack):
+        if bracket == '{':
+            closing = '}'
+        else:
+            closing = ']'
+
+        closing_brackets.append(closing)
+
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.MISSING_BRACKET,
+                lines=lines,
+                position=end_position,
+                original='',
+                replacement=closing,
+            )
+            repair_log.append(repair)
+
+    return text + ''.join(closing_brackets)
+
+
 # =============================================================================
 # V3 normalizers (Structural)
 # =============================================================================
@@ -796,7 +861,7 @@ VALID_JSON_ESCAPES = set('"\\bfnrtu/')
 
 def fix_missing_colons(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Insert missing colons between keys and values in objects.
 
@@ -816,145 +881,109 @@ def fix_missing_colons(
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    inserted = -1  # Position of the last colon inserted
+
+    # Bracket depth and whether the last opening bracket was '{', counted
+    # over text[:counted] (string contents included) and brought up to
+    # date only when a key that follows a value needs them
+    counted = 0
+    depth = 0
+    in_obj = False
+    lines = LineIndex(text)
+
+    # Only a closing quote can need a colon after it. The regex matches
+    # whole strings, so each match ends just past one; an unterminated
+    # string runs to the end of the text, leaving nothing to look at.
+    for match in _STRING_LITERAL_RE.finditer(text):
+        i = match.end()
+
+        # Look ahead: skip whitespace
+        j = i
+        while j < length and text[j] in ' \t\n\r':
+            j += 1
+
+        if j >= length:
+            continue
 
-    while i < len(text):
-        char = text[i]
+        next_char = text[j]
 
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+        # Check if we're in an object context and missing a colon
+        # Colon is needed if next char starts a value: " { [ digit - or true/false/null
+        if next_char == ':':
+            # Colon already present
             continue
 
-        if char == '\\' and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
+        # Check if next char could be a value start
+        is_value_start = (
+            next_char == '"' or  # String value
+            next_char == '{' or  # Object value
+            next_char == '[' or  # Array value
+            next_char.isdigit() or  # Number
+            next_char == '-' or  # Negative number
+            text.startswith('true', j) or
+            text.startswith('false', j) or
+            text.startswith('null', j)
+        )
+        if not is_value_start:
             continue
 
-        # Track string boundaries
-        if char == '"':
-            if not in_string:
-                in_string = True
-                result.append(char)
-                i += 1
+        # Check context - are we likely after a key? Look back from the
+        # previous quote (the key's opening quote, unless the key holds an
+        # escaped quote) past whitespace to the character before it
+        k = text.rfind('"', 0, i - 1) - 1
+        while k >= 0 and text[k] in ' \t\n\r':
+            k -= 1
+        if k < 0 or inserted == k + 1:
+            # Nothing before the key, or a colon we inserted after the
+            # previous string
+            continue
+
+        # A key preceded by { or , is missing its colon
+        if text[k] not in '{,':
+            # Also check if preceded by a value (number, bool, null, closing bracket)
+            # This handles {"a" 1 "b" 2} where "b" comes after the value 1
+            if not (text[k].isdigit() or text[k] in '}]"' or
+                    text[max(0, k - 3):k + 1].endswith(('true', 'false', 'null'))):
                 continue
-            else:
-                # Closing quote - check if we need to insert a colon
-                in_string = False
-                result.append(char)
-                i += 1
 
-                # Look ahead: skip whitespace
-                j = i
-                while j < len(text) and text[j] in ' \t\n\r':
-                    j += 1
+            # Check if we're in an object context
+            depth += (
+                text.count('{', counted, i) + text.count('[', counted, i)
+                - text.count('}', counted, i) - text.count(']', counted, i)
+            )
+            last_brace = text.rfind('{', counted, i)
+            last_bracket = text.rfind('[', counted, i)
+            if last_brace != last_bracket:
+                in_obj = last_brace > last_bracket
+            counted = i
+            if not (in_obj and depth > 0):
+                continue
 
-                if j >= len(text):
-                    continue
-
-                next_char = text[j]
-
-                # Check if we're in an object context and missing a colon
-                # Colon is needed if next char starts a value: " { [ digit - or true/false/null
-                if next_char == ':':
-                    # Colon already present
-                    continue
-
-                # Check if next char could be a value start
-                is_value_start = (
-                    next_char == '"' or  # String value
-                    next_char == '{' or  # Object value
-                    next_char == '[' or  # Array value
-                    next_char.isdigit() or  # Number
-                    next_char == '-' or  # Negative number
-                    text[j:].startswith('true') or
-                    text[j:].startswith('false') or
-                    text[j:].startswith('null')
-                )
-
-                if is_value_start:
-                    # Check context - are we likely after a key?
-                    # Look back in result to see if we're after a { or ,
-                    # followed by a string (key)
-                    k = len(result) - 1
-                    # Skip back past the closing quote we just added
-                    if k >= 0 and result[k] == '"':
-                        k -= 1
-                    # Skip back past string content
-                    while k >= 0 and result[k] != '"':
-                        k -= 1
-                    # Now at opening quote of potential key
-                    if k >= 0 and result[k] == '"':
-                        k -= 1
-                        # Skip whitespace
-                        while k >= 0 and result[k] in ' \t\n\r':
-                            k -= 1
-                        # Check if preceded by { or ,
-                        if k >= 0 and result[k] in '{,':
-                            # This is a key without colon - insert colon
-                            if repair_log is not None:
-                                repair = create_repair(
-                                    kind=RepairKind.MISSING_COLON,
-                                    text=text,
-                                    position=i,
-                                    original="",
-                                    replacement=":",
-                                )
-                                repair_log.append(repair)
-                            result.append(':')
-                            # Add the whitespace between key and value
-                            while i < j:
-                                result.append(text[i])
-                                i += 1
-                        # Also check if preceded by a value (number, bool, null, closing bracket)
-                        # This handles {"a" 1 "b" 2} where "b" comes after the value 1
-                        elif k >= 0 and (result[k].isdigit() or result[k] in '}]"' or
-                                          ''.join(result[max(0,k-3):k+1]).endswith(('true', 'false', 'null'))):
-                            # Check if we're in an object context
-                            depth = 0
-                            in_obj = False
-                            for c in result:
-                                if c == '{':
-                                    depth += 1
-                                    in_obj = True
-                                elif c == '[':
-                                    depth += 1
-                                    in_obj = False
-                                elif c == '}':
-                                    depth -= 1
-                                elif c == ']':
-                                    depth -= 1
-                            if in_obj and depth > 0:
-                                # We're in an object and this key follows a value
-                                if repair_log is not None:
-                                    repair = create_repair(
-                                        kind=RepairKind.MISSING_COLON,
-                                        text=text,
-                                        position=i,
-                                        original="",
-                                        replacement=":",
-                                    )
-                                    repair_log.append(repair)
-                                result.append(':')
-                                while i < j:
-                                    result.append(text[i])
-                                    i += 1
-                continue
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.MISSING_COLON,
+                lines=lines,
+                position=i,
+                original="",
+                replacement=":",
+            )
+            repair_log.append(repair)
+        result.append(text[copied:i])
+        result.append(':')
+        copied = inserted = i
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def fix_missing_commas(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Insert missing commas between elements in arrays and objects.
 
@@ -972,167 +1001,91 @@ def fix_missing_commas(
     if not text:
         return text
 
-    result: list[str] = []
+    pieces: list[str] = []
+    copied = 0  # text[:copied] is already in pieces
     i = 0
-    in_string = False
-    escape_next = False
+    length = len(text)
     # Track what we just saw (to know when comma is needed)
     just_saw_value = False
-    brace_stack: list[str] = []  # Track [ and { nesting
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+    depth = 0  # [ and { nesting
+    lines = LineIndex(text)
+
+    while i < length:
+        # Skip whatever cannot change the state, such as whitespace
+        neutral = _COMMA_NEUTRAL_RUN_RE.match(text, i)
+        if neutral is not None:
+            i = neutral.end()
             continue
 
-        if char == '\\' and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
-
-        # Track string boundaries
-        if char == '"' and not in_string:
-            # Check if we need to insert comma before this string
-            if just_saw_value and brace_stack:
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.MISSING_COMMA,
-                        text=text,
-                        position=i,
-                        original="",
-                        replacement=",",
-                    )
-                    repair_log.append(repair)
-                result.append(',')
-                result.append(' ')
-
-            in_string = True
-            result.append(char)
-            i += 1
-            just_saw_value = False
-            continue
-        elif char == '"' and in_string:
-            in_string = False
-            result.append(char)
-            i += 1
-            just_saw_value = True
-            continue
-
-        if in_string:
-            result.append(char)
-            i += 1
-            continue
-
-        # Handle structure characters
-        if char in '{[':
-            if just_saw_value and brace_stack:
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.MISSING_COMMA,
-                        text=text,
-                        position=i,
-                        original="",
-                        replacement=",",
-                    )
-                    repair_log.append(repair)
-                result.append(',')
-                result.append(' ')
-
-            brace_stack.append(char)
-            result.append(char)
-            i += 1
-            just_saw_value = False
-            continue
+        char = text[i]
 
         if char in '}]':
-            if brace_stack:
-                brace_stack.pop()
-            result.append(char)
+            if depth:
+                depth -= 1
             i += 1
             just_saw_value = True
             continue
 
-        if char == ',':
-            result.append(char)
-            i += 1
-            just_saw_value = False
-            continue
-
-        if char == ':':
-            result.append(char)
+        if char in ',:':
             i += 1
             just_saw_value = False
             continue
 
-        # Whitespace
-        if char in ' \t\n\r':
-            result.append(char)
-            i += 1
-            continue
-
-        # Numbers, booleans, null
-        if char.isdigit() or char == '-':
-            # Check if we need comma before this number
-            if just_saw_value and brace_stack:
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.MISSING_COMMA,
-                        text=text,
-                        position=i,
-                        original="",
-                        replacement=",",
-                    )
-                    repair_log.append(repair)
-                result.append(',')
-                result.append(' ')
-
-            # Parse the number
-            j = i
-            if text[j] == '-':
-                j += 1
-            while j < len(text) and (text[j].isdigit() or text[j] in '.eE+-'):
-                j += 1
-            result.append(text[i:j])
-            i = j
-            just_saw_value = True
-            continue
+        # Find the end of the value that starts here
+        if char == '"':
+            body = _STRING_BODY_RE.match(text, i + 1)
+            assert body is not None  # The pattern can match empty
+            end = body.end() + 1
+        elif char in '{[':
+            end = i + 1
+        elif char.isdigit() or char == '-':
+            end = i + 1
+            while end < length and (text[end].isdigit() or text[end] in '.eE+-'):
+                end += 1
+        else:
+            # true, false, null
+            for literal in ('true', 'false', 'null'):
+                if text.startswith(literal, i):
+                    end = i + len(literal)
+                    break
+            else:
+                i += 1
+                continue
 
-        # true, false, null
-        for literal in ('true', 'false', 'null'):
-            if text[i:].startswith(literal):
-                if just_saw_value and brace_stack:
-                    if repair_log is not None:
-                        repair = create_repair(
-                            kind=RepairKind.MISSING_COMMA,
-                            text=text,
-                            position=i,
-                            original="",
-                            replacement=",",
-                        )
-                        repair_log.append(repair)
-                    result.append(',')
-                    result.append(' ')
+        # Insert a comma if a value directly follows another one
+        if just_saw_value and depth:
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.MISSING_COMMA,
+                    lines=lines,
+                    position=i,
+                    original="",
+                    replacement=",",
+                )
+                repair_log.append(repair)
+            pieces.append(text[copied:i])
+            pieces.append(', ')
+            copied = i
 
-                result.append(literal)
-                i += len(literal)
-                just_saw_value = True
-                break
+        if char in '{[':
+            depth += 1
+            just_saw_value = False
+        elif end > length or (char == '"' and text[end - 1] != '"'):
+            # An unterminated string runs to the end of the text
+            break
         else:
-            result.append(char)
-            i += 1
+            just_saw_value = True
+        i = end
 
-    return "".join(result)
+    if not pieces:
+        return text
+    pieces.append(text[copied:])
+    return "".join(pieces)
 
 
 def escape_control_characters(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Escape control characters in strings.
 
@@ -1152,88 +1105,64 @@ def escape_control_characters(
     Returns:
         Text with control characters escaped
     """
-    if not text:
+    # Strings are only walked up to the last control character, found with
+    # one memrchr-backed str.rfind per character
+    last_control = max(map(text.rfind, _CONTROL_CHARACTERS))
+    if last_control == -1:
         return text
 
-    # Mapping of control characters to their escape sequences
-    CONTROL_CHAR_ESCAPES = {
-        '\t': '\\t',   # Tab
-        '\r': '\\r',   # Carriage return (also handled by newline escaper)
-        '\f': '\\f',   # Form feed
-        '\b': '\\b',   # Backspace
-    }
-
     result: list[str] = []
+    length = len(text)
+    copied = 0  # text[:copied] is already in result
     i = 0
-    in_string = False
-    escape_next = False
+    lines = LineIndex(text)
 
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
-
-        if char == '\\' and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
-
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
-            continue
-
-        # Handle control characters inside strings
-        if in_string:
-            if char in CONTROL_CHAR_ESCAPES:
-                escape_seq = CONTROL_CHAR_ESCAPES[char]
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.CONTROL_CHARACTER,
-                        text=text,
-                        position=i,
-                        original=char,
-                        replacement=escape_seq,
-                    )
-                    repair_log.append(repair)
-                result.append(escape_seq)
-                i += 1
-                continue
+    while True:
+        # Outside strings: control characters there are left alone
+        i = text.find('"', i) + 1
+        if not i or i > last_control:
+            break
 
-            # Handle other control characters (0x00-0x1F except newline)
-            if ord(char) < 0x20 and char not in '\n\r':
-                # Remove or escape as \uXXXX
-                escape_seq = f'\\u{ord(char):04x}'
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.CONTROL_CHARACTER,
-                        text=text,
-                        position=i,
-                        original=char,
-                        replacement=escape_seq,
-                    )
-                    repair_log.append(repair)
-                result.append(escape_seq)
-                i += 1
-                continue
+        # Inside a string: stop at its closing quote or a control character
+        while True:
+            body = _STRING_BODY_TO_CONTROL_RE.match(text, i)
+            assert body is not None  # The pattern can match empty
+            i = body.end()
+            if i >= length or text[i] == '"' or text[i] == '\\':
+                break
 
-        result.append(char)
+            # Tab, carriage return, form feed and backspace have short
+            # escapes; other control characters become \uXXXX
+            char = text[i]
+            escape_seq = _CONTROL_CHAR_ESCAPES.get(char) or f'\\u{ord(char):04x}'
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.CONTROL_CHARACTER,
+                    lines=lines,
+                    position=i,
+                    original=char,
+                    replacement=escape_seq,
+                )
+                repair_log.append(repair)
+            result.append(text[copied:i])
+            result.append(escape_seq)
+            copied = i = i + 1
+        # An unterminated string, or one that a backslash ends, runs to the
+        # end of the text
+        if i >= length or text[i] == '\\':
+            break
         i += 1
 
+    if not result:
+        return text
+
+    result.append(text[copied:])
     return "".join(result)
 
 
 def fix_unescaped_backslash(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Fix unescaped backslashes in strings.
 
@@ -1248,143 +1177,88 @@ def fix_unescaped_backslash(
     Returns:
         Text with unescaped backslashes fixed
     """
-    if not text:
+    if '\\' not in text:
         return text
 
+    length = len(text)
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
-
-        # Track string boundaries
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            result.append(char)
-            i += 1
-            continue
+    copied = 0
+    lines = LineIndex(text)
+    # Jump from one opening quote to the next; backslashes outside strings
+    # are left alone
+    quote = text.find('"')
+    while quote != -1:
+        i = quote + 1
+        while True:
+            match = _STRING_PLAIN_RUN_RE.match(text, i)
+            assert match is not None  # The pattern can match empty
+            i = match.end()
+            if i >= length:
+                # Unclosed string runs to the end of the text
+                quote = -1
+                break
+            if text[i] == '"':
+                quote = text.find('"', i + 1)
+                break
 
-        if in_string:
-            if escape_next:
-                # We're after a backslash - the next char is being escaped
-                # This is intentional escape sequence (\\, \", etc.) - keep as is
-                escape_next = False
-                result.append(char)
-                i += 1
-                continue
+            # text[i] is a backslash; check what follows
+            if i + 1 < length:
+                next_char = text[i + 1]
 
-            if char == '\\':
-                # Check what follows
-                if i + 1 < len(text):
-                    next_char = text[i + 1]
-
-                    # Valid JSON escape sequences that should be preserved:
-                    # \\, \", \/, \b, \f, \n, \r, \t, \uXXXX
-                    if next_char == '\\':
-                        # Already escaped backslash (\\) - keep as is
-                        result.append(char)
-                        escape_next = True
-                        i += 1
-                        continue
-                    elif next_char == '"':
-                        # Escaped quote (\") - keep as is
-                        result.append(char)
-                        escape_next = True
-                        i += 1
+                # Valid JSON escape sequences that should be preserved:
+                # \\, \", \/, \b, \f, \n, \r, \t, \uXXXX
+                if next_char == '\\' or next_char == '"':
+                    # Already escaped backslash or quote - keep as is
+                    i += 2
+                    continue
+                if next_char in 'bfnrt/':
+                    # Valid JSON escape sequence, unless the string looks like
+                    # a Windows path (X:\...): then escape all backslashes.
+                    # The path check looks at what follows the last quote
+                    string_content_start = text.rfind('"', 0, i) + 1
+                    if not (
+                        i - string_content_start >= 2
+                        and text[string_content_start].isalpha()
+                        and text[string_content_start + 1] == ':'
+                    ):
+                        i += 2
                         continue
-                    elif next_char in 'bfnrt/':
-                        # Valid JSON escape sequences - but check for Windows path patterns
-                        # If the string looks like a Windows path (X:\...), escape all backslashes
-                        # Check: is this a Windows path pattern?
-                        # Look back from current position to see if we're in a path context
-                        is_windows_path = False
-                        # Find the start of the current string
-                        string_content_start = -1
-                        for back_idx in range(len(result) - 1, -1, -1):
-                            if result[back_idx] == '"':
-                                string_content_start = back_idx + 1
-                                break
-                        if string_content_start >= 0:
-                            # Get the string content so far
-                            string_so_far = ''.join(result[string_content_start:])
-                            # Check if it looks like start of Windows path: X:\ or X:/
-                            if len(string_so_far) >= 2:
-                                if (string_so_far[0].isalpha() and
-                                        string_so_far[1] == ':'):
-                                    is_windows_path = True
-
-                        if is_windows_path:
-                            # In Windows path context - escape the backslash
-                            if repair_log is not None:
-                                repair = create_repair(
-                                    kind=RepairKind.UNESCAPED_BACKSLASH,
-                                    text=text,
-                                    position=i,
-                                    original='\\',
-                                    replacement='\\\\',
-                                )
-                                repair_log.append(repair)
-                            result.append('\\\\')
-                            i += 1
-                            continue
-                        # Otherwise, keep as valid JSON escape
-                        result.append(char)
-                        escape_next = True
-                        i += 1
+                elif next_char == 'u' and i + 5 < length:
+                    # Check for valid unicode escape \uXXXX (4 hex digits)
+                    hex_chars = text[i + 2:i + 6]
+                    if all(c in '0123456789abcdefABCDEF' for c in hex_chars):
+                        i += 2
                         continue
-                    elif next_char == 'u':
-                        # Check for valid unicode escape \uXXXX (4 hex digits)
-                        if i + 5 < len(text):
-                            hex_chars = text[i + 2:i + 6]
-                            if all(c in '0123456789abcdefABCDEF' for c in hex_chars):
-                                # Valid unicode escape - keep as is
-                                result.append(char)
-                                escape_next = True
-                                i += 1
-                                continue
-                        # Invalid unicode escape (not followed by 4 hex digits)
-                        # Fall through to escape the backslash
-
-                    # Any other backslash sequence - escape the backslash
-                    # This handles Windows paths like \Users, \q, etc.
-                    if repair_log is not None:
-                        repair = create_repair(
-                            kind=RepairKind.UNESCAPED_BACKSLASH,
-                            text=text,
-                            position=i,
-                            original='\\',
-                            replacement='\\\\',
-                        )
-                        repair_log.append(repair)
-                    result.append('\\\\')
-                    i += 1
-                    continue
-                else:
-                    # Backslash at end - escape it
-                    if repair_log is not None:
-                        repair = create_repair(
-                            kind=RepairKind.UNESCAPED_BACKSLASH,
-                            text=text,
-                            position=i,
-                            original='\\',
-                            replacement='\\\\',
-                        )
-                        repair_log.append(repair)
-                    result.append('\\\\')
-                    i += 1
-                    continue
+                    # Invalid unicode escape (not followed by 4 hex digits)
+                    # Fall through to escape the backslash
 
-        result.append(char)
-        i += 1
+            # Any other backslash sequence, a backslash at the end, or a
+            # Windows path - escape the backslash. This handles Windows paths
+            # like \Users, \q, etc.
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.UNESCAPED_BACKSLASH,
+                    lines=lines,
+                    position=i,
+                    original='\\',
+                    replacement='\\\\',
+                )
+                repair_log.append(repair)
+            result.append(text[copied:i])
+            result.append('\\\\')
+            i += 1
+            copied = i
+
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def fix_unescaped_quotes(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Fix unescaped quotes inside JSON strings.
 
@@ -1404,316 +1278,252 @@ def fix_unescaped_quotes(
     if not text:
         return text
 
+    # Most text has no unescaped quotes. One regex pass skips the strings
+    # that close cleanly; the scan below starts at the first one that does
+    # not, if any, instead of weighing every closing quote in Python.
+    clean = _CLOSED_STRINGS_RE.match(text)
+    assert clean is not None  # The pattern can match empty
+    if clean.end() == len(text):
+        return text
+
     result: list[str] = []
-    i = 0
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
     in_string = False
-    string_start = -1
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            result.append(char)
-            escape_next = False
+    # The last '{' or '[' before the quote being looked at ('' if none),
+    # kept up to date as the scan advances instead of searching back
+    # through everything already seen
+    last_bracket = ''
+    bracket_scanned = 0
+    i = clean.end()
+    lines = LineIndex(text)
+
+    while True:
+        if not in_string:
+            # Only a quote starts a string; everything else is kept as is
+            i = text.find('"', i)
+            if i == -1:
+                break
+            in_string = True
             i += 1
             continue
 
-        if char == '\\':
-            result.append(char)
-            if in_string:
-                escape_next = True
-            i += 1
-            continue
+        # Step over the string body, including escape sequences, to the
+        # next quote. A backslash ending the text leaves no quote.
+        body = _STRING_BODY_RE.match(text, i)
+        assert body is not None  # The pattern can match empty
+        i = body.end()
+        if i >= length or text[i] != '"':
+            break
 
-        # Track string boundaries
-        if char == '"':
-            if not in_string:
-                # Starting a string
-                in_string = True
-                string_start = i
-                result.append(char)
-                i += 1
-                continue
-            else:
-                # We're in a string and found a quote
-                # Is this the end of the string, or an unescaped internal quote?
+        # We're in a string and found a quote
+        # Is this the end of the string, or an unescaped internal quote?
+        start = max(
+            text.rfind('{', bracket_scanned, i), text.rfind('[', bracket_scanned, i)
+        )
+        if start != -1:
+            last_bracket = text[start]
+        bracket_scanned = i
 
-                # Look ahead to determine context
-                j = i + 1
+        # Look ahead to determine context
+        j = i + 1
 
-                # Skip whitespace
-                while j < len(text) and text[j] in ' \t\n\r':
-                    j += 1
+        # Skip whitespace
+        while j < length and text[j] in ' \t\n\r':
+            j += 1
 
-                if j >= len(text):
-                    # End of input - this is the closing quote
-                    in_string = False
-                    result.append(char)
-                    i += 1
-                    continue
+        if j >= length:
+            # End of input - this is the closing quote
+            in_string = False
+            i += 1
+            continue
 
-                next_char = text[j]
+        next_char = text[j]
 
-                # Check if this looks like end of string
-                # End of string is followed by: ] } (array/object close)
-                if next_char in ']}':
-                    # This is the closing quote
-                    in_string = False
-                    result.append(char)
-                    i += 1
-                    continue
+        # Check if this looks like end of string
+        # End of string is followed by: ] } (array/object close)
+        if next_char in ']}':
+            # This is the closing quote
+            in_string = False
+            i += 1
+            continue
 
-                # For comma, need more context - could be end of value or internal quote
-                # Look further ahead to see if there's a valid JSON structure
-                if next_char == ',':
-                    # Look for pattern: ,"key": or ,number or ,true/false/null or ,"string" or ,[
-                    k = j + 1
-                    while k < len(text) and text[k] in ' \t\n\r':
-                        k += 1
-                    if k < len(text):
-                        after_comma = text[k]
-                        # If after comma we see start of key or value, this is closing quote
-                        if after_comma == '"':
-                            # Check if it's a key (has colon after) or value
-                            m = k + 1
-                            while m < len(text) and text[m] != '"' and text[m] != '\\':
-                                m += 1
-                            if m < len(text) and text[m] == '"':
-                                # Skip to after the closing quote
-                                m += 1
-                                while m < len(text) and text[m] in ' \t\n\r':
-                                    m += 1
-                                if m < len(text) and text[m] == ':':
-                                    # It's a key-value, so current quote closes string
-                                    in_string = False
-                                    result.append(char)
-                                    i += 1
-                                    continue
-                        elif after_comma in '{[' or after_comma.isdigit() or after_comma == '-':
-                            # Start of object, array, or number - closing quote
-                            in_string = False
-                            result.append(char)
-                            i += 1
-                            continue
-                        elif text[k:].startswith(('true', 'false', 'null')):
-                            # Boolean or null - closing quote
-                            in_string = False
-                            result.append(char)
-                            i += 1
-                            continue
-                    # Otherwise, might be internal quote - check if more text follows
-                    # that looks like sentence continuation
-                    # Look for more characters before the next quote
-                    temp_k = k
-                    text_chars = 0
-                    while temp_k < len(text) and text[temp_k] != '"':
-                        if text[temp_k].isalpha():
-                            text_chars += 1
-                        temp_k += 1
-                    if text_chars > 3:
-                        # There's meaningful text after comma - probably internal quote
-                        if repair_log is not None:
-                            repair = create_repair(
-                                kind=RepairKind.UNESCAPED_QUOTE,
-                                text=text,
-                                position=i,
-                                original='"',
-                                replacement='\\"',
-                            )
-                            repair_log.append(repair)
-                        result.append('\\')
-                        result.append('"')
-                        i += 1
-                        continue
-                    else:
-                        # Short or no text - probably closing quote
+        # For comma, need more context - could be end of value or internal quote
+        # Look further ahead to see if there's a valid JSON structure
+        if next_char == ',':
+            # Look for pattern: ,"key": or ,number or ,true/false/null or ,"string" or ,[
+            k = j + 1
+            while k < length and text[k] in ' \t\n\r':
+                k += 1
+            if k < length:
+                after_comma = text[k]
+                # If after comma we see start of key or value, this is closing quote
+                if after_comma == '"':
+                    # Check if it's a key (has colon after) or value
+                    if _SIMPLE_KEY_RE.match(text, k):
+                        # It's a key-value, so current quote closes string
                         in_string = False
-                        result.append(char)
                         i += 1
                         continue
-
-                # For colon, check if it's part of object key
-                if next_char == ':':
-                    # This is end of a key string
+                elif after_comma in '{[' or after_comma.isdigit() or after_comma == '-':
+                    # Start of object, array, or number - closing quote
                     in_string = False
-                    result.append(char)
                     i += 1
                     continue
-
-                # Check if followed by another quote (which would start a new key/value)
-                if next_char == '"':
-                    # Could be end of string followed by next string
-                    # Or unescaped quote
-                    # We need to scan past the next string to see what follows
-                    # j points to the opening quote of the potential next string
-                    k = j + 1
-                    # Scan past the next string content (handle escapes)
-                    while k < len(text):
-                        if text[k] == '\\' and k + 1 < len(text):
-                            k += 2  # Skip escape sequence
-                            continue
-                        if text[k] == '"':
-                            break  # Found closing quote
-                        k += 1
-                    # k now points to closing quote of next string (or end of text)
-                    if k < len(text) and text[k] == '"':
-                        # Found the closing quote - check what comes after
-                        # Special case: if k == j + 1, the "next string" is empty ("")
-                        # An empty string immediately following a value without comma
-                        # is likely unescaped empty quotes, not a separate value
-                        # e.g., '{"text": "The value is """}' - the "" should be in the string
-                        if k == j + 1:
-                            # Empty "next string" - treat as unescaped empty quotes
-                            # Fall through to escape the current quote
-                            pass
-                        else:
-                            m = k + 1
-                            while m < len(text) and text[m] in ' \t\n\r':
-                                m += 1
-                            if m < len(text) and text[m] == ':':
-                                # Next thing is a key, so current quote is closing
-                                in_string = False
-                                result.append(char)
-                                i += 1
-                                continue
-                            if m < len(text) and text[m] in '},]':
-                                # Next string is a value (end of object/array after it)
-                                in_string = False
-                                result.append(char)
-                                i += 1
-                                continue
-                            if m < len(text) and text[m] == ',':
-                                # Next string is followed by comma - could be value in array/object
-                                # Check if we're in an object context (key-value pattern)
-                                # Look back to see if there's a '{' before our string
-                                in_object = False
-                                for prev_char in reversed(result):
-                                    if prev_char == '{':
-                                        in_object = True
-                                        break
-                                    if prev_char == '[':
-                                        break
-                                if in_object:
-                                    # In object: "key" "value", - this is key-value with missing colon
-                                    in_string = False
-                                    result.append(char)
-                                    i += 1
-                                    continue
-                            # Check if next char is another quote (more strings in sequence)
-                            if m < len(text) and text[m] == '"':
-                                # Multiple strings in sequence - check array context
-                                in_array = False
-                                for prev_char in reversed(result):
-                                    if prev_char == '[':
-                                        in_array = True
-                                        break
-                                    if prev_char == '{':
-                                        break
-                                if in_array:
-                                    # In array: ["a" "b" "c"] - these are separate strings
-                                    in_string = False
-                                    result.append(char)
-                                    i += 1
-                                    continue
-
-                # Check if next char starts a non-string value (number, bool, null, {, [)
-                # In object/array context, this is likely a key-value or array element
-                is_value_start = (
-                    next_char.isdigit() or
-                    next_char == '-' or
-                    next_char in '{[' or
-                    text[j:].startswith(('true', 'false', 'null'))
-                )
-                if is_value_start:
-                    # Special case: if it's a number followed by quote (like "2.0"),
-                    # it might be a quoted phrase inside the string, not a separate value
-                    # Check for pattern: "number" (number followed by closing quote)
-                    if next_char.isdigit() or next_char == '-':
-                        # Scan past the number
-                        num_end = j
-                        while num_end < len(text) and (text[num_end].isdigit() or
-                                                        text[num_end] in '.-+eE'):
-                            num_end += 1
-                        # Check if number is immediately followed by a quote
-                        if num_end < len(text) and text[num_end] == '"':
-                            # Pattern like "2.0" - this is likely a quoted phrase
-                            # Check what's after the closing quote
-                            after_quote = num_end + 1
-                            while after_quote < len(text) and text[after_quote] in ' \t':
-                                after_quote += 1
-                            # If followed by more text (not }, ], or ,), it's quoted phrase
-                            if after_quote < len(text) and text[after_quote].isalnum():
-                                # "number" followed by text - this is unescaped quote
-                                # Fall through to escape
-                                pass
-                            else:
-                                # Could be a quoted phrase at end, still escape
-                                pass
-                        else:
-                            # Number not followed by quote - might be separate value
-                            # Look back to see if we're in an object or array context
-                            in_object = False
-                            in_array = False
-                            for prev_char in reversed(result):
-                                if prev_char == '{':
-                                    in_object = True
-                                    break
-                                if prev_char == '[':
-                                    in_array = True
-                                    break
-                            if in_object or in_array:
-                                # This is a key-value pair or array element with missing separator
-                                in_string = False
-                                result.append(char)
-                                i += 1
-                                continue
-                    else:
-                        # Not a number - check object/array context
-                        in_object = False
-                        in_array = False
-                        for prev_char in reversed(result):
-                            if prev_char == '{':
-                                in_object = True
-                                break
-                            if prev_char == '[':
-                                in_array = True
-                                break
-                        if in_object or in_array:
-                            # This is a key-value pair or array element with missing separator
-                            in_string = False
-                            result.append(char)
-                            i += 1
-                            continue
-
-                # Check if this is an unescaped internal quote
-                # Look ahead for a pattern like: "word" followed by more text then "
-                # This is an unescaped quote - escape it
+                elif text.startswith(('true', 'false', 'null'), k):
+                    # Boolean or null - closing quote
+                    in_string = False
+                    i += 1
+                    continue
+            # Otherwise, might be internal quote - check if more text follows
+            # that looks like sentence continuation
+            # Look for more characters before the next quote
+            next_quote = text.find('"', k)
+            if next_quote == -1:
+                next_quote = length
+            text_chars = 0
+            for m in range(k, next_quote):
+                if text[m].isalpha():
+                    text_chars += 1
+                    if text_chars > 3:
+                        break
+            if text_chars > 3:
+                # There's meaningful text after comma - probably internal quote
                 if repair_log is not None:
                     repair = create_repair(
                         kind=RepairKind.UNESCAPED_QUOTE,
-                        text=text,
+                        lines=lines,
                         position=i,
                         original='"',
                         replacement='\\"',
                     )
                     repair_log.append(repair)
-
-                result.append('\\')
-                result.append('"')
+                result.append(text[copied:i])
+                result.append('\\"')
+                i += 1
+                copied = i
+                continue
+            else:
+                # Short or no text - probably closing quote
+                in_string = False
                 i += 1
                 continue
 
-        result.append(char)
+        # For colon, check if it's part of object key
+        if next_char == ':':
+            # This is end of a key string
+            in_string = False
+            i += 1
+            continue
+
+        # Check if followed by another quote (which would start a new key/value)
+        if next_char == '"':
+            # Could be end of string followed by next string
+            # Or unescaped quote
+            # We need to scan past the next string to see what follows
+            # j points to the opening quote of the potential next string
+            next_body = _STRING_BODY_RE.match(text, j + 1)
+            assert next_body is not None  # The pattern can match empty
+            k = next_body.end()
+            # k now points to closing quote of next string (or end of text)
+            if k < length and text[k] == '"':
+                # Found the closing quote - check what comes after
+                # Special case: if k == j + 1, the "next string" is empty ("")
+                # An empty string immediately following a value without comma
+                # is likely unescaped empty quotes, not a separate value
+                # e.g., '{"text": "The value is """}' - the "" should be in the string
+                if k == j + 1:
+                    # Empty "next string" - treat as unescaped empty quotes
+                    # Fall through to escape the current quote
+                    pass
+                else:
+                    m = k + 1
+                    while m < length and text[m] in ' \t\n\r':
+                        m += 1
+                    if m < length and text[m] == ':':
+                        # Next thing is a key, so current quote is closing
+                        in_string = False
+                        i += 1
+                        continue
+                    if m < length and text[m] in '},]':
+                        # Next string is a value (end of object/array after it)
+                        in_string = False
+                        i += 1
+                        continue
+                    # Next string is followed by comma - could be value in array/object
+                    # Check if we're in an object context (key-value pattern)
+                    if m < length and text[m] == ',' and last_bracket == '{':
+                        # In object: "key" "value", - this is key-value with missing colon
+                        in_string = False
+                        i += 1
+                        continue
+                    # Check if next char is another quote (more strings in sequence)
+                    # Multiple strings in sequence - check array context
+                    if m < length and text[m] == '"' and last_bracket == '[':
+                        # In array: ["a" "b" "c"] - these are separate strings
+                        in_string = False
+                        i += 1
+                        continue
+
+        # Check if next char starts a non-string value (number, bool, null, {, [)
+        # In object/array context, this is likely a key-value or array element
+        is_value_start = (
+            next_char.isdigit() or
+            next_char == '-' or
+            next_char in '{[' or
+            text.startswith(('true', 'false', 'null'), j)
+        )
+        if is_value_start:
+            # Special case: if it's a number followed by quote (like "2.0"),
+            # it might be a quoted phrase inside the string, not a separate value
+            # Check for pattern: "number" (number followed by closing quote)
+            if next_char.isdigit() or next_char == '-':
+                # Scan past the number
+                num_end = j
+                while num_end < length and (text[num_end].isdigit() or
+                                            text[num_end] in '.-+eE'):
+                    num_end += 1
+                # A number immediately followed by a quote, like "2.0", is
+                # a quoted phrase: fall through to escape. Otherwise it
+                # might be a separate value; check object/array context.
+                if (num_end >= length or text[num_end] != '"') and last_bracket:
+                    # This is a key-value pair or array element with missing separator
+                    in_string = False
+                    i += 1
+                    continue
+            else:
+                # Not a number - check object/array context
+                if last_bracket:
+                    # This is a key-value pair or array element with missing separator
+                    in_string = False
+                    i += 1
+                    continue
+
+        # Check if this is an unescaped internal quote
+        # Look ahead for a pattern like: "word" followed by more text then "
+        # This is an unescaped quote - escape it
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.UNESCAPED_QUOTE,
+                lines=lines,
+                position=i,
+                original='"',
+                replacement='\\"',
+            )
+            repair_log.append(repair)
+
+        result.append(text[copied:i])
+        result.append('\\"')
         i += 1
+        copied = i
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def remove_double_commas(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Remove double/empty commas from JSON.
 
@@ -1730,84 +1540,44 @@ def remove_double_commas(
     Returns:
         Text with double commas removed
     """
-    if not text:
+    # Most documents have no doubled comma anywhere, strings included
+    if _DOUBLE_COMMA_RE.search(text) is None:
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences in strings
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
-
-        if char == '\\' and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    lines = LineIndex(text)
+
+    # Only commas that directly follow an opening bracket or another
+    # comma, whitespace aside, are matched. After a run of commas each
+    # one matches in turn, so ",,," drops the last two.
+    for match in _DOUBLE_COMMA_OR_STRING_RE.finditer(text):
+        if match.group()[0] == '"':
             continue
+        i = match.start(1)
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
-            continue
-
-        # Handle commas outside of strings
-        if char == ',' and not in_string:
-            # Check if this is a leading comma after { or [
-            # Look back through result to find last non-whitespace
-            last_structural = None
-            for prev_char in reversed(result):
-                if prev_char not in ' \t\n\r':
-                    last_structural = prev_char
-                    break
-
-            if last_structural is not None and last_structural in '{[':
-                # Leading comma - skip it
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.DOUBLE_COMMA,
-                        text=text,
-                        position=i,
-                        original=',',
-                        replacement='',
-                    )
-                    repair_log.append(repair)
-                i += 1
-                continue
-
-            if last_structural == ',':
-                # Double comma - skip this one
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.DOUBLE_COMMA,
-                        text=text,
-                        position=i,
-                        original=',',
-                        replacement='',
-                    )
-                    repair_log.append(repair)
-                i += 1
-                continue
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.DOUBLE_COMMA,
+                lines=lines,
+                position=i,
+                original=",",
+                replacement="",
+            )
+            repair_log.append(repair)
+        result.append(text[copied:i])
+        copied = i + 1
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def convert_javascript_values(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Convert JavaScript values to JSON equivalents.
 
@@ -1825,101 +1595,55 @@ def convert_javascript_values(
     Returns:
         Text with JavaScript values converted to null
     """
-    if not text:
+    # Substring checks are far cheaper than walking every string literal
+    # with the regex, and most documents contain none of these words
+    if "NaN" not in text and "Infinity" not in text and "undefined" not in text:
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
-
-    # JavaScript values to convert (case-sensitive)
-    js_values = {
-        'NaN': 'null',
-        'Infinity': 'null',
-        'undefined': 'null',
-    }
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences in strings
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
-
-        if char == '\\' and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    lines = LineIndex(text)
+
+    # Matches never overlap: a word starting inside a rejected match would
+    # follow a letter and be rejected as well, so finditer sees every value
+    for match in _JAVASCRIPT_VALUE_OR_STRING_RE.finditer(text):
+        original = match.group()
+        if original[0] == '"':
             continue
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
+        # Verify it's not part of another word. A signed Infinity is only
+        # checked at its end.
+        i = match.start()
+        end_pos = match.end()
+        start_ok = original[0] in "-+" or i == 0 or not text[i - 1].isalnum()
+        end_ok = end_pos >= length or not text[end_pos].isalnum()
+        if not (start_ok and end_ok):
             continue
 
-        # Check for JavaScript values outside strings
-        if not in_string:
-            # Check for -Infinity or +Infinity
-            if char in '-+' and text[i:].startswith(f'{char}Infinity'):
-                # Verify it's not part of another word
-                end_pos = i + len(char) + len('Infinity')
-                if end_pos >= len(text) or not text[end_pos].isalnum():
-                    original = f'{char}Infinity'
-                    if repair_log is not None:
-                        repair = create_repair(
-                            kind=RepairKind.JAVASCRIPT_VALUE,
-                            text=text,
-                            position=i,
-                            original=original,
-                            replacement='null',
-                        )
-                        repair_log.append(repair)
-                    result.append('null')
-                    i += len(original)
-                    continue
-
-            # Check for other JS values
-            for js_val, replacement in js_values.items():
-                if text[i:].startswith(js_val):
-                    # Verify it's not part of another word
-                    end_pos = i + len(js_val)
-                    start_ok = (i == 0 or not text[i - 1].isalnum())
-                    end_ok = (end_pos >= len(text) or not text[end_pos].isalnum())
-                    if start_ok and end_ok:
-                        if repair_log is not None:
-                            repair = create_repair(
-                                kind=RepairKind.JAVASCRIPT_VALUE,
-                                text=text,
-                                position=i,
-                                original=js_val,
-                                replacement=replacement,
-                            )
-                            repair_log.append(repair)
-                        result.append(replacement)
-                        i += len(js_val)
-                        break
-            else:
-                # No match - append character
-                result.append(char)
-                i += 1
-                continue
-            continue
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.JAVASCRIPT_VALUE,
+                lines=lines,
+                position=i,
+                original=original,
+                replacement="null",
+            )
+            repair_log.append(repair)
+        result.append(text[copied:i])
+        result.append("null")
+        copied = end_pos
 
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
 
 
 def convert_number_formats(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Convert non-decimal number formats to decimal.
 
@@ -1935,139 +1659,41 @@ def convert_number_formats(
     Returns:
         Text with numbers converted to decimal
     """
-    if not text:
+    if _NUMBER_PREFIX_RE.search(text) is None:
         return text
 
     result: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
+    copied = 0  # text[copied:i] is kept but not yet appended to result
+    lines = LineIndex(text)
 
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences in strings
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+    for match in _NUMBER_FORMAT_OR_STRING_RE.finditer(text):
+        original = match.group()
+        if original[0] == '"':
             continue
 
-        if char == '\\' and in_string:
-            result.append(char)
-            escape_next = True
-            i += 1
-            continue
-
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
+        # Base 0 picks the base from the prefix and handles the sign. A
+        # digit run that does not fit the base (0b12, 0o8) is left alone
+        # rather than split into a number and leftover digits.
+        try:
+            replacement = str(int(original, 0))
+        except ValueError:
             continue
+        i = match.start()
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.NUMBER_FORMAT,
+                lines=lines,
+                position=i,
+                original=original,
+                replacement=replacement,
+            )
+            repair_log.append(repair)
+        result.append(text[copied:i])
+        result.append(replacement)
+        copied = match.end()
 
-        # Check for number formats outside strings
-        if not in_string:
-            # Check for negative numbers
-            negative = False
-            start_i = i
-            if char == '-' and i + 1 < len(text) and text[i + 1] == '0':
-                negative = True
-                i += 1
-                char = text[i]
-
-            if char == '0' and i + 1 < len(text):
-                next_char = text[i + 1].lower()
-
-                # Hexadecimal: 0x or 0X
-                if next_char == 'x':
-                    j = i + 2
-                    while j < len(text) and text[j] in '0123456789abcdefABCDEF':
-                        j += 1
-                    if j > i + 2:  # Found at least one hex digit
-                        hex_str = text[i:j]
-                        try:
-                            value = int(hex_str, 16)
-                            if negative:
-                                value = -value
-                            original = text[start_i:j]
-                            replacement = str(value)
-                            if repair_log is not None:
-                                repair = create_repair(
-                                    kind=RepairKind.NUMBER_FORMAT,
-                                    text=text,
-                                    position=start_i,
-                                    original=original,
-                                    replacement=replacement,
-                                )
-                                repair_log.append(repair)
-                            result.append(replacement)
-                            i = j
-                            continue
-                        except ValueError:
-                            pass
-
-                # Octal: 0o or 0O
-                elif next_char == 'o':
-                    j = i + 2
-                    while j < len(text) and text[j] in '01234567':
-                        j += 1
-                    if j > i + 2:  # Found at least one octal digit
-                        oct_str = text[i:j]
-                        try:
-                            value = int(oct_str, 8)
-                            if negative:
-                                value = -value
-                            original = text[start_i:j]
-                            replacement = str(value)
-                            if repair_log is not None:
-                                repair = create_repair(
-                                    kind=RepairKind.NUMBER_FORMAT,
-                                    text=text,
-                                    position=start_i,
-                                    original=original,
-                                    replacement=replacement,
-                                )
-                                repair_log.append(repair)
-                            result.append(replacement)
-                            i = j
-                            continue
-                        except ValueError:
-                            pass
-
-                # Binary: 0b or 0B
-                elif next_char == 'b':
-                    j = i + 2
-                    while j < len(text) and text[j] in '01':
-                        j += 1
-                    if j > i + 2:  # Found at least one binary digit
-                        bin_str = text[i:j]
-                        try:
-                            value = int(bin_str, 2)
-                            if negative:
-                                value = -value
-                            original = text[start_i:j]
-                            replacement = str(value)
-                            if repair_log is not None:
-                                repair = create_repair(
-                                    kind=RepairKind.NUMBER_FORMAT,
-                                    text=text,
-                                    position=start_i,
-                                    original=original,
-                                    replacement=replacement,
-                                )
-                                repair_log.append(repair)
-                            result.append(replacement)
-                            i = j
-                            continue
-                        except ValueError:
-                            pass
-
-            # If we moved i for negative but didn't convert, reset
-            if negative:
-                result.append('-')
-
-        result.append(char)
-        i += 1
+    if not result:
+        return text
 
+    result.append(text[copied:])
     return "".join(result)
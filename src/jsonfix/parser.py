@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import threading
 import warnings
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
+from types import MappingProxyType
 from typing import IO, Any, Literal
 
+# Passes that share a name with a loads_relaxed option are imported under
+# an alias, at module level so that each call does not repeat the import
 from .normalizers import (
+    auto_close_brackets as _auto_close_brackets,
+    convert_javascript_values as _convert_js_values,
+    convert_number_formats as _convert_number_formats,
+    convert_python_literals as _convert_python_literals,
     convert_single_quote_strings,
     escape_control_characters,
     escape_newlines_in_strings,
@@ -15,10 +26,31 @@ from .normalizers import (
     fix_missing_colons,
     fix_missing_commas,
     fix_unescaped_backslash as _fix_unescaped_backslash,
+    fix_unescaped_quotes as _fix_unescaped_quotes,
+    has_smart_quotes,
+    normalize_quotes as _normalize_quotes,
     quote_unquoted_keys,
+    remove_double_commas as _remove_double_commas,
     remove_ellipsis_markers,
+    remove_markdown_fences as _remove_markdown_fences,
+    skip_string,
 )
-from .repairs import Repair, RepairKind, create_repair
+from .repairs import LineIndex, Repair, RepairKind, RepairLog, create_repair
+
+
+# Standard JSON that can skip the repair pipeline starts with an object or
+# array. A string that opens with a drive letter is rewritten by the
+# Windows path heuristic even when it is already valid.
+_CONTAINER_START_RE = re.compile(r"\s*[{\[]")
+_DRIVE_LETTER_RE = re.compile(r'"\w:')
+
+# Streaming: the rest of a string body, with its closing quote if present,
+# and the characters that change bracket depth or enter a string
+_STRING_TAIL_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*("?)', re.DOTALL)
+_BRACKET_OR_QUOTE_RE = re.compile(r'[{}\[\]"]')
+
+# A comma that only whitespace separates from a closing bracket
+_TRAILING_COMMA_RE = re.compile(r",[ \t\n\r]*[\]}]")
 
 
 class RelaxedJSONError(ValueError):
@@ -29,7 +61,7 @@ class RelaxedJSONError(ValueError):
 
 def _strip_comments(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Strip comments from JSON text.
 
@@ -48,127 +80,135 @@ def _strip_comments(
         JSON text with comments removed
     """
     result: list[str] = []
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
     i = 0
-    in_string = False
-    escape_next = False
 
-    while i < len(text):
+    # Positions of the next quote and comment trigger characters. They are
+    # refreshed with str.find (memchr-backed in CPython) only once the scan
+    # has moved past them, so plain content is never visited per character.
+    next_quote = next_slash = next_hash = -1
+    lines = LineIndex(text)
+
+    while True:
+        if next_quote < i:
+            next_quote = text.find('"', i)
+            if next_quote == -1:
+                next_quote = length
+        if next_slash < i:
+            next_slash = text.find("/", i)
+            if next_slash == -1:
+                next_slash = length
+        if next_hash < i:
+            next_hash = text.find("#", i)
+            if next_hash == -1:
+                next_hash = length
+
+        # Past the last slash and hash no comment can start, so the strings
+        # that remain need not be walked
+        i = min(next_slash, next_hash)
+        if i >= length:
+            break
+        if next_quote < i:
+            i = next_quote
+
         char = text[i]
 
-        # Handle escape sequences in strings
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+        # Skip over strings - comments inside JSON strings are preserved
+        if char == '"':
+            i = skip_string(text, i)
             continue
 
-        # Track string boundaries
-        if char == '"' and not in_string:
-            in_string = True
-            result.append(char)
-            i += 1
-            continue
-        elif char == '"' and in_string:
-            in_string = False
-            result.append(char)
-            i += 1
-            continue
-        elif char == "\\" and in_string:
-            escape_next = True
-            result.append(char)
-            i += 1
-            continue
+        following = text[i + 1 : i + 2]
 
-        # Only process comments outside strings
-        if not in_string:
-            # Single-line comment: //
-            if char == "/" and i + 1 < len(text) and text[i + 1] == "/":
-                # Check if this is a URL protocol (e.g., https://)
-                # URL protocols have : immediately before //
-                if i > 0 and text[i - 1] == ":":
-                    # This is likely a URL, not a comment
-                    result.append(char)
-                    i += 1
-                    continue
-
-                # Find end of line
-                end = text.find("\n", i)
-                if end == -1:
-                    end = len(text)
-                else:
-                    end += 1  # Include the newline in the comment
-
-                comment = text[i:end]
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.SINGLE_LINE_COMMENT,
-                        text=text,
-                        position=i,
-                        original=comment.rstrip("\n"),
-                    )
-                    repair_log.append(repair)
-
-                # Replace comment with whitespace to preserve positions
-                # (but we'll just skip it for now)
-                i = end
+        # Single-line comment: //
+        if char == "/" and following == "/":
+            # Check if this is a URL protocol (e.g., https://)
+            # URL protocols have : immediately before //
+            if i > 0 and text[i - 1] == ":":
+                # This is likely a URL, not a comment
+                i += 1
                 continue
 
-            # Hash comment: #
-            if char == "#":
-                # Find end of line
-                end = text.find("\n", i)
-                if end == -1:
-                    end = len(text)
-                else:
-                    end += 1  # Include the newline
-
-                comment = text[i:end]
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.HASH_COMMENT,
-                        text=text,
-                        position=i,
-                        original=comment.rstrip("\n"),
-                    )
-                    repair_log.append(repair)
-
-                i = end
-                continue
+            # Find end of line
+            end = text.find("\n", i)
+            if end == -1:
+                end = length
+            else:
+                end += 1  # Include the newline in the comment
+
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.SINGLE_LINE_COMMENT,
+                    lines=lines,
+                    position=i,
+                    original=text[i:end].rstrip("\n"),
+                )
+                repair_log.append(repair)
 
-            # Multi-line comment: /* ... */
-            if char == "/" and i + 1 < len(text) and text[i + 1] == "*":
-                # Find closing */
-                end = text.find("*/", i + 2)
-                if end == -1:
-                    raise RelaxedJSONError(
-                        f"Unclosed multi-line comment at position {i}"
-                    )
-                end += 2  # Include the */
-
-                comment = text[i:end]
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.MULTI_LINE_COMMENT,
-                        text=text,
-                        position=i,
-                        original=comment,
-                    )
-                    repair_log.append(repair)
-
-                # Replace with single space to separate tokens
-                result.append(" ")
-                i = end
-                continue
+            result.append(text[copied:i])
+            copied = i = end
+            continue
+
+        # Hash comment: #
+        if char == "#":
+            # Find end of line
+            end = text.find("\n", i)
+            if end == -1:
+                end = length
+            else:
+                end += 1  # Include the newline
+
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.HASH_COMMENT,
+                    lines=lines,
+                    position=i,
+                    original=text[i:end].rstrip("\n"),
+                )
+                repair_log.append(repair)
+
+            result.append(text[copied:i])
+            copied = i = end
+            continue
+
+        # Multi-line comment: /* ... */
+        if char == "/" and following == "*":
+            # Find closing */
+            end = text.find("*/", i + 2)
+            if end == -1:
+                raise RelaxedJSONError(
+                    f"Unclosed multi-line comment at position {i}"
+                )
+            end += 2  # Include the */
+
+            if repair_log is not None:
+                repair = create_repair(
+                    kind=RepairKind.MULTI_LINE_COMMENT,
+                    lines=lines,
+                    position=i,
+                    original=text[i:end],
+                )
+                repair_log.append(repair)
+
+            # Replace with single space to separate tokens
+            result.append(text[copied:i])
+            result.append(" ")
+            copied = i = end
+            continue
 
-        result.append(char)
         i += 1
 
+    if not result:
+        return text
+
+    result.append(text[copied:])
     return "".join(result)
 
 
 def _remove_trailing_commas(
     text: str,
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
 ) -> str:
     """Remove trailing commas from JSON text.
 
@@ -183,155 +223,435 @@ def _remove_trailing_commas(
     Returns:
         JSON text with trailing commas removed
     """
-    # Pattern to match trailing comma before ] or }
-    # This needs to handle whitespace and newlines between comma and closing bracket
-    # We need to track string boundaries to avoid modifying commas in strings
-
+    # Only commas outside strings are candidates, so jump between quotes
+    # and commas that a closing bracket follows, rather than visiting
+    # every character
     result: list[str] = []
+    length = len(text)
+    copied = 0  # text[copied:i] is kept but not yet appended to result
     i = 0
-    in_string = False
-    escape_next = False
-
-    while i < len(text):
-        char = text[i]
-
-        # Handle escape sequences in strings
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
+    next_quote = next_comma = -1
+    lines = LineIndex(text)
+
+    while True:
+        if next_comma < i:
+            match = _TRAILING_COMMA_RE.search(text, i)
+            next_comma = length if match is None else match.start()
+        # Past the last candidate the strings that remain need not be walked
+        if next_comma >= length:
+            break
+        if next_quote < i:
+            next_quote = text.find('"', i)
+            if next_quote == -1:
+                next_quote = length
+
+        i = min(next_quote, next_comma)
+
+        if text[i] == '"':
+            i = skip_string(text, i)
             continue
 
-        # Track string boundaries
-        if char == '"' and not in_string:
-            in_string = True
-            result.append(char)
-            i += 1
-            continue
-        elif char == '"' and in_string:
-            in_string = False
-            result.append(char)
-            i += 1
-            continue
-        elif char == "\\" and in_string:
-            escape_next = True
-            result.append(char)
-            i += 1
-            continue
-
-        # Only process commas outside strings
-        if not in_string and char == ",":
-            # Look ahead: is this a trailing comma?
-            # Skip whitespace and check if next non-whitespace is ] or }
-            j = i + 1
-            while j < len(text) and text[j] in " \t\n\r":
-                j += 1
-
-            if j < len(text) and text[j] in "]}":
-                # This is a trailing comma - skip it
-                if repair_log is not None:
-                    repair = create_repair(
-                        kind=RepairKind.TRAILING_COMMA,
-                        text=text,
-                        position=i,
-                        original=",",
-                    )
-                    repair_log.append(repair)
-                i += 1
-                continue
-
-        result.append(char)
+        # This is a trailing comma - skip it
+        if repair_log is not None:
+            repair = create_repair(
+                kind=RepairKind.TRAILING_COMMA,
+                lines=lines,
+                position=i,
+                original=",",
+            )
+            repair_log.append(repair)
+        result.append(text[copied:i])
+        copied = i + 1
         i += 1
 
+    if not result:
+        return text
+
+    result.append(text[copied:])
     return "".join(result)
 
 
-def _auto_close_brackets(
-    text: str,
-    repair_log: list[Repair] | None = None,
-) -> str:
-    """Add missing closing brackets at end of input.
+def _is_repair_free_candidate(text: str) -> bool:
+    """Check whether valid JSON text would pass through every repair unchanged.
+
+    Valid JSON is normally left alone by the pipeline, with a few
+    exceptions: smart quotes are normalized even inside strings, strings
+    that look like Windows paths have their backslashes escaped, and a
+    top-level string containing a bracket is treated as text to extract
+    JSON from. NaN and Infinity are handled separately by rejecting them
+    while parsing.
 
-    Tracks bracket nesting and adds any missing closing brackets
-    at the end of the string.
+    Text that does not also end with a closing bracket, such as truncated
+    output or JSON followed by a comment, is rejected too: json.loads
+    would read nearly all of it before failing.
 
     Args:
-        text: JSON text possibly with missing closing brackets
-        repair_log: Optional list to append Repair objects to
+        text: The input text
 
     Returns:
-        JSON text with missing closing brackets added
+        True if parsing the text directly gives the same result as
+        repairing it first, provided json.loads accepts it
     """
-    if not text:
-        return text
+    if _CONTAINER_START_RE.match(text) is None:
+        return False
+    end = len(text)
+    while text[end - 1] in " \t\n\r":
+        end -= 1
+    if text[end - 1] not in "}]":
+        return False
+    if has_smart_quotes(text):
+        return False
+    return "\\" not in text or _DRIVE_LETTER_RE.search(text) is None
 
-    # Stack of opening brackets
-    bracket_stack: list[str] = []
-    i = 0
-    in_string = False
-    escape_next = False
 
-    while i < len(text):
-        char = text[i]
+def _report_repairs(
+    repairs: Sequence[Repair], on_repair: Literal["ignore", "warn", "error"]
+) -> None:
+    """Apply the on_repair policy to the repairs of one parse.
 
-        # Handle escape sequences
-        if escape_next:
-            escape_next = False
-            i += 1
-            continue
+    Warnings point at the caller of the public function that called this.
 
-        if char == "\\" and in_string:
-            escape_next = True
-            i += 1
-            continue
+    Raises:
+        ValueError: If on_repair="error"; the message names the first repair
+    """
+    if on_repair == "error":
+        repair = repairs[0]
+        raise ValueError(
+            f"Repair needed at line {repair.line}, column {repair.column}: "
+            f"{repair.message}"
+        )
+    elif on_repair == "warn":
+        for repair in repairs:
+            warnings.warn(
+                f"JSON repair at line {repair.line}: {repair.message}",
+                category=UserWarning,
+                stacklevel=3,
+            )
 
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            i += 1
-            continue
 
-        # Track brackets outside strings
-        if not in_string:
-            if char == "{":
-                bracket_stack.append("{")
-            elif char == "[":
-                bracket_stack.append("[")
-            elif char == "}":
-                if bracket_stack and bracket_stack[-1] == "{":
-                    bracket_stack.pop()
-            elif char == "]":
-                if bracket_stack and bracket_stack[-1] == "[":
-                    bracket_stack.pop()
+def _reject_constant(name: str) -> Any:
+    """parse_constant hook that refuses NaN and Infinity.
 
-        i += 1
+    The pipeline converts these JavaScript values to null, so input that
+    contains them must not take the direct json.loads path.
+    """
+    raise ValueError(f"JavaScript value {name} needs repair")
 
-    # Add missing closing brackets
-    if not bracket_stack:
-        return text
 
-    closing_brackets: list[str] = []
-    end_position = len(text)
+# Built once: json.loads with any keyword argument constructs a new
+# decoder on every call, which costs more than parsing a small document
+_STANDARD_JSON_DECODER = json.JSONDecoder(parse_constant=_reject_constant)
 
-    for bracket in reversed(bracket_stack):
-        if bracket == "{":
-            closing = "}"
+# Deep nesting: whitespace between tokens, and a decoder for the scalar
+# values between brackets, which raw_decode reads without recursing
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_SCALAR_DECODER = json.JSONDecoder()
+
+
+def _skip_json_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    match = _JSON_WHITESPACE_RE.match(text, pos)
+    assert match is not None  # The pattern can match empty
+    return match.end()
+
+
+def _read_key(text: str, pos: int) -> tuple[str, int]:
+    """Read an object key at pos and the colon after it.
+
+    Returns:
+        The key, and the position of the value that follows the colon
+    """
+    if not text.startswith('"', pos):
+        raise json.JSONDecodeError(
+            "Expecting property name enclosed in double quotes", text, pos
+        )
+    key, pos = _SCALAR_DECODER.raw_decode(text, pos)
+    pos = _skip_json_whitespace(text, pos)
+    if not text.startswith(":", pos):
+        raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+    return key, _skip_json_whitespace(text, pos + 1)
+
+
+def _decode_nested(text: str) -> Any:
+    """Decode standard JSON nested too deeply for json.loads.
+
+    json.loads recurses once per nesting level and raises RecursionError
+    past the interpreter's recursion limit. This decoder keeps the open
+    containers on an explicit stack instead, so depth is limited only by
+    memory. It accepts exactly what json.loads accepts and raises the
+    same JSONDecodeError messages.
+
+    Args:
+        text: Standard JSON text
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    # Open containers, innermost last, with the key each object is reading
+    stack: list[list[Any] | dict[str, Any]] = []
+    keys: list[str] = []
+    pos = _skip_json_whitespace(text, 0)
+
+    while True:
+        # Read a value, or open a container and read its first member
+        char = text[pos : pos + 1]
+        value: Any
+        if char == "{" or char == "[":
+            pos = _skip_json_whitespace(text, pos + 1)
+            if text.startswith("}" if char == "{" else "]", pos):
+                value = {} if char == "{" else []
+                pos += 1
+            elif char == "[":
+                stack.append([])
+                continue
+            else:
+                stack.append({})
+                key, pos = _read_key(text, pos)
+                keys.append(key)
+                continue
         else:
-            closing = "]"
+            value, pos = _SCALAR_DECODER.raw_decode(text, pos)
+
+        # Store the value, closing every container that ends after it
+        while True:
+            pos = _skip_json_whitespace(text, pos)
+            if not stack:
+                if pos != len(text):
+                    raise json.JSONDecodeError("Extra data", text, pos)
+                return value
+
+            container = stack[-1]
+            if isinstance(container, list):
+                container.append(value)
+                closing = "]"
+            else:
+                container[keys[-1]] = value
+                closing = "}"
+
+            char = text[pos : pos + 1]
+            if char == ",":
+                pos = _skip_json_whitespace(text, pos + 1)
+                if closing == "}":
+                    keys[-1], pos = _read_key(text, pos)
+                break
+            if char != closing:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos += 1
+            value = stack.pop()
+            if closing == "}":
+                keys.pop()
+
+
+def _freeze(value: Any) -> Any:
+    """Make a parsed value read-only.
+
+    Objects are wrapped in MappingProxyType and arrays become tuples. The
+    containers are collected first and frozen innermost first, so that
+    deeply nested documents do not run into the recursion limit. The dicts
+    come straight from json.loads, so their values are replaced in place.
 
-        closing_brackets.append(closing)
+    Args:
+        value: A value returned by json.loads
 
-        if repair_log is not None:
-            repair = create_repair(
-                kind=RepairKind.MISSING_BRACKET,
-                text=text,
-                position=end_position,
-                original="",
-                replacement=closing,
+    Returns:
+        The same value with every dict and list made read-only
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+
+    # Every container, each one before the containers inside it
+    containers: list[dict[str, Any] | list[Any]] = []
+    stack: list[Any] = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            containers.append(item)
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            containers.append(item)
+            stack.extend(item)
+
+    frozen: dict[int, Any] = {}
+    for container in reversed(containers):
+        if isinstance(container, dict):
+            for key, item in container.items():
+                if isinstance(item, (dict, list)):
+                    container[key] = frozen[id(item)]
+            frozen[id(container)] = MappingProxyType(container)
+        else:
+            frozen[id(container)] = tuple(
+                frozen[id(item)] if isinstance(item, (dict, list)) else item
+                for item in container
             )
-            repair_log.append(repair)
+    return frozen[id(value)]
+
+
+class _RepairCache:
+    """The repaired text of recent inputs, bounded by the characters it holds.
+
+    Entries are keyed on the input and the options. The least recently used
+    are evicted once there are more than max_entries, or the inputs and
+    repaired texts held add up to more than max_characters. Repairs are not
+    kept: a call that logs them runs the passes itself.
+    """
+
+    __slots__ = (
+        "_characters",
+        "_entries",
+        "_lock",
+        "_max_characters",
+        "_max_entries",
+    )
+
+    def __init__(self, max_entries: int, max_characters: int) -> None:
+        self._entries: OrderedDict[tuple[str, tuple[bool, ...]], str] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._max_characters = max_characters
+        self._characters = 0
+
+    def get(self, s: str, options: tuple[bool, ...]) -> str | None:
+        """Return the cached repaired text of s, or None."""
+        key = (s, options)
+        with self._lock:
+            processed = self._entries.get(key)
+            if processed is not None:
+                self._entries.move_to_end(key)
+            return processed
+
+    def put(self, s: str, options: tuple[bool, ...], processed: str) -> None:
+        """Cache processed as the repaired text of s, evicting old entries."""
+        key = (s, options)
+        size = len(s) + len(processed)
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = processed
+            self._characters += size
+            while (
+                len(self._entries) > self._max_entries
+                or self._characters > self._max_characters
+            ):
+                (old_s, _), old_processed = self._entries.popitem(last=False)
+                self._characters -= len(old_s) + len(old_processed)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._characters = 0
+
+
+# Retried LLM calls often hand the same text to loads_relaxed again, so
+# the repaired text of inputs of up to _MAX_CACHED_LENGTH characters is
+# cached. The cache holds at most 256 entries, whose inputs and repaired
+# texts total at most 4M characters: 4 MB for ASCII, up to 16 MB for text
+# with characters outside the Basic Multilingual Plane, plus under 1 KB of
+# keys and bookkeeping per entry.
+_MAX_CACHED_LENGTH = 16 * 1024
+_repair_cache = _RepairCache(256, 4 * 1024 * 1024)
+
+
+def clear_repair_cache() -> None:
+    """Free the repaired text cached for recent loads_relaxed inputs."""
+    _repair_cache.clear()
+
+
+# The repair passes in the order they run. Each is enabled by the
+# loads_relaxed option of the same name, passed in the same order.
+_PIPELINE: tuple[Callable[[str, MutableSequence[Repair] | None], str], ...] = (
+    # remove_markdown_fences (V3): first, to unwrap fenced JSON
+    _remove_markdown_fences,
+    # extract_json (V3): after fences, before other processing
+    extract_json_from_text,
+    # normalize_quotes (V1)
+    _normalize_quotes,
+    # allow_single_quote_strings (V2)
+    convert_single_quote_strings,
+    # allow_unquoted_keys (V2)
+    quote_unquoted_keys,
+    # convert_python_literals (V2)
+    _convert_python_literals,
+    # fix_unescaped_backslash (V3): first in escape processing, so that
+    # user-provided backslashes are escaped before the passes below add
+    # escape sequences of their own
+    _fix_unescaped_backslash,
+    # escape_newlines (V2): after the backslash fix
+    escape_newlines_in_strings,
+    # escape_control_chars (V3): after the backslash fix
+    escape_control_characters,
+    # remove_ellipsis (V2)
+    remove_ellipsis_markers,
+    # allow_comments (V1): before the structural fixes, so that comments
+    # don't confuse their heuristics
+    _strip_comments,
+    # convert_number_formats (V3): before the missing colon and comma
+    # fixes, so that they see 0xFF as one decimal number, not two tokens
+    _convert_number_formats,
+    # convert_javascript_values (V3): before the missing colon and comma
+    # fixes, so that they see null instead of unknown identifiers like NaN
+    _convert_js_values,
+    # fix_missing_colon (V3): establishes key-value structure, so that
+    # '{"name" "John"}' becomes '{"name": "John"}'
+    fix_missing_colons,
+    # fix_unescaped_quotes (V3): after colons, which mark the string
+    # boundaries, and before commas, so that the comma fixer sees them too
+    # ('{"text": "He said "hello" today"}')
+    _fix_unescaped_quotes,
+    # fix_missing_comma (V3): once strings have proper boundaries and
+    # numbers are decimal
+    fix_missing_commas,
+    # auto_close_brackets (V2): before trailing comma removal, so that
+    # '{"a": 1,' becomes '{"a": 1,}' and then loses its comma
+    _auto_close_brackets,
+    # allow_trailing_commas (V1): after auto-close
+    _remove_trailing_commas,
+    # remove_double_commas (V3): edge case cleanup
+    _remove_double_commas,
+)
+
+
+@functools.cache
+def _enabled_passes(
+    options: tuple[bool, ...],
+) -> tuple[Callable[[str, MutableSequence[Repair] | None], str], ...]:
+    """The passes of _PIPELINE that options enables, worked out once per set."""
+    return tuple(
+        repair_pass
+        for repair_pass, enabled in zip(_PIPELINE, options)
+        if enabled
+    )
+
+
+def _repair(
+    s: str,
+    log: MutableSequence[Repair] | None,
+    options: tuple[bool, ...],
+) -> str:
+    """Run the enabled repair passes over s, in pipeline order.
+
+    Args:
+        s: JSON string (possibly with relaxed syntax)
+        log: Optional list to append Repair objects to
+        options: Whether each pass of _PIPELINE is enabled, in order
 
-    return text + "".join(closing_brackets)
+    Returns:
+        The repaired text, ready for json.loads
+    """
+    processed = s
+
+    # Strip BOM if present
+    if processed.startswith("\ufeff"):
+        processed = processed[1:]
+
+    for repair_pass in _enabled_passes(options):
+        processed = repair_pass(processed, log)
+    return processed
 
 
 def loads_relaxed(
@@ -363,8 +683,9 @@ def loads_relaxed(
     convert_number_formats: bool = True,
     remove_double_commas: bool = True,
     # Common options
-    repair_log: list[Repair] | None = None,
+    repair_log: MutableSequence[Repair] | None = None,
     on_repair: Literal["ignore", "warn", "error"] = "ignore",
+    readonly: bool = False,
 ) -> Any:
     """Parse a relaxed JSON string into Python objects.
 
@@ -411,14 +732,19 @@ def loads_relaxed(
         convert_javascript_values: Convert NaN, Infinity, undefined to null
         convert_number_formats: Convert 0xFF, 0o777, 0b1010 to decimal
         remove_double_commas: Remove double/empty commas
-        repair_log: Optional list to collect Repair objects documenting fixes
+        repair_log: Optional list to collect Repair objects documenting
+            fixes. Any mutable sequence works; a deque with a maxlen keeps
+            only the most recent repairs.
         on_repair: Action when repair needed:
             - "ignore": Parse silently (default)
             - "warn": Emit warnings via warnings.warn()
             - "error": Raise ValueError on first repair needed
+        readonly: Return objects as read-only MappingProxyType views and
+            arrays as tuples, so the result can be shared without copying
 
     Returns:
-        Parsed Python object (dict, list, str, int, float, bool, or None)
+        Parsed Python object (dict, list, str, int, float, bool, or None;
+        MappingProxyType or tuple instead of dict or list if readonly)
 
     Raises:
         json.JSONDecodeError: If the JSON is invalid even after relaxations
@@ -429,148 +755,70 @@ def loads_relaxed(
 
     # Strict mode: use standard json.loads directly
     if strict:
-        return json.loads(s)
-
-    # Collect repairs in a local list if on_repair needs it
-    local_repairs: list[Repair] = []
-    actual_log = repair_log if repair_log is not None else local_repairs
-
-    processed = s
-
-    # Step 0: Strip BOM if present
-    if processed.startswith("\ufeff"):
-        processed = processed[1:]
-
-    # Step 0.1: Remove markdown fences (V3 - must be first to unwrap fenced JSON)
-    if remove_markdown_fences:
-        from .normalizers import remove_markdown_fences as _remove_markdown_fences
-
-        processed = _remove_markdown_fences(processed, actual_log)
-
-    # Step 0.2: Extract JSON from surrounding text (V3 - after fences, before other processing)
-    if extract_json:
-        processed = extract_json_from_text(processed, actual_log)
-
-    # Step 1: Normalize smart quotes (V1)
-    if normalize_quotes:
-        # Import here to use the function (avoiding name collision with parameter)
-        from .normalizers import normalize_quotes as _normalize_quotes
-
-        processed = _normalize_quotes(processed, actual_log)
-
-    # Step 2: Convert single-quote strings (V2)
-    if allow_single_quote_strings:
-        processed = convert_single_quote_strings(processed, actual_log)
-
-    # Step 3: Quote unquoted keys (V2)
-    if allow_unquoted_keys:
-        processed = quote_unquoted_keys(processed, actual_log)
-
-    # Step 4: Convert Python literals (V2)
-    if convert_python_literals:
-        # Import here to use the function (avoiding name collision with parameter)
-        from .normalizers import convert_python_literals as _convert_python_literals
-
-        processed = _convert_python_literals(processed, actual_log)
-
-    # Step 5: Fix unescaped backslashes (V3) - FIRST in escape processing
-    # so that user-provided backslashes are escaped before other escape
-    # sequences are added by subsequent steps
-    if fix_unescaped_backslash:
-        processed = _fix_unescaped_backslash(processed, actual_log)
-
-    # Step 5.1: Escape newlines in strings (V2) - after backslash fix
-    if escape_newlines:
-        processed = escape_newlines_in_strings(processed, actual_log)
-
-    # Step 5.2: Escape control characters (V3) - after backslash fix
-    # This adds proper escape sequences for actual control chars
-    if escape_control_chars:
-        processed = escape_control_characters(processed, actual_log)
-
-    # Step 6: Remove ellipsis markers (V2)
-    if remove_ellipsis:
-        processed = remove_ellipsis_markers(processed, actual_log)
-
-    # Step 7: Strip comments (V1) - must be before other structural fixes
-    # so comments don't confuse the heuristics
-    if allow_comments:
-        processed = _strip_comments(processed, actual_log)
-
-    # Step 7.1: Convert non-decimal number formats (V3 - hex, octal, binary → decimal)
-    # MUST run before fix_missing_colons/commas so those normalizers see valid
-    # decimal numbers instead of misinterpreting 0xFF as two tokens.
-    if convert_number_formats:
-        from .normalizers import convert_number_formats as _convert_number_formats
-
-        processed = _convert_number_formats(processed, actual_log)
-
-    # Step 7.2: Convert JavaScript values (V3 - NaN, Infinity, undefined → null)
-    # MUST run before fix_missing_colons/commas so those normalizers see valid
-    # null values instead of unknown identifiers like "NaN".
-    if convert_javascript_values:
-        from .normalizers import convert_javascript_values as _convert_js_values
-
-        processed = _convert_js_values(processed, actual_log)
-
-    # Step 7.3: Fix missing colons (V3) - structural, establishes key-value structure
-    # so that '{"name" "John"}' becomes '{"name": "John"}'
-    # Runs after number/JS conversion so values are recognized correctly.
-    if fix_missing_colon:
-        processed = fix_missing_colons(processed, actual_log)
-
-    # Step 7.4: Fix unescaped quotes (V3) - AFTER colons, BEFORE commas
-    # After colons are in place, we can identify string boundaries.
-    # Must run before fix_missing_commas so comma fixer sees valid string boundaries.
-    # Example: '{"text": "He said "hello" today"}' needs quotes fixed first.
-    if fix_unescaped_quotes:
-        from .normalizers import fix_unescaped_quotes as _fix_unescaped_quotes
-
-        processed = _fix_unescaped_quotes(processed, actual_log)
-
-    # Step 7.5: Fix missing commas (V3) - structural, AFTER quote/number fixing
-    # Now that strings have proper boundaries and numbers are decimal, we can
-    # safely detect missing commas.
-    if fix_missing_comma:
-        processed = fix_missing_commas(processed, actual_log)
-
-    # Step 8: Auto-close brackets (V2 - must be before trailing comma removal)
-    # so that '{"a": 1,' becomes '{"a": 1,}' and then trailing comma is removed
-    if auto_close_brackets:
-        processed = _auto_close_brackets(processed, actual_log)
-
-    # Step 9: Remove trailing commas (V1 - must be after auto-close)
-    if allow_trailing_commas:
-        processed = _remove_trailing_commas(processed, actual_log)
-
-    # Step 10: Remove double/empty commas (V3 - edge case cleanup)
-    if remove_double_commas:
-        from .normalizers import remove_double_commas as _remove_double_commas
-
-        processed = _remove_double_commas(processed, actual_log)
+        result = json.loads(s)
+        return _freeze(result) if readonly else result
+
+    # Collect repairs in a local list if on_repair needs it. When nothing
+    # will read them, the passes are given no log and create no Repair
+    # objects at all.
+    actual_log: MutableSequence[Repair] | None = repair_log
+    if actual_log is None and on_repair != "ignore":
+        actual_log = []
+
+    # Fast path: input that already is standard JSON needs no repairs.
+    # Skipped when the log already holds entries, since on_repair reports
+    # everything in the log.
+    if (not actual_log or on_repair == "ignore") and _is_repair_free_candidate(s):
+        try:
+            result = _STANDARD_JSON_DECODER.decode(s)
+        except (ValueError, RecursionError):
+            # Deep nesting is decoded without recursion after the passes
+            pass
+        else:
+            return _freeze(result) if readonly else result
+
+    # One flag per pass, in _PIPELINE order
+    options = (
+        remove_markdown_fences,
+        extract_json,
+        normalize_quotes,
+        allow_single_quote_strings,
+        allow_unquoted_keys,
+        convert_python_literals,
+        fix_unescaped_backslash,
+        escape_newlines,
+        escape_control_chars,
+        remove_ellipsis,
+        allow_comments,
+        convert_number_formats,
+        convert_javascript_values,
+        fix_missing_colon,
+        fix_unescaped_quotes,
+        fix_missing_comma,
+        auto_close_brackets,
+        allow_trailing_commas,
+        remove_double_commas,
+    )
+    if actual_log is None and len(s) <= _MAX_CACHED_LENGTH:
+        processed = _repair_cache.get(s, options)
+        if processed is None:
+            processed = _repair(s, None, options)
+            _repair_cache.put(s, options, processed)
+    else:
+        # Repairs are not cached, so a call that logs them runs the passes
+        # into its log, which keeps the repairs made before a pass fails
+        processed = _repair(s, actual_log, options)
 
     # Check if any repairs were made
     if actual_log:
-        if on_repair == "error":
-            repair = actual_log[0]
-            raise ValueError(
-                f"Repair needed at line {repair.line}, column {repair.column}: "
-                f"{repair.message}"
-            )
-        elif on_repair == "warn":
-            for repair in actual_log:
-                warnings.warn(
-                    f"JSON repair at line {repair.line}: {repair.message}",
-                    category=UserWarning,
-                    stacklevel=2,
-                )
+        _report_repairs(actual_log, on_repair)
 
-    # Parse the processed JSON
+    # Parse the processed JSON; a JSONDecodeError propagates unchanged
     try:
-        return json.loads(processed)
-    except json.JSONDecodeError as e:
-        # Re-raise with original error
-        raise e
+        result = json.loads(processed)
+    except RecursionError:
+        result = _decode_nested(processed)
+    return _freeze(result) if readonly else result
 
 
 def load_relaxed(
@@ -591,6 +839,185 @@ def load_relaxed(
     return loads_relaxed(fp.read(), **kwargs)
 
 
+class IncrementalRelaxedParser:
+    """Parse relaxed JSON that arrives in chunks, such as an LLM stream.
+
+    Each chunk is scanned once to track string state and bracket depth,
+    so the document is parsed when its top-level object or array closes
+    instead of after every chunk. Brackets inside comments and
+    single-quoted strings are counted too, so they can balance early; each
+    chunk that does so parses everything fed so far, which makes a stream
+    that keeps balancing early take quadratic time. Chunks fed once the
+    document is complete are discarded.
+
+    Example:
+        >>> parser = IncrementalRelaxedParser()
+        >>> parser.feed('{"a": [1, 2')
+        >>> parser.feed(', 3]}')
+        {'a': [1, 2, 3]}
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Create a parser.
+
+        Args:
+            **kwargs: Arguments passed to loads_relaxed
+
+        Raises:
+            ValueError: If on_repair is not "ignore", "warn" or "error"
+        """
+        on_repair = kwargs.get("on_repair", "ignore")
+        if on_repair not in ("ignore", "warn", "error"):
+            raise ValueError(f"Invalid on_repair value: {on_repair!r}")
+        self._kwargs = kwargs
+        self._chunks: list[str] = []
+        self._depth = 0
+        self._opened = False
+        self._in_string = False
+        self._escape_next = False
+        self._done = False
+        self._result: Any = None
+
+    def _closes_document(self, chunk: str) -> bool:
+        """Scan a chunk and report whether it closes the top-level value."""
+        i = 0
+        length = len(chunk)
+        closed = False
+        if self._escape_next and chunk:
+            self._escape_next = False
+            i = 1
+
+        while i < length:
+            if self._in_string:
+                match = _STRING_TAIL_RE.match(chunk, i)
+                assert match is not None  # The pattern can match empty
+                i = match.end()
+                if match.group(1):
+                    self._in_string = False
+                elif i < length:
+                    # A backslash ends the chunk; it escapes the next one
+                    self._escape_next = True
+                    i = length
+                continue
+
+            found = _BRACKET_OR_QUOTE_RE.search(chunk, i)
+            if found is None:
+                break
+            char = found.group()
+            i = found.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                self._opened = True
+            elif self._opened:
+                # A stray closer after an early balance, e.g. one that
+                # ended a single-quoted string, may complete the document
+                if self._depth > 0:
+                    self._depth -= 1
+                closed = closed or self._depth == 0
+
+        return closed
+
+    def feed(self, chunk: str) -> Any | None:
+        """Add a chunk of text.
+
+        Args:
+            chunk: The next piece of the document
+
+        Returns:
+            The parsed document when this chunk closes its top-level
+            object or array and the text so far parses, otherwise None.
+            Once the document is complete, chunks are discarded and None
+            is returned.
+
+        Raises:
+            ValueError: If on_repair="error" and the parsed document
+                needed repairs
+        """
+        if self._done:
+            return None
+        self._chunks.append(chunk)
+        if not self._closes_document(chunk):
+            return None
+
+        # Brackets inside comments or single-quoted strings can balance
+        # early, and such an attempt fails without auto-closing. Its
+        # repairs go to a scratch log with on_repair ignored, so a failed
+        # attempt leaves no log entries or warnings behind. The scratch log
+        # is only kept when something will read it.
+        repair_log = self._kwargs.get("repair_log")
+        on_repair = self._kwargs.get("on_repair", "ignore")
+        attempt_log = (
+            RepairLog() if repair_log is not None or on_repair != "ignore" else None
+        )
+        try:
+            result = loads_relaxed(
+                "".join(self._chunks),
+                **{
+                    **self._kwargs,
+                    "auto_close_brackets": False,
+                    "repair_log": attempt_log,
+                    "on_repair": "ignore",
+                },
+            )
+        except ValueError:
+            return None
+        self._done = True
+        self._result = result
+        self._chunks = []
+
+        if attempt_log is not None:
+            if repair_log is not None:
+                repair_log.extend(attempt_log)
+                # loads_relaxed reports everything in the caller's log
+                reported: Sequence[Repair] = repair_log
+            else:
+                reported = attempt_log
+            if reported:
+                _report_repairs(reported, on_repair)
+        return result
+
+    def finish(self) -> Any:
+        """Parse everything fed so far.
+
+        Missing closing brackets are added as usual, so a stream that was
+        cut off still parses. If feed() already returned the document, it
+        is returned again without logging its repairs a second time.
+
+        Returns:
+            Parsed Python object
+
+        Raises:
+            json.JSONDecodeError: If the text is invalid even after relaxations
+            ValueError: If on_repair="error" and repairs are needed
+        """
+        if self._done:
+            return self._result
+        return loads_relaxed("".join(self._chunks), **self._kwargs)
+
+
+def loads_relaxed_iter(chunks: Iterable[str], **kwargs: Any) -> Any:
+    """Parse relaxed JSON from an iterable of text chunks.
+
+    Stops consuming chunks as soon as the top-level object or array is
+    complete, so text after it is never read.
+
+    Args:
+        chunks: Pieces of the document, in order
+        **kwargs: Additional arguments passed to loads_relaxed
+
+    Returns:
+        Parsed Python object
+    """
+    parser = IncrementalRelaxedParser(**kwargs)
+    for chunk in chunks:
+        result = parser.feed(chunk)
+        if result is not None:
+            return result
+    return parser.finish()
+
+
 def can_parse(s: str) -> bool:
     """Check if a string can be parsed with relaxations.
 
@@ -607,7 +1034,7 @@ def can_parse(s: str) -> bool:
         return False
 
 
-def get_repairs(s: str) -> list[Repair]:
+def get_repairs(s: str) -> RepairLog:
     """Get list of repairs needed to parse a string.
 
     This parses the string and returns all repairs that would be made,
@@ -617,9 +1044,9 @@ def get_repairs(s: str) -> list[Repair]:
         s: JSON string to analyze
 
     Returns:
-        List of Repair objects describing fixes needed
+        RepairLog of Repair objects describing fixes needed
     """
-    repairs: list[Repair] = []
+    repairs = RepairLog()
     try:
         loads_relaxed(s, repair_log=repairs, on_repair="ignore")
     except (json.JSONDecodeError, ValueError):
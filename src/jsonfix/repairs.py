@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Any, SupportsIndex, overload
 
 
 class RepairKind(Enum):
@@ -36,6 +41,12 @@ class RepairKind(Enum):
     NUMBER_FORMAT = auto()
     DOUBLE_COMMA = auto()
 
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent with equality. Enum.__hash__ hashes the name in Python
+    # code, and kinds are hashed for every logged repair: to find its
+    # message template and to index and count the log.
+    __hash__ = object.__hash__
+
 
 @dataclass(frozen=True)
 class Repair:
@@ -51,6 +62,19 @@ class Repair:
         message: Human-readable description of the repair
     """
 
+    # Slots instead of a per-instance __dict__, since documents with many
+    # repairs create one of these per repair. dataclass(slots=True) needs
+    # Python 3.10, so they are declared by hand.
+    __slots__ = (
+        "column",
+        "kind",
+        "line",
+        "message",
+        "original",
+        "position",
+        "replacement",
+    )
+
     kind: RepairKind
     position: int
     line: int
@@ -59,6 +83,164 @@ class Repair:
     replacement: str
     message: str
 
+    # Pickle and copy restore slots with setattr(), which a frozen
+    # dataclass refuses, so state is saved and restored explicitly
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class RepairLog(list[Repair]):
+    """List of Repair objects with fast lookup and counts by kind.
+
+    A drop-in replacement for the plain list passed as ``repair_log``.
+    Repairs are also indexed by kind; the index is built on the first
+    lookup, kept up to date by append(), and rebuilt after any other
+    mutation.
+    """
+
+    def __init__(self, repairs: Iterable[Repair] = ()) -> None:
+        super().__init__(repairs)
+        self._by_kind: dict[RepairKind, list[Repair]] | None = None
+
+    def _index(self) -> dict[RepairKind, list[Repair]]:
+        """Return the per-kind index, building it if needed."""
+        index = self._by_kind
+        if index is None:
+            index = {}
+            for repair in self:
+                index.setdefault(repair.kind, []).append(repair)
+            self._by_kind = index
+        return index
+
+    def by_kind(self, kind: RepairKind) -> list[Repair]:
+        """Return the repairs of the given kind, in log order.
+
+        Args:
+            kind: The type of repair to select
+
+        Returns:
+            A new list of the matching Repair objects
+        """
+        return list(self._index().get(kind, ()))
+
+    def first(self, kind: RepairKind) -> Repair | None:
+        """Return the earliest repair of the given kind.
+
+        Args:
+            kind: The type of repair to select
+
+        Returns:
+            The first matching Repair, or None if there is none
+        """
+        repairs = self._index().get(kind)
+        return repairs[0] if repairs else None
+
+    def has(self, kind: RepairKind) -> bool:
+        """Return whether any repair of the given kind was logged.
+
+        Args:
+            kind: The type of repair to look for
+
+        Returns:
+            True if the log holds at least one repair of that kind
+        """
+        return bool(self._index().get(kind))
+
+    def count(self, value: Repair | RepairKind) -> int:
+        """Return the number of repairs of a kind, or equal to a repair.
+
+        Given a RepairKind, counts from the per-kind index without building
+        a list. Given a Repair, behaves like list.count().
+
+        Args:
+            value: The type of repair, or a Repair to compare against
+
+        Returns:
+            The number of matching repairs
+        """
+        if isinstance(value, RepairKind):
+            return len(self._index().get(value, ()))
+        return super().count(value)
+
+    @property
+    def counts(self) -> Counter[RepairKind]:
+        """Number of repairs of each kind.
+
+        Read from the per-kind index, so the cost does not grow with the
+        length of the log. Kinds that were never logged count as 0.
+
+        Returns:
+            A new Counter mapping RepairKind to the number of repairs
+        """
+        index = self._index()
+        return Counter({kind: len(repairs) for kind, repairs in index.items()})
+
+    def append(self, repair: Repair) -> None:
+        super().append(repair)
+        if self._by_kind is not None:
+            self._by_kind.setdefault(repair.kind, []).append(repair)
+
+    # Any other mutation drops the index so that it is rebuilt on demand
+
+    def extend(self, repairs: Iterable[Repair]) -> None:
+        super().extend(repairs)
+        self._by_kind = None
+
+    def insert(self, index: SupportsIndex, repair: Repair) -> None:
+        super().insert(index, repair)
+        self._by_kind = None
+
+    def pop(self, index: SupportsIndex = -1) -> Repair:
+        self._by_kind = None
+        return super().pop(index)
+
+    def remove(self, repair: Repair) -> None:
+        super().remove(repair)
+        self._by_kind = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_kind = None
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._by_kind = None
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._by_kind = None
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, repair: Repair) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, repair: Iterable[Repair]) -> None: ...
+
+    def __setitem__(self, index: Any, repair: Any) -> None:
+        super().__setitem__(index, repair)
+        self._by_kind = None
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        super().__delitem__(index)
+        self._by_kind = None
+
+    def __iadd__(self, repairs: Iterable[Repair]) -> RepairLog:  # type: ignore[override,misc]
+        self.extend(repairs)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> RepairLog:
+        super().__imul__(count)
+        self._by_kind = None
+        return self
+
+
+_NEWLINE_RE = re.compile("\n")
+
 
 def _calculate_line_column(text: str, position: int) -> tuple[int, int]:
     """Calculate line and column from absolute position.
@@ -75,18 +257,101 @@ def _calculate_line_column(text: str, position: int) -> tuple[int, int]:
     if position > len(text):
         position = len(text)
 
-    # Count newlines before position
-    text_before = text[:position]
-    lines = text_before.split("\n")
-    line = len(lines)
-    column = len(lines[-1]) + 1 if lines else 1
-
+    # Count newlines before position without slicing the prefix
+    line = text.count("\n", 0, position) + 1
+    column = position - text.rfind("\n", 0, position)
     return line, column
 
 
+class LineIndex:
+    """Line and column lookup for the repairs one pass makes in its text.
+
+    Each pass creates one index over its input and passes it to every
+    create_repair call, so nothing outlives the pass. The first lookup
+    counts newlines like _calculate_line_column, so a pass that makes one
+    repair does not index the whole text. From the second lookup on, the
+    offsets of the text's newlines are collected once and bisected instead
+    of counting from the start again, which made logging quadratic.
+    """
+
+    __slots__ = ("_looked_up", "_newlines", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._newlines: list[int] | None = None
+        self._looked_up = False
+
+    def line_column(self, position: int) -> tuple[int, int]:
+        """Return the 1-indexed (line, column) of position in the text."""
+        newlines = self._newlines
+        if newlines is None:
+            if not self._looked_up:
+                self._looked_up = True
+                return _calculate_line_column(self.text, position)
+            newlines = [match.start() for match in _NEWLINE_RE.finditer(self.text)]
+            self._newlines = newlines
+
+        if position < 0:
+            position = 0
+        if position > len(self.text):
+            position = len(self.text)
+        # The number of newlines before position, and the last of them
+        before = bisect_left(newlines, position)
+        column = position - (newlines[before - 1] if before else -1)
+        return before + 1, column
+
+
+# Message template for each kind of repair. Fields: {original},
+# {replacement}, and {preview} (original truncated to 30 characters).
+# Looking the kind up here replaces comparing it against each member in
+# turn; every RepairKind.X attribute access goes through the enum
+# metaclass, so a long if/elif chain costs microseconds per repair.
+_MESSAGE_TEMPLATES: dict[RepairKind, str] = {
+    RepairKind.TRAILING_COMMA: "Removed trailing comma",
+    RepairKind.SINGLE_LINE_COMMENT: "Removed single-line comment '{preview}'",
+    RepairKind.MULTI_LINE_COMMENT: "Removed multi-line comment '{preview}'",
+    RepairKind.HASH_COMMENT: "Removed hash comment '{preview}'",
+    RepairKind.SMART_QUOTE: "Replaced smart quote '{original}' with '{replacement}'",
+    RepairKind.SINGLE_QUOTE_STRING: (
+        "Converted single-quoted string '{preview}' to double quotes"
+    ),
+    RepairKind.UNQUOTED_KEY: "Added quotes around unquoted key '{original}'",
+    RepairKind.PYTHON_LITERAL: (
+        "Converted Python literal '{original}' to JSON '{replacement}'"
+    ),
+    RepairKind.UNESCAPED_NEWLINE: "Escaped literal newline in string",
+    RepairKind.MISSING_BRACKET: "Added missing closing bracket '{replacement}'",
+    RepairKind.TRUNCATION_MARKER: "Removed truncation marker '{original}'",
+    # V3 repair kinds (LLM-specific)
+    RepairKind.JSON_EXTRACTED: "Extracted JSON from surrounding text",
+    RepairKind.MARKDOWN_FENCE_REMOVED: "Removed markdown code fence",
+    RepairKind.UNESCAPED_QUOTE: "Escaped unescaped quote in string '{preview}'",
+    # V3 repair kinds (structural)
+    RepairKind.MISSING_COLON: "Added missing colon between key and value",
+    RepairKind.MISSING_COMMA: "Added missing comma between elements",
+    # The control character is shown escaped, e.g. '\n'
+    RepairKind.CONTROL_CHARACTER: "Escaped control character {original!r}",
+    RepairKind.UNESCAPED_BACKSLASH: "Escaped unescaped backslash",
+    # V3 repair kinds (edge cases)
+    RepairKind.JAVASCRIPT_VALUE: (
+        "Converted JavaScript value '{original}' to JSON '{replacement}'"
+    ),
+    RepairKind.NUMBER_FORMAT: "Converted number format '{original}' to '{replacement}'",
+    RepairKind.DOUBLE_COMMA: "Removed extra comma",
+}
+
+# Messages with no placeholders. Every repair of these kinds shares the one
+# string instead of formatting a copy of the template.
+_FIXED_MESSAGES: dict[RepairKind, str] = {
+    kind: template
+    for kind, template in _MESSAGE_TEMPLATES.items()
+    if "{" not in template
+}
+
+
 def create_repair(
     kind: RepairKind,
-    text: str,
+    lines: LineIndex,
     position: int,
     original: str,
     replacement: str = "",
@@ -95,7 +360,7 @@ def create_repair(
 
     Args:
         kind: The type of repair
-        text: The full original text (for position calculation)
+        lines: Line index over the text position is in
         position: Character position in original string
         original: The original text being repaired
         replacement: The replacement text (default: empty for removal)
@@ -103,62 +368,20 @@ def create_repair(
     Returns:
         A Repair object with all fields populated
     """
-    line, column = _calculate_line_column(text, position)
+    line, column = lines.line_column(position)
 
     # Generate human-readable message based on kind
-    if kind == RepairKind.TRAILING_COMMA:
-        message = "Removed trailing comma"
-    elif kind == RepairKind.SINGLE_LINE_COMMENT:
-        # Truncate long comments in message
-        comment_preview = original[:30] + "..." if len(original) > 30 else original
-        message = f"Removed single-line comment '{comment_preview}'"
-    elif kind == RepairKind.MULTI_LINE_COMMENT:
-        comment_preview = original[:30] + "..." if len(original) > 30 else original
-        message = f"Removed multi-line comment '{comment_preview}'"
-    elif kind == RepairKind.HASH_COMMENT:
-        comment_preview = original[:30] + "..." if len(original) > 30 else original
-        message = f"Removed hash comment '{comment_preview}'"
-    elif kind == RepairKind.SMART_QUOTE:
-        message = f"Replaced smart quote '{original}' with '{replacement}'"
-    elif kind == RepairKind.SINGLE_QUOTE_STRING:
-        preview = original[:30] + "..." if len(original) > 30 else original
-        message = f"Converted single-quoted string '{preview}' to double quotes"
-    elif kind == RepairKind.UNQUOTED_KEY:
-        message = f"Added quotes around unquoted key '{original}'"
-    elif kind == RepairKind.PYTHON_LITERAL:
-        message = f"Converted Python literal '{original}' to JSON '{replacement}'"
-    elif kind == RepairKind.UNESCAPED_NEWLINE:
-        message = "Escaped literal newline in string"
-    elif kind == RepairKind.MISSING_BRACKET:
-        message = f"Added missing closing bracket '{replacement}'"
-    elif kind == RepairKind.TRUNCATION_MARKER:
-        message = f"Removed truncation marker '{original}'"
-    # V3 repair kinds (LLM-specific)
-    elif kind == RepairKind.JSON_EXTRACTED:
-        message = "Extracted JSON from surrounding text"
-    elif kind == RepairKind.MARKDOWN_FENCE_REMOVED:
-        message = "Removed markdown code fence"
-    elif kind == RepairKind.UNESCAPED_QUOTE:
-        preview = original[:30] + "..." if len(original) > 30 else original
-        message = f"Escaped unescaped quote in string '{preview}'"
-    # V3 repair kinds (structural)
-    elif kind == RepairKind.MISSING_COLON:
-        message = "Added missing colon between key and value"
-    elif kind == RepairKind.MISSING_COMMA:
-        message = "Added missing comma between elements"
-    elif kind == RepairKind.CONTROL_CHARACTER:
-        message = f"Escaped control character '{repr(original)[1:-1]}'"
-    elif kind == RepairKind.UNESCAPED_BACKSLASH:
-        message = "Escaped unescaped backslash"
-    # V3 repair kinds (edge cases)
-    elif kind == RepairKind.JAVASCRIPT_VALUE:
-        message = f"Converted JavaScript value '{original}' to JSON '{replacement}'"
-    elif kind == RepairKind.NUMBER_FORMAT:
-        message = f"Converted number format '{original}' to '{replacement}'"
-    elif kind == RepairKind.DOUBLE_COMMA:
-        message = "Removed extra comma"
-    else:
-        message = f"Repaired: {original} -> {replacement}"
+    message = _FIXED_MESSAGES.get(kind)
+    if message is None:
+        template = _MESSAGE_TEMPLATES.get(kind)
+        if template is None:
+            message = f"Repaired: {original} -> {replacement}"
+        else:
+            # Truncate long originals (comments, strings) in the message
+            preview = original[:30] + "..." if len(original) > 30 else original
+            message = template.format(
+                original=original, replacement=replacement, preview=preview
+            )
 
     return Repair(
         kind=kind,
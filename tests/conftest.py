@@ -2,27 +2,80 @@
 
 from __future__ import annotations
 
+from typing import Any, Callable
+
 import pytest
 
+from jsonfix import RepairLog, loads_relaxed
 
-@pytest.fixture
-def repair_log() -> list:
-    """Fresh repair log list for each test."""
-    return []
+
+@pytest.fixture(scope="session")
+def repair_log_buffer() -> RepairLog:
+    """The one RepairLog behind every repair_log fixture value."""
+    return RepairLog()
 
 
 @pytest.fixture
+def repair_log(repair_log_buffer: RepairLog) -> RepairLog:
+    """Empty repair log for each test (reused, not reallocated)."""
+    repair_log_buffer.clear()
+    return repair_log_buffer
+
+
+@pytest.fixture(scope="session")
+def warm_parser() -> Callable[..., Any]:
+    """loads_relaxed, called once up front so later tests skip cold start."""
+    loads_relaxed('{"a": 1}')
+    return loads_relaxed
+
+
+@pytest.fixture(scope="session")
+def large_array_json() -> str:
+    """10000-element integer array with a trailing comma, built once."""
+    return "[" + ",".join(map(str, range(10000))) + ",]"
+
+
+@pytest.fixture(scope="session")
+def hundred_k_array_json() -> str:
+    """100000-element array of ones, built once."""
+    return "[" + ",".join(["1"] * 100000) + "]"
+
+
+@pytest.fixture(scope="session")
+def large_object_json() -> str:
+    """Object with 10000 keys, built once."""
+    pairs = [f'"key{i}": {i}' for i in range(10000)]
+    return "{" + ", ".join(pairs) + "}"
+
+
+@pytest.fixture(scope="session")
+def large_string_json() -> str:
+    """Object holding a single 1MB string value, built once."""
+    return '{"text": "' + "x" * (1024 * 1024) + '"}'
+
+
+@pytest.fixture(scope="session")
+def many_comments_json() -> str:
+    """Object with 1000 keys, each preceded by a // comment, built once."""
+    lines = []
+    for i in range(1000):
+        lines.append(f"// Comment {i}")
+        lines.append(f'  "key{i}": {i},')
+    return "{\n" + "\n".join(lines[:-1]) + "\n" + lines[-1].rstrip(",") + "\n}"
+
+
+@pytest.fixture(scope="session")
 def smart_double_quotes() -> dict[str, str]:
-    """Unicode smart double quotes."""
+    """Unicode smart double quotes, shared by every test (read-only)."""
     return {
         "left": "\u201c",  # "
         "right": "\u201d",  # "
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def smart_single_quotes() -> dict[str, str]:
-    """Unicode smart single quotes."""
+    """Unicode smart single quotes, shared by every test (read-only)."""
     return {
         "left": "\u2018",  # '
         "right": "\u2019",  # '
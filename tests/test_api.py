@@ -4,18 +4,25 @@ from __future__ import annotations
 
 import io
 import json
+import warnings
+from collections import deque
+from types import MappingProxyType
 
 import pytest
 
 from jsonfix import (
+    IncrementalRelaxedParser,
     can_parse,
+    clear_repair_cache,
     get_repairs,
     load_relaxed,
     loads_relaxed,
+    loads_relaxed_iter,
     Repair,
     RepairKind,
 )
 from jsonfix.normalizers import has_smart_quotes
+from jsonfix.parser import _decode_nested, _RepairCache
 
 
 class TestLoadRelaxed:
@@ -55,6 +62,230 @@ class TestLoadRelaxed:
             load_relaxed(fp)
 
 
+class TestRepeatedInput:
+    """Test that repeated input is repaired once and parsed each time."""
+
+    def test_repeated_input_logs_each_time(self, repair_log: list) -> None:
+        """Every call reports its repairs, cached or not."""
+        text = "{'a': [1, 2,],}"
+        loads_relaxed(text, repair_log=repair_log)
+        loads_relaxed(text, repair_log=repair_log)
+        assert len(repair_log) == 6
+        assert repair_log[:3] == repair_log[3:]
+
+    def test_repeated_input_returns_fresh_result(self) -> None:
+        """Mutating one result does not affect the next."""
+        first = loads_relaxed("{'a': [1,]}")
+        first["a"].append(2)
+        assert loads_relaxed("{'a': [1,]}") == {"a": [1]}
+
+    def test_repeated_input_with_other_options(self) -> None:
+        """The options are part of what is cached."""
+        assert loads_relaxed("[1, 2,]") == [1, 2]
+        with pytest.raises(json.JSONDecodeError):
+            loads_relaxed("[1, 2,]", allow_trailing_commas=False)
+
+    def test_repeated_input_still_errors(self) -> None:
+        """on_repair="error" raises on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Repair needed"):
+                loads_relaxed("[1,]", on_repair="error")
+
+    def test_cleared_cache_repairs_again(self) -> None:
+        """Input parsed after clear_repair_cache is repaired afresh."""
+        assert loads_relaxed("{'a': 1,}") == {"a": 1}
+        clear_repair_cache()
+        assert loads_relaxed("{'a': 1,}") == {"a": 1}
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Entries past either bound are evicted, oldest use first."""
+        cache = _RepairCache(2, 100)
+        cache.put("a", (), "A")
+        cache.put("b", (), "B")
+        assert cache.get("a", ()) == "A"
+        cache.put("c", (), "C")
+        assert cache.get("b", ()) is None
+        assert cache.get("a", ()) == "A"
+        assert cache.get("c", ()) == "C"
+
+    def test_cache_bounded_by_characters(self) -> None:
+        """The inputs and repaired texts held stay within the budget."""
+        cache = _RepairCache(256, 100)
+        cache.put("x" * 30, (), "y" * 30)
+        cache.put("z" * 30, (), "w" * 30)
+        assert cache.get("x" * 30, ()) is None
+        assert cache.get("z" * 30, ()) == "w" * 30
+        cache.put("v" * 101, (), "")
+        assert cache.get("v" * 101, ()) is None
+        assert cache.get("z" * 30, ()) is None
+        cache.clear()
+        cache.put("u", (), "U")
+        assert cache.get("u", ()) == "U"
+
+
+class TestReadOnly:
+    """Test loads_relaxed(readonly=True)."""
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"a": [1, {"b": 2}]}', "{'a': [1, {b: 2,}]}"],
+        ids=["standard", "repaired"],
+    )
+    def test_containers_are_read_only(self, text: str) -> None:
+        """Objects become mapping proxies and arrays become tuples."""
+        result = loads_relaxed(text, readonly=True)
+        assert isinstance(result, MappingProxyType)
+        assert result == {"a": (1, {"b": 2})}
+        assert isinstance(result["a"][1], MappingProxyType)
+        with pytest.raises(TypeError):
+            result["a"] = 1
+
+    def test_scalars_unchanged(self) -> None:
+        """Top-level scalars are returned as they are."""
+        assert loads_relaxed('"x"', readonly=True) == "x"
+        assert loads_relaxed("42", strict=True, readonly=True) == 42
+
+    def test_deep_nesting(self) -> None:
+        """Freezing does not recurse once per level."""
+        depth = 500
+        result = loads_relaxed("[" * depth + "]" * depth, readonly=True)
+        for _ in range(depth - 1):
+            result = result[0]
+        assert result == ()
+
+
+class TestDeepNesting:
+    """Test documents nested deeper than json.loads can recurse."""
+
+    DEPTH = 10_000
+
+    def test_deep_array(self) -> None:
+        """Standard JSON deeper than the recursion limit parses."""
+        result = loads_relaxed("[" * self.DEPTH + "]" * self.DEPTH)
+        for _ in range(self.DEPTH - 1):
+            result = result[0]
+        assert result == []
+
+    def test_deep_object_with_repairs(self, repair_log: list) -> None:
+        """Repaired text is decoded without recursion too."""
+        text = '{"a": ' * self.DEPTH + "[1, 2.5, true,]" + "}" * self.DEPTH
+        result = loads_relaxed(text, repair_log=repair_log)
+        for _ in range(self.DEPTH):
+            result = result["a"]
+        assert result == [1, 2.5, True]
+        assert len(repair_log) == 1
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"a": [1, 2], "b": {"c": null, "a": -0.5e2}}',
+            ' [ "x\\n" , NaN , -Infinity , {} , [ ] ] ',
+            "[1 2]",
+            '{"a" 1}',
+            "{1: 2}",
+            "[1]]",
+            "[tru]",
+            "",
+        ],
+    )
+    def test_same_result_as_json_loads(self, text: str) -> None:
+        """The stack-based decoder matches json.loads, errors included."""
+        try:
+            expected = repr(json.loads(text))
+        except json.JSONDecodeError as e:
+            with pytest.raises(json.JSONDecodeError) as info:
+                _decode_nested(text)
+            assert (info.value.msg, info.value.pos) == (e.msg, e.pos)
+        else:
+            assert repr(_decode_nested(text)) == expected
+
+
+class TestIncrementalParsing:
+    """Test IncrementalRelaxedParser and loads_relaxed_iter."""
+
+    def test_feed_returns_none_until_complete(self) -> None:
+        """The document is returned by the chunk that closes it."""
+        parser = IncrementalRelaxedParser()
+        assert parser.feed('{"a": [1, 2') is None
+        assert parser.feed(", 3],") is None
+        assert parser.feed("}") == {"a": [1, 2, 3]}
+
+    def test_brackets_and_escapes_in_strings_split_across_chunks(self) -> None:
+        """String state carries over chunk boundaries."""
+        parser = IncrementalRelaxedParser()
+        assert parser.feed('{"a": "}\\') is None
+        assert parser.feed('"]"') is None
+        assert parser.feed("}") == {"a": '}"]'}
+
+    def test_early_balance_leaves_no_repairs(self, repair_log: list) -> None:
+        """A bracket in a single-quoted string does not end the document."""
+        parser = IncrementalRelaxedParser(repair_log=repair_log)
+        assert parser.feed("{'a': ']'") is None
+        assert repair_log == []
+        assert parser.feed("}") == {"a": "]"}
+        assert len(repair_log) == 2
+
+    def test_early_balance_logs_once_to_deque(self) -> None:
+        """A deque log gets the repairs once, when the document parses."""
+        log: deque[Repair] = deque()
+        parser = IncrementalRelaxedParser(repair_log=log)
+        assert parser.feed("{'a': ']'") is None
+        assert not log
+        assert parser.feed("}") == {"a": "]"}
+        assert len(log) == 2
+
+    def test_early_balance_emits_no_warnings(self) -> None:
+        """Only the attempt that parses warns, once per repair."""
+        parser = IncrementalRelaxedParser(on_repair="warn")
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            assert parser.feed("{'a': ']'") is None
+            assert w == []
+            assert parser.feed("}") == {"a": "]"}
+        assert len(w) == 2
+        assert all(x.filename == __file__ for x in w)
+
+    def test_on_repair_error_raised_by_closing_chunk(self) -> None:
+        """A complete document that needs repairs raises from feed()."""
+        parser = IncrementalRelaxedParser(on_repair="error")
+        assert parser.feed('{"a": 1,') is None
+        with pytest.raises(ValueError, match="Removed trailing comma"):
+            parser.feed("}")
+
+    def test_invalid_on_repair_rejected(self) -> None:
+        """An unknown on_repair value is rejected up front."""
+        with pytest.raises(ValueError, match="Invalid on_repair"):
+            IncrementalRelaxedParser(on_repair="loud")
+
+    def test_finish_after_complete_document(self, repair_log: list) -> None:
+        """finish() returns the fed document without logging it again."""
+        parser = IncrementalRelaxedParser(repair_log=repair_log)
+        assert parser.feed("{'a': 1,}") == {"a": 1}
+        assert len(repair_log) == 2
+        assert parser.finish() == {"a": 1}
+        assert len(repair_log) == 2
+
+    def test_chunks_after_complete_document_discarded(self) -> None:
+        """Text fed after the document is not buffered or parsed."""
+        parser = IncrementalRelaxedParser()
+        assert parser.feed('{"a": 1}') == {"a": 1}
+        assert parser.feed(' {"b": 2}') is None
+        assert parser._chunks == []
+        assert parser.finish() == {"a": 1}
+
+    def test_finish_closes_truncated_stream(self) -> None:
+        """finish() parses a stream that never closed."""
+        parser = IncrementalRelaxedParser()
+        parser.feed('{"a": [1,')
+        assert parser.finish() == {"a": [1]}
+
+    def test_iter_stops_at_complete_document(self) -> None:
+        """Chunks after the document are not consumed."""
+        chunks = iter(['Result: {"a"', ": 1}", " trailing"])
+        assert loads_relaxed_iter(chunks) == {"a": 1}
+        assert next(chunks) == " trailing"
+
+
 class TestCanParse:
     """Test can_parse function."""
 
@@ -110,6 +341,19 @@ class TestGetRepairs:
         # Should have at least the comment repair
         assert len(repairs) >= 1
 
+    def test_get_repairs_before_failing_pass(self) -> None:
+        """Repairs made before a pass fails are returned for small inputs."""
+        # The unterminated comment makes comment stripping raise, after the
+        # single-quote conversion has already been logged
+        repairs = get_repairs("{'a': 1, /* unclosed")
+        assert [r.kind for r in repairs] == [RepairKind.SINGLE_QUOTE_STRING]
+
+    def test_get_repairs_before_failing_pass_repeated(self) -> None:
+        """A second call with the same failing input gets the same repairs."""
+        text = "{'b': 2, /* unclosed"
+        assert get_repairs(text) == get_repairs(text)
+        assert len(get_repairs(text)) == 1
+
     def test_get_repairs_smart_quotes(
         self, smart_double_quotes: dict[str, str]
     ) -> None:
@@ -207,3 +451,30 @@ class TestRepairPositionEdgeCases:
         line, col = _calculate_line_column("hello", 100)
         assert line >= 1
         assert col >= 1
+
+    def test_line_index_matches_counting(self) -> None:
+        """Indexed lookups agree with counting from the start of the text."""
+        from jsonfix.repairs import LineIndex, _calculate_line_column
+
+        text = 'a\nbc\n\nd\n'
+        lines = LineIndex(text)
+        # The first lookup counts; the later ones bisect the newline index
+        for position in [3, -5, 0, 1, 2, 4, 5, 6, 7, 8, 100]:
+            assert lines.line_column(position) == _calculate_line_column(
+                text, position
+            )
+
+    def test_line_numbers_per_pass_text(self, repair_log: list) -> None:
+        """Each pass locates its repairs in the text it was given.
+
+        The comment is stripped first, so the later passes see the text one
+        line shorter.
+        """
+        text = '// note\n{\n  "a": 1,\n  "b": [1,,2],\n}'
+        loads_relaxed(text, repair_log=repair_log)
+        locations = {
+            repair.kind: (repair.line, repair.column) for repair in repair_log
+        }
+        assert locations[RepairKind.SINGLE_LINE_COMMENT] == (1, 1)
+        assert locations[RepairKind.TRAILING_COMMA] == (3, 14)
+        assert locations[RepairKind.DOUBLE_COMMA] == (3, 11)
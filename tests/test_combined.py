@@ -16,7 +16,7 @@ class TestTwoRelaxations:
         result = loads_relaxed(json_str, repair_log=repair_log)
         assert result == {"a": 1}
         assert len(repair_log) == 2
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.TRAILING_COMMA in kinds
 
@@ -29,7 +29,7 @@ class TestTwoRelaxations:
         json_str = f'{{{left}a{right}: 1,}}'
         result = loads_relaxed(json_str, repair_log=repair_log)
         assert result == {"a": 1}
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SMART_QUOTE in kinds
         assert RepairKind.TRAILING_COMMA in kinds
 
@@ -42,7 +42,7 @@ class TestTwoRelaxations:
         json_str = f'{{{left}a{right}: {left}hi{right}}} // comment'
         result = loads_relaxed(json_str, repair_log=repair_log)
         assert result == {"a": "hi"}
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SMART_QUOTE in kinds
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
 
@@ -59,7 +59,7 @@ class TestAllThreeRelaxations:
         json_str = f'{{{left}a{right}: 1, /* comment */}} // end'
         result = loads_relaxed(json_str, repair_log=repair_log)
         assert result == {"a": 1}
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SMART_QUOTE in kinds
         assert RepairKind.MULTI_LINE_COMMENT in kinds
 
@@ -172,7 +172,7 @@ class TestRepairLogOrdering:
         right = smart_double_quotes["right"]
         json_str = f'// comment\n{{{left}a{right}: 1,}} # end'
         loads_relaxed(json_str, repair_log=repair_log)
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.SMART_QUOTE in kinds
         assert RepairKind.TRAILING_COMMA in kinds
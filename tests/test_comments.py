@@ -144,6 +144,15 @@ class TestCommentsInStrings:
         assert result == {"url": "https://example.com/path?q=1#anchor"}
         assert repair_log == []
 
+    def test_comment_marker_in_string_after_comment(
+        self, repair_log: list
+    ) -> None:
+        """Strings after a real comment still protect their contents."""
+        text = '{"a": 1, // note\n"b": "say \\"hi\\" // #1"}'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"a": 1, "b": 'say "hi" // #1'}
+        assert len(repair_log) == 1
+
 
 class TestCommentEdgeCases:
     """Test edge cases for comments."""
@@ -110,7 +110,7 @@ class TestComplexConfigFiles:
         assert len(repair_log) >= 20
 
         # Verify multiple repair kinds
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.MULTI_LINE_COMMENT in kinds
         assert RepairKind.HASH_COMMENT in kinds
@@ -201,7 +201,7 @@ class TestComplexConfigFiles:
 
         # Verify repairs
         assert len(repair_log) >= 15
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.MULTI_LINE_COMMENT in kinds
         assert RepairKind.HASH_COMMENT in kinds
@@ -597,7 +597,7 @@ class TestComplexLLMOutput:
         assert result["arguments"]["team"]["notifications_enabled"] is True
 
         # Verify multiple repair kinds
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.MULTI_LINE_COMMENT in kinds
         assert RepairKind.HASH_COMMENT in kinds
@@ -789,7 +789,7 @@ class TestComplexAPIResponses:
         assert len(result["categories"]) == 4
 
         # Verify we have all comment types
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.MULTI_LINE_COMMENT in kinds
         assert RepairKind.HASH_COMMENT in kinds
@@ -957,7 +957,7 @@ line2",
         assert result["truncated_array"] == [1, 2, 3]
 
         # Verify all 11 repair kinds are present
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
 
         assert RepairKind.SINGLE_LINE_COMMENT in kinds, "Missing SINGLE_LINE_COMMENT"
         assert RepairKind.MULTI_LINE_COMMENT in kinds, "Missing MULTI_LINE_COMMENT"
@@ -1018,7 +1018,7 @@ line2",
         assert len(repair_log) >= 20
 
         # Verify variety of repair kinds
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert len(kinds) >= 5  # At least 5 different repair kinds
 
     def test_100_single_quote_strings(self, repair_log: list) -> None:
@@ -44,10 +44,9 @@ class TestVeryLongInputs:
     """Test very long inputs."""
 
     @pytest.mark.slow
-    def test_large_array(self, repair_log: list) -> None:
+    def test_large_array(self, repair_log: list, large_array_json: str) -> None:
         """Large array with 10000 elements."""
-        json_str = "[" + ",".join(str(i) for i in range(10000)) + ",]"
-        result = loads_relaxed(json_str, repair_log=repair_log)
+        result = loads_relaxed(large_array_json, repair_log=repair_log)
         assert len(result) == 10000
         assert result[0] == 0
         assert result[9999] == 9999
@@ -4,34 +4,75 @@ from __future__ import annotations
 
 import json
 import warnings
+from typing import Any, Callable
 
 import pytest
 
 from jsonfix import loads_relaxed
 
 
-class TestStandardJsonErrors:
-    """Test that standard JSON errors still occur."""
+def assert_raises_decode(
+    parse: Callable[..., Any], json_str: str, **options: Any
+) -> None:
+    """Fail unless parsing raises JSONDecodeError.
 
-    def test_unclosed_object(self) -> None:
-        """Unclosed object raises JSONDecodeError when auto_close_brackets=False."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": 1', auto_close_brackets=False)
+    A plain try/except; pytest.raises would also build an ExceptionInfo
+    that the table-driven tests never look at.
+    """
+    try:
+        parse(json_str, **options)
+    except json.JSONDecodeError:
+        return
+    pytest.fail(f"no JSONDecodeError for {json_str!r} with {options!r}")
 
-    def test_unclosed_array(self) -> None:
-        """Unclosed array raises JSONDecodeError when auto_close_brackets=False."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed("[1, 2", auto_close_brackets=False)
 
-    def test_unclosed_string(self) -> None:
-        """Unclosed string raises JSONDecodeError."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": "hello}')
+class TestStandardJsonErrors:
+    """Test that standard JSON errors still occur."""
 
-    def test_invalid_value_undefined(self) -> None:
-        """undefined is not valid JSON when JS value conversion is disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": undefined}', convert_javascript_values=False)
+    @pytest.mark.parametrize(
+        ("json_str", "options"),
+        [
+            pytest.param(
+                '{"a": 1', {"auto_close_brackets": False}, id="unclosed-object"
+            ),
+            pytest.param("[1, 2", {"auto_close_brackets": False}, id="unclosed-array"),
+            pytest.param('{"a": "hello}', {}, id="unclosed-string"),
+            pytest.param(
+                '{"a": undefined}',
+                {"convert_javascript_values": False},
+                id="undefined-value",
+            ),
+            pytest.param(
+                "[1,, 2]", {"remove_double_commas": False}, id="duplicate-comma-array"
+            ),
+            pytest.param(
+                "[, 1, 2]", {"remove_double_commas": False}, id="leading-comma-array"
+            ),
+            pytest.param('{"a" 1}', {"fix_missing_colon": False}, id="missing-colon"),
+            pytest.param(
+                '{"a": 1 "b": 2}',
+                {"fix_missing_comma": False},
+                id="missing-comma-object",
+            ),
+            pytest.param(
+                "[1 2 3]", {"fix_missing_comma": False}, id="missing-comma-array"
+            ),
+            pytest.param(
+                "{'a': 1}",
+                {"allow_single_quote_strings": False},
+                id="single-quote-delimiters",
+            ),
+            pytest.param("{a: 1}", {"allow_unquoted_keys": False}, id="unquoted-keys"),
+        ],
+    )
+    def test_raises_decode_error(
+        self,
+        warm_parser: Callable[..., Any],
+        json_str: str,
+        options: dict[str, bool],
+    ) -> None:
+        """Invalid JSON raises JSONDecodeError when its relaxation is disabled."""
+        assert_raises_decode(warm_parser, json_str, **options)
 
     def test_nan_parses_as_python_nan(self, repair_log: list) -> None:
         """NaN is accepted by Python's json module (non-standard but common).
@@ -60,41 +101,6 @@ class TestStandardJsonErrors:
         assert math.isinf(result["a"])
         assert repair_log == []
 
-    def test_duplicate_comma_array(self) -> None:
-        """Duplicate comma in array is an error when feature is disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed("[1,, 2]", remove_double_commas=False)
-
-    def test_leading_comma_array(self) -> None:
-        """Leading comma in array is an error when feature is disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed("[, 1, 2]", remove_double_commas=False)
-
-    def test_missing_colon(self) -> None:
-        """Missing colon in object is an error when fix_missing_colon disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a" 1}', fix_missing_colon=False)
-
-    def test_missing_comma_object(self) -> None:
-        """Missing comma between object properties is an error when disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": 1 "b": 2}', fix_missing_comma=False)
-
-    def test_missing_comma_array(self) -> None:
-        """Missing comma between array elements is an error when disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed("[1 2 3]", fix_missing_comma=False)
-
-    def test_single_quotes_as_delimiters(self) -> None:
-        """Single quotes as string delimiters is an error when disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed("{'a': 1}", allow_single_quote_strings=False)
-
-    def test_unquoted_keys(self) -> None:
-        """Unquoted keys is an error when disabled."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed("{a: 1}", allow_unquoted_keys=False)
-
 
 class TestErrorMessageQuality:
     """Test that error messages are helpful."""
@@ -154,33 +160,21 @@ class TestOnRepairParameter:
 class TestStrictMode:
     """Test strict mode comprehensively."""
 
-    def test_strict_rejects_trailing_comma(self) -> None:
-        """Strict mode rejects trailing comma."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": 1,}', strict=True)
-
-    def test_strict_rejects_single_line_comment(self) -> None:
-        """Strict mode rejects // comments."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": 1} // comment', strict=True)
-
-    def test_strict_rejects_multi_line_comment(self) -> None:
-        """Strict mode rejects /* */ comments."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": 1} /* comment */', strict=True)
-
-    def test_strict_rejects_hash_comment(self) -> None:
-        """Strict mode rejects # comments."""
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed('{"a": 1} # comment', strict=True)
-
-    def test_strict_rejects_smart_quotes(
-        self, smart_double_quotes: dict[str, str]
+    @pytest.mark.parametrize(
+        "json_str",
+        [
+            pytest.param('{"a": 1,}', id="trailing-comma"),
+            pytest.param('{"a": 1} // comment', id="single-line-comment"),
+            pytest.param('{"a": 1} /* comment */', id="multi-line-comment"),
+            pytest.param('{"a": 1} # comment', id="hash-comment"),
+            pytest.param('{\u201c"a": 1}', id="smart-quotes"),
+        ],
+    )
+    def test_strict_rejects(
+        self, warm_parser: Callable[..., Any], json_str: str
     ) -> None:
-        """Strict mode rejects smart quotes."""
-        left = smart_double_quotes["left"]
-        with pytest.raises(json.JSONDecodeError):
-            loads_relaxed(f'{{{left}"a": 1}}', strict=True)
+        """Strict mode rejects every relaxation."""
+        assert_raises_decode(warm_parser, json_str, strict=True)
 
     def test_strict_valid_json_works(self, repair_log: list) -> None:
         """Strict mode accepts valid JSON."""
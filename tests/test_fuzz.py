@@ -3,18 +3,59 @@
 from __future__ import annotations
 
 import json
+import os
 
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import example, given, settings, strategies as st
+from hypothesis.database import DirectoryBasedExampleDatabase
 
 from jsonfix import loads_relaxed
 
+# Example budgets: "dev" keeps local runs quick, "ci" is exported by the
+# CI workflow, and "nightly" is for deep exploration on demand. The CI
+# workflow caches the "ci" example database between runs; each pytest-xdist
+# worker gets its own subdirectory so parallel runs do not share files.
+settings.register_profile("dev", max_examples=20)
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    deadline=None,
+    database=DirectoryBasedExampleDatabase(
+        os.path.join(
+            ".hypothesis", "examples", os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        )
+    ),
+)
+settings.register_profile("nightly", max_examples=2000)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+# Arbitrary JSON documents, serialized and followed by random noise, so that
+# examples reach the repair passes instead of failing on the first character
+json_like = st.recursive(
+    st.none()
+    | st.booleans()
+    | st.integers()
+    | st.floats(allow_nan=False)
+    | st.text(max_size=20),
+    lambda children: st.lists(children, max_size=5)
+    | st.dictionaries(st.text(max_size=10), children, max_size=5),
+)
+mutated_json = st.builds(
+    lambda obj, noise: json.dumps(obj) + noise, json_like, st.text(max_size=10)
+)
+
 
 class TestFuzzSafety:
     """Ensure parser never crashes on arbitrary input."""
 
-    @given(st.text(max_size=1000))
-    @settings(max_examples=500)
+    # Inputs that reach rarely-hit repair branches, so that small example
+    # budgets still exercise them on every run
+    @example('}1 2')
+    @example('{"a": 1 \\ }')
+    @example('"a" "b" "c"')
+    @example('"a" 1')
+    @example('"a" true')
+    @given(st.one_of(st.text(max_size=1000), mutated_json))
     def test_arbitrary_text_never_crashes(self, text: str) -> None:
         """Parser should handle any text without crashing.
 
@@ -29,7 +70,6 @@ class TestFuzzSafety:
             pass  # Expected for on_repair="error" or invalid options
 
     @given(st.text(max_size=100))
-    @settings(max_examples=200)
     def test_valid_json_roundtrip(self, text: str) -> None:
         """Valid JSON should round-trip correctly.
 
@@ -44,7 +84,6 @@ class TestFuzzSafety:
         assert result == {"value": text}
 
     @given(st.integers())
-    @settings(max_examples=100)
     def test_integer_roundtrip(self, num: int) -> None:
         """Integers should round-trip correctly."""
         valid = json.dumps(num)
@@ -52,7 +91,6 @@ class TestFuzzSafety:
         assert result == num
 
     @given(st.floats(allow_nan=False, allow_infinity=False))
-    @settings(max_examples=100)
     def test_float_roundtrip(self, num: float) -> None:
         """Floats should round-trip correctly."""
         valid = json.dumps(num)
@@ -67,7 +105,6 @@ class TestFuzzSafety:
         assert result == val
 
     @given(st.lists(st.integers(), max_size=50))
-    @settings(max_examples=100)
     def test_list_roundtrip(self, lst: list) -> None:
         """Lists should round-trip correctly."""
         valid = json.dumps(lst)
@@ -78,17 +115,14 @@ class TestFuzzSafety:
 class TestFuzzRelaxedSyntax:
     """Fuzz test relaxed JSON syntax patterns."""
 
-    @given(st.text(alphabet="abcdefghijklmnopqrstuvwxyz_", min_size=1, max_size=20))
-    @settings(max_examples=100)
+    @given(st.from_regex(r"[a-z][a-z_]{0,19}", fullmatch=True))
     def test_unquoted_keys_with_random_identifiers(self, key: str) -> None:
         """Random valid identifiers should work as unquoted keys."""
-        if key and key[0].isalpha():  # Must start with letter
-            relaxed = f"{{{key}: 1}}"
-            result = loads_relaxed(relaxed)
-            assert result == {key: 1}
+        relaxed = f"{{{key}: 1}}"
+        result = loads_relaxed(relaxed)
+        assert result == {key: 1}
 
     @given(st.text(max_size=50))
-    @settings(max_examples=100)
     def test_single_quote_strings_with_random_content(self, content: str) -> None:
         """Random content in single-quoted strings."""
         # Escape problematic characters
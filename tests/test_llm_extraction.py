@@ -13,7 +13,8 @@ from __future__ import annotations
 
 import pytest
 
-from jsonfix import loads_relaxed, RepairKind
+from jsonfix import loads_relaxed, RepairKind, RepairLog
+from jsonfix.normalizers import extract_json_from_text
 
 
 class TestJSONExtraction:
@@ -21,12 +22,12 @@ class TestJSONExtraction:
 
     # === Preamble Tests ===
 
-    def test_simple_preamble(self, repair_log: list) -> None:
+    def test_simple_preamble(self, repair_log: RepairLog) -> None:
         """Extract JSON after simple preamble text."""
         text = 'Here is the JSON: {"name": "test"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"name": "test"}
-        assert any(r.kind == RepairKind.JSON_EXTRACTED for r in repair_log)
+        assert repair_log.counts[RepairKind.JSON_EXTRACTED] >= 1
 
     def test_preamble_with_newline(self, repair_log: list) -> None:
         """Extract JSON after preamble with newline."""
@@ -161,13 +162,13 @@ Would you like me to extract any additional information?"""
 
     # === Edge Cases ===
 
-    def test_no_extraction_needed(self, repair_log: list) -> None:
+    def test_no_extraction_needed(self, repair_log: RepairLog) -> None:
         """Pure JSON should pass through unchanged."""
         text = '{"name": "test"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"name": "test"}
         # Should NOT log JSON_EXTRACTED when no extraction was needed
-        assert not any(r.kind == RepairKind.JSON_EXTRACTED for r in repair_log)
+        assert not repair_log.has(RepairKind.JSON_EXTRACTED)
 
     def test_json_with_string_containing_braces(self, repair_log: list) -> None:
         """Don't be fooled by braces in strings."""
@@ -181,6 +182,33 @@ Would you like me to extract any additional information?"""
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"array_str": "[1, 2, 3]"}
 
+    def test_json_with_escaped_quote_before_brace(self, repair_log: list) -> None:
+        """An escaped quote does not end the string hiding a brace."""
+        text = 'Output: {"a": "say \\"}\\"", "b": {"c": 1}} Done.'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"a": 'say "}"', "b": {"c": 1}}
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ('Data: {"a": "x}', '{"a": "x}'),
+            ('Data: [1, {"a": "]"}] ok', '[1, {"a": "]"}]'),
+            ('Data: {"a": [1}]} ok', '{"a": [1}'),
+            ('x ["\\\\"] y', '["\\\\"]'),
+            ('Data: {"a": {"b": 1} and more', '{"a": {"b": 1} and more'),
+        ],
+        ids=[
+            "unterminated-string-runs-to-end",
+            "closer-in-nested-string",
+            "only-opening-kind-counted",
+            "escaped-backslash-before-quote",
+            "unclosed-runs-to-end",
+        ],
+    )
+    def test_extraction_boundary(self, text: str, expected: str) -> None:
+        """The value ends at the bracket that balances the first opener."""
+        assert extract_json_from_text(text) == expected
+
     def test_multiple_json_objects_takes_first(self, repair_log: list) -> None:
         """When multiple JSON objects exist, extract first complete one."""
         text = 'First: {"a": 1} Second: {"b": 2}'
@@ -227,12 +255,12 @@ class TestMarkdownFences:
 
     # === Basic Fence Removal ===
 
-    def test_json_fence(self, repair_log: list) -> None:
+    def test_json_fence(self, repair_log: RepairLog) -> None:
         """Remove ```json fence."""
         text = '```json\n{"a": 1}\n```'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
-        assert any(r.kind == RepairKind.MARKDOWN_FENCE_REMOVED for r in repair_log)
+        assert repair_log.counts[RepairKind.MARKDOWN_FENCE_REMOVED] >= 1
 
     def test_plain_fence(self, repair_log: list) -> None:
         """Remove plain ``` fence without language."""
@@ -252,11 +280,12 @@ class TestMarkdownFences:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
 
-    def test_jsonc_fence(self, repair_log: list) -> None:
+    def test_jsonc_fence(self, repair_log: RepairLog) -> None:
         """Remove ```jsonc fence (JSON with comments)."""
         text = '```jsonc\n{"a": 1}\n```'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
+        assert repair_log.counts[RepairKind.MARKDOWN_FENCE_REMOVED] == 1
 
     # === Fence Variations ===
 
@@ -266,6 +295,13 @@ class TestMarkdownFences:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
 
+    def test_fence_after_leading_whitespace(self, repair_log: RepairLog) -> None:
+        """A fence indented or after blank lines is still removed."""
+        text = '\n\n  ```json\n{"a": 1}\n```\n'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"a": 1}
+        assert repair_log.has(RepairKind.MARKDOWN_FENCE_REMOVED)
+
     def test_fence_case_insensitive(self, repair_log: list) -> None:
         """Handle different cases."""
         text = '```JSON\n{"a": 1}\n```'
@@ -336,14 +372,14 @@ You can save this as package.json in your project root."""
 
     # === Edge Cases ===
 
-    def test_fence_in_string_not_removed(self, repair_log: list) -> None:
+    def test_fence_in_string_not_removed(self, repair_log: RepairLog) -> None:
         """Don't remove fences that are part of string content."""
         # Disable smart quote normalization since ` is converted to ' by that feature
         text = '{"markdown": "Use ```code``` for code blocks"}'
         result = loads_relaxed(text, repair_log=repair_log, normalize_quotes=False)
         assert result == {"markdown": "Use ```code``` for code blocks"}
         # Should NOT have MARKDOWN_FENCE_REMOVED
-        assert not any(r.kind == RepairKind.MARKDOWN_FENCE_REMOVED for r in repair_log)
+        assert not repair_log.has(RepairKind.MARKDOWN_FENCE_REMOVED)
 
     def test_unclosed_fence(self, repair_log: list) -> None:
         """Handle unclosed fence gracefully."""
@@ -357,13 +393,13 @@ You can save this as package.json in your project root."""
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
 
-    def test_no_fence_passthrough(self, repair_log: list) -> None:
+    def test_no_fence_passthrough(self, repair_log: RepairLog) -> None:
         """JSON without fence passes through."""
         text = '{"a": 1}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
         # Should NOT have MARKDOWN_FENCE_REMOVED
-        assert not any(r.kind == RepairKind.MARKDOWN_FENCE_REMOVED for r in repair_log)
+        assert not repair_log.has(RepairKind.MARKDOWN_FENCE_REMOVED)
 
     def test_fence_only_opening(self, repair_log: list) -> None:
         """Handle only opening fence without closing."""
@@ -387,12 +423,12 @@ class TestUnescapedQuotes:
 
     # === Simple Cases ===
 
-    def test_single_unescaped_quote(self, repair_log: list) -> None:
+    def test_single_unescaped_quote(self, repair_log: RepairLog) -> None:
         """Fix single unescaped quote in string."""
         text = '{"text": "He said "hello" today"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": 'He said "hello" today'}
-        assert any(r.kind == RepairKind.UNESCAPED_QUOTE for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_QUOTE] >= 1
 
     def test_multiple_unescaped_quotes(self, repair_log: list) -> None:
         """Fix multiple unescaped quotes."""
@@ -440,13 +476,13 @@ class TestUnescapedQuotes:
 
     # === Already Escaped (No Change) ===
 
-    def test_already_escaped_unchanged(self, repair_log: list) -> None:
+    def test_already_escaped_unchanged(self, repair_log: RepairLog) -> None:
         """Already escaped quotes should not be double-escaped."""
         text = '{"text": "He said \\"hello\\""}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": 'He said "hello"'}
         # Should NOT have UNESCAPED_QUOTE for already escaped
-        assert not any(r.kind == RepairKind.UNESCAPED_QUOTE for r in repair_log)
+        assert not repair_log.has(RepairKind.UNESCAPED_QUOTE)
 
     def test_mixed_escaped_unescaped(self, repair_log: list) -> None:
         """Handle mix of escaped and unescaped."""
@@ -492,6 +528,16 @@ class TestUnescapedQuotes:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 'text "nested"', "b": 1}
 
+    def test_unescaped_quote_after_clean_strings(
+        self, repair_log: RepairLog
+    ) -> None:
+        """Strings before the first unescaped quote are skipped, not lost."""
+        text = '{"a": ["x", "y"], "b": "The "best" one", "c": "z"}'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"a": ["x", "y"], "b": 'The "best" one', "c": "z"}
+        quotes = repair_log.by_kind(RepairKind.UNESCAPED_QUOTE)
+        assert [r.position for r in quotes] == [28, 33]
+
     # === Array Values ===
 
     def test_unescaped_in_array(self, repair_log: list) -> None:
@@ -542,26 +588,26 @@ class TestUnescapedQuotes:
 
     # === No False Positives ===
 
-    def test_valid_json_unchanged(self, repair_log: list) -> None:
+    def test_valid_json_unchanged(self, repair_log: RepairLog) -> None:
         """Valid JSON should not be modified."""
         text = '{"text": "normal text without inner quotes"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": "normal text without inner quotes"}
-        assert not any(r.kind == RepairKind.UNESCAPED_QUOTE for r in repair_log)
+        assert not repair_log.has(RepairKind.UNESCAPED_QUOTE)
 
-    def test_properly_escaped_json(self, repair_log: list) -> None:
+    def test_properly_escaped_json(self, repair_log: RepairLog) -> None:
         """Properly escaped JSON should not be modified."""
         text = '{"text": "He said \\"hello\\" and \\"goodbye\\""}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": 'He said "hello" and "goodbye"'}
-        assert not any(r.kind == RepairKind.UNESCAPED_QUOTE for r in repair_log)
+        assert not repair_log.has(RepairKind.UNESCAPED_QUOTE)
 
-    def test_empty_string_unchanged(self, repair_log: list) -> None:
+    def test_empty_string_unchanged(self, repair_log: RepairLog) -> None:
         """Empty string should not be affected."""
         text = '{"text": ""}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": ""}
-        assert not any(r.kind == RepairKind.UNESCAPED_QUOTE for r in repair_log)
+        assert not repair_log.has(RepairKind.UNESCAPED_QUOTE)
 
     # === LLM Realistic Cases ===
 
@@ -13,18 +13,18 @@ from __future__ import annotations
 
 import pytest
 
-from jsonfix import loads_relaxed, RepairKind
+from jsonfix import loads_relaxed, RepairKind, RepairLog
 
 
 class TestMissingColon:
     """Test insertion of missing colons between keys and values."""
 
-    def test_missing_colon_string_value(self, repair_log: list) -> None:
+    def test_missing_colon_string_value(self, repair_log: RepairLog) -> None:
         """Insert colon between key and string value."""
         text = '{"name" "John"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"name": "John"}
-        assert any(r.kind == RepairKind.MISSING_COLON for r in repair_log)
+        assert repair_log.counts[RepairKind.MISSING_COLON] >= 1
 
     def test_missing_colon_number_value(self, repair_log: list) -> None:
         """Insert colon between key and number value."""
@@ -113,12 +113,12 @@ class TestMissingColon:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"name": "John"}
 
-    def test_colon_present_unchanged(self, repair_log: list) -> None:
+    def test_colon_present_unchanged(self, repair_log: RepairLog) -> None:
         """Existing colons should not be affected."""
         text = '{"a": 1}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1}
-        assert not any(r.kind == RepairKind.MISSING_COLON for r in repair_log)
+        assert repair_log.counts[RepairKind.MISSING_COLON] == 0
 
     def test_colon_in_string_not_affected(self, repair_log: list) -> None:
         """Colon in string value should not be affected."""
@@ -132,12 +132,12 @@ class TestMissingComma:
 
     # === Object Missing Commas ===
 
-    def test_missing_comma_between_pairs(self, repair_log: list) -> None:
+    def test_missing_comma_between_pairs(self, repair_log: RepairLog) -> None:
         """Insert comma between key-value pairs."""
         text = '{"a": 1 "b": 2}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1, "b": 2}
-        assert any(r.kind == RepairKind.MISSING_COMMA for r in repair_log)
+        assert repair_log.counts[RepairKind.MISSING_COMMA] >= 1
 
     def test_missing_comma_multiple(self, repair_log: list) -> None:
         """Fix multiple missing commas."""
@@ -209,23 +209,43 @@ class TestMissingComma:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == [1, 2, 3]
 
+    def test_missing_comma_after_indentation(self, repair_log: RepairLog) -> None:
+        """The repair points at the value after a run of indentation."""
+        text = '{\n    "a": 1\n    \t"b": 2\n}'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"a": 1, "b": 2}
+        comma = repair_log.first(RepairKind.MISSING_COMMA)
+        assert comma is not None
+        assert comma.position == text.index('"b"')
+
+    def test_missing_comma_after_string_with_brackets(
+        self, repair_log: RepairLog
+    ) -> None:
+        """Brackets and escaped quotes inside a string do not count."""
+        text = '["a [b] \\"c\\" 1" "d"]'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == ['a [b] "c" 1', "d"]
+        comma = repair_log.first(RepairKind.MISSING_COMMA)
+        assert comma is not None
+        assert comma.position == text.index('"d"')
+
     # === Combined ===
 
-    def test_missing_colon_and_comma(self, repair_log: list) -> None:
+    def test_missing_colon_and_comma(self, repair_log: RepairLog) -> None:
         """Fix both missing colon and comma."""
         text = '{"a" 1 "b" 2}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"a": 1, "b": 2}
         # Should have both repair types
-        assert any(r.kind == RepairKind.MISSING_COLON for r in repair_log)
-        assert any(r.kind == RepairKind.MISSING_COMMA for r in repair_log)
+        assert repair_log.counts[RepairKind.MISSING_COLON] >= 1
+        assert repair_log.counts[RepairKind.MISSING_COMMA] >= 1
 
-    def test_commas_present_unchanged(self, repair_log: list) -> None:
+    def test_commas_present_unchanged(self, repair_log: RepairLog) -> None:
         """Existing commas should not be affected."""
         text = '[1, 2, 3]'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == [1, 2, 3]
-        assert not any(r.kind == RepairKind.MISSING_COMMA for r in repair_log)
+        assert repair_log.counts[RepairKind.MISSING_COMMA] == 0
 
     def test_comma_in_string_not_affected(self, repair_log: list) -> None:
         """Comma in string should not affect detection."""
@@ -237,12 +257,12 @@ class TestMissingComma:
 class TestControlCharacters:
     """Test escaping of control characters in strings."""
 
-    def test_literal_tab(self, repair_log: list) -> None:
+    def test_literal_tab(self, repair_log: RepairLog) -> None:
         """Escape literal tab character."""
         text = '{"text": "col1\tcol2"}'  # Actual tab character
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": "col1\tcol2"}
-        assert any(r.kind == RepairKind.CONTROL_CHARACTER for r in repair_log)
+        assert repair_log.counts[RepairKind.CONTROL_CHARACTER] >= 1
 
     def test_literal_carriage_return(self, repair_log: list) -> None:
         """Escape literal carriage return."""
@@ -288,15 +308,15 @@ class TestControlCharacters:
         result = loads_relaxed(text, repair_log=repair_log)
         assert "a" in result["text"]
 
-    def test_newline_handled_separately(self, repair_log: list) -> None:
+    def test_newline_handled_separately(self, repair_log: RepairLog) -> None:
         """Newlines should be handled by existing UNESCAPED_NEWLINE."""
         text = '{"text": "line1\nline2"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": "line1\nline2"}
         # Should use UNESCAPED_NEWLINE, not CONTROL_CHARACTER
-        assert any(r.kind == RepairKind.UNESCAPED_NEWLINE for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_NEWLINE] >= 1
 
-    def test_valid_escaped_tab_unchanged(self, repair_log: list) -> None:
+    def test_valid_escaped_tab_unchanged(self, repair_log: RepairLog) -> None:
         """Valid JSON escape \\t should produce a tab character.
 
         Per JSON spec, \\t is a valid escape for tab. It should not be modified.
@@ -306,7 +326,7 @@ class TestControlCharacters:
         result = loads_relaxed(text, repair_log=repair_log)
         # \t is valid JSON escape - produces actual tab
         assert result == {"text": "col1\tcol2"}
-        assert not any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] == 0
 
     def test_control_char_in_array(self, repair_log: list) -> None:
         """Handle control character in array string."""
@@ -314,16 +334,27 @@ class TestControlCharacters:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == ["a\tb", "c\rd"]
 
+    def test_control_chars_outside_strings_untouched(
+        self, repair_log: RepairLog
+    ) -> None:
+        """Tabs between tokens stay; strings after them are still fixed."""
+        text = '{\t"a": "x\ty",\t"b": "z\x01"}'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"a": "x\ty", "b": "z\x01"}
+        repairs = repair_log.by_kind(RepairKind.CONTROL_CHARACTER)
+        positions = [r.position for r in repairs]
+        assert positions == [text.index("x") + 1, text.index("z") + 1]
+
 
 class TestUnescapedBackslash:
     """Test escaping of unescaped backslashes."""
 
-    def test_windows_path(self, repair_log: list) -> None:
+    def test_windows_path(self, repair_log: RepairLog) -> None:
         """Escape backslashes in Windows path."""
         text = r'{"path": "C:\Users\name\file.txt"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"path": "C:\\Users\\name\\file.txt"}
-        assert any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] >= 1
 
     def test_backslash_before_invalid_escape_q(self, repair_log: list) -> None:
         """Escape backslash before invalid escape \\q."""
@@ -344,7 +375,7 @@ class TestUnescapedBackslash:
         # Should escape the backslash or handle appropriately
         assert "a" in result["text"]
 
-    def test_valid_escapes_unchanged_n(self, repair_log: list) -> None:
+    def test_valid_escapes_unchanged_n(self, repair_log: RepairLog) -> None:
         """Valid JSON escape \\n should produce a newline character.
 
         Per JSON spec, \\n is a valid escape for newline. It should not be modified.
@@ -354,9 +385,9 @@ class TestUnescapedBackslash:
         result = loads_relaxed(text, repair_log=repair_log)
         # \n is valid JSON escape - produces actual newline
         assert result == {"text": "line1\nline2"}
-        assert not any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] == 0
 
-    def test_valid_escapes_unchanged_t(self, repair_log: list) -> None:
+    def test_valid_escapes_unchanged_t(self, repair_log: RepairLog) -> None:
         """Valid JSON escape \\t should produce a tab character.
 
         Per JSON spec, \\t is a valid escape for tab. It should not be modified.
@@ -366,21 +397,21 @@ class TestUnescapedBackslash:
         result = loads_relaxed(text, repair_log=repair_log)
         # \t is valid JSON escape - produces actual tab
         assert result == {"text": "col1\tcol2"}
-        assert not any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] == 0
 
-    def test_valid_escapes_unchanged_quote(self, repair_log: list) -> None:
+    def test_valid_escapes_unchanged_quote(self, repair_log: RepairLog) -> None:
         """Valid escape \\" should not be modified."""
         text = '{"text": "He said \\"hello\\""}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"text": 'He said "hello"'}
-        assert not any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] == 0
 
-    def test_valid_escapes_unchanged_backslash(self, repair_log: list) -> None:
+    def test_valid_escapes_unchanged_backslash(self, repair_log: RepairLog) -> None:
         """Valid escape \\\\ should not be modified."""
         text = '{"path": "C:\\\\Users\\\\name"}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"path": "C:\\Users\\name"}
-        assert not any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] == 0
 
     def test_already_escaped_backslash(self, repair_log: list) -> None:
         """Already escaped backslash should remain unchanged."""
@@ -388,7 +419,7 @@ class TestUnescapedBackslash:
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"path": "C:\\Users"}
 
-    def test_mixed_valid_invalid(self, repair_log: list) -> None:
+    def test_mixed_valid_invalid(self, repair_log: RepairLog) -> None:
         """Mix of valid and invalid backslash sequences.
 
         Valid JSON escapes (\\n) are preserved, invalid ones (\\q) are escaped.
@@ -400,7 +431,7 @@ class TestUnescapedBackslash:
         # \q is invalid - backslash is escaped, producing literal backslash+q
         assert "\\q" in result["text"]
         # Should have repair for \q but not for \n
-        assert any(r.kind == RepairKind.UNESCAPED_BACKSLASH for r in repair_log)
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] >= 1
 
     def test_multiple_invalid_escapes(self, repair_log: list) -> None:
         """Multiple invalid escape sequences."""
@@ -423,6 +454,16 @@ class TestUnescapedBackslash:
             # It's also acceptable to fail on truly malformed input
             pass
 
+    def test_windows_path_after_other_string(self, repair_log: list) -> None:
+        """Only the string that looks like a path has its \\n and \\t escaped."""
+        text = r'{"note": "a\nb", "path": "D:\new\table"}'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == {"note": "a\nb", "path": "D:\\new\\table"}
+        assert [r.position for r in repair_log] == [
+            text.index(r"\new"),
+            text.index(r"\table"),
+        ]
+
     def test_regex_pattern(self, repair_log: list) -> None:
         """Handle regex pattern with backslashes."""
         text = r'{"pattern": "\d+\.\d+"}'
@@ -434,14 +475,14 @@ class TestUnescapedBackslash:
 class TestCombinedStructuralFeatures:
     """Test combinations of structural repair features."""
 
-    def test_all_structural_errors(self, repair_log: list) -> None:
+    def test_all_structural_errors(self, repair_log: RepairLog) -> None:
         """Test object with multiple structural errors."""
         text = '{"name" "John" "age" 30 "active" true}'
         result = loads_relaxed(text, repair_log=repair_log)
         assert result == {"name": "John", "age": 30, "active": True}
         # Should have both missing colons and commas
-        assert any(r.kind == RepairKind.MISSING_COLON for r in repair_log)
-        assert any(r.kind == RepairKind.MISSING_COMMA for r in repair_log)
+        assert repair_log.counts[RepairKind.MISSING_COLON] >= 1
+        assert repair_log.counts[RepairKind.MISSING_COMMA] >= 1
 
     def test_structural_with_control_chars(self, repair_log: list) -> None:
         """Structural errors combined with control characters."""
@@ -10,37 +10,38 @@ from jsonfix import loads_relaxed
 
 
 class TestPerformance:
-    """Ensure acceptable performance on large inputs."""
+    """Ensure acceptable performance on large inputs.
+
+    The budgets assume a serial run without coverage, as in the CI step
+    that runs the slow tests on their own.
+    """
 
     @pytest.mark.slow
-    def test_large_array_performance(self) -> None:
-        """Should handle 100k element array in under 5 seconds."""
-        large_json = "[" + ",".join(["1"] * 100000) + "]"
-        start = time.time()
-        result = loads_relaxed(large_json)
-        elapsed = time.time() - start
-        assert elapsed < 5.0, f"Took {elapsed:.2f}s, expected < 5.0s"
+    def test_large_array_performance(self, hundred_k_array_json: str) -> None:
+        """Should handle 100k element array in under 1 second."""
+        start = time.perf_counter_ns()
+        result = loads_relaxed(hundred_k_array_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        assert elapsed < 1.0, f"Took {elapsed:.2f}s, expected < 1.0s"
         assert len(result) == 100000
 
     @pytest.mark.slow
-    def test_large_object_performance(self) -> None:
-        """Should handle 10k key object in under 3 seconds."""
-        pairs = [f'"key{i}": {i}' for i in range(10000)]
-        large_json = "{" + ", ".join(pairs) + "}"
-        start = time.time()
-        result = loads_relaxed(large_json)
-        elapsed = time.time() - start
-        assert elapsed < 3.0, f"Took {elapsed:.2f}s, expected < 3.0s"
+    def test_large_object_performance(self, large_object_json: str) -> None:
+        """Should handle 10k key object in under 1 second."""
+        start = time.perf_counter_ns()
+        result = loads_relaxed(large_object_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        assert elapsed < 1.0, f"Took {elapsed:.2f}s, expected < 1.0s"
         assert len(result) == 10000
 
     @pytest.mark.slow
     def test_deeply_nested_performance(self) -> None:
         """Should handle 100 levels of nesting."""
         nested = '{"a":' * 100 + "1" + "}" * 100
-        start = time.time()
+        start = time.perf_counter_ns()
         result = loads_relaxed(nested)
-        elapsed = time.time() - start
-        assert elapsed < 1.0, f"Took {elapsed:.2f}s, expected < 1.0s"
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        assert elapsed < 0.5, f"Took {elapsed:.2f}s, expected < 0.5s"
         # Verify structure
         current = result
         for _ in range(100):
@@ -49,14 +50,12 @@ class TestPerformance:
         assert current == 1
 
     @pytest.mark.slow
-    def test_large_string_performance(self) -> None:
-        """Should handle 1MB string value in under 12 seconds."""
-        large_string = "x" * (1024 * 1024)  # 1MB
-        large_json = f'{{"text": "{large_string}"}}'
-        start = time.time()
-        result = loads_relaxed(large_json)
-        elapsed = time.time() - start
-        assert elapsed < 12.0, f"Took {elapsed:.2f}s, expected < 12.0s"
+    def test_large_string_performance(self, large_string_json: str) -> None:
+        """Should handle 1MB string value in under 1 second."""
+        start = time.perf_counter_ns()
+        result = loads_relaxed(large_string_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        assert elapsed < 1.0, f"Took {elapsed:.2f}s, expected < 1.0s"
         assert len(result["text"]) == 1024 * 1024
 
     @pytest.mark.slow
@@ -67,11 +66,11 @@ class TestPerformance:
         large_json = "[" + ", ".join(items) + "]"
 
         repairs: list = []
-        start = time.time()
+        start = time.perf_counter_ns()
         result = loads_relaxed(large_json, repair_log=repairs)
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
-        assert elapsed < 3.0, f"Took {elapsed:.2f}s, expected < 3.0s"
+        assert elapsed < 1.0, f"Took {elapsed:.2f}s, expected < 1.0s"
         assert len(result) == 1000
         assert len(repairs) >= 1000  # At least 1000 trailing comma repairs
 
@@ -85,25 +84,56 @@ class TestPerformanceWithRelaxations:
         items = ["'item'" for _ in range(10000)]
         large_json = "[" + ", ".join(items) + "]"
 
-        start = time.time()
+        start = time.perf_counter_ns()
         result = loads_relaxed(large_json)
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
-        assert elapsed < 3.0, f"Took {elapsed:.2f}s, expected < 3.0s"
+        assert elapsed < 2.0, f"Took {elapsed:.2f}s, expected < 2.0s"
         assert len(result) == 10000
 
     @pytest.mark.slow
-    def test_comments_large_file(self) -> None:
+    def test_comments_large_file(self, many_comments_json: str) -> None:
         """Comment stripping on large file with many comments."""
-        lines = []
-        for i in range(1000):
-            lines.append(f"// Comment {i}")
-            lines.append(f'  "key{i}": {i},')
-        content = "{\n" + "\n".join(lines[:-1]) + "\n" + lines[-1].rstrip(",") + "\n}"
-
-        start = time.time()
-        result = loads_relaxed(content)
-        elapsed = time.time() - start
+        start = time.perf_counter_ns()
+        result = loads_relaxed(many_comments_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
-        assert elapsed < 3.0, f"Took {elapsed:.2f}s, expected < 3.0s"
+        assert elapsed < 1.0, f"Took {elapsed:.2f}s, expected < 1.0s"
         assert len(result) == 1000
+
+    @pytest.mark.slow
+    def test_literals_large_array(self) -> None:
+        """true/false/null detection on a large array needing a repair."""
+        large_json = "[" + ", ".join(["true", "false", "null"] * 10000) + ",]"
+
+        start = time.perf_counter_ns()
+        result = loads_relaxed(large_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+
+        assert elapsed < 2.0, f"Took {elapsed:.2f}s, expected < 2.0s"
+        assert len(result) == 30000
+
+    @pytest.mark.slow
+    def test_missing_colons_large_object(self) -> None:
+        """Missing-colon repair on a large object with no separators."""
+        pairs = [f'"key{i}" {i}' for i in range(5000)]
+        large_json = "{" + " ".join(pairs) + "}"
+
+        start = time.perf_counter_ns()
+        result = loads_relaxed(large_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+
+        assert elapsed < 2.0, f"Took {elapsed:.2f}s, expected < 2.0s"
+        assert result == {f"key{i}": i for i in range(5000)}
+
+    @pytest.mark.slow
+    def test_missing_commas_between_strings_large_array(self) -> None:
+        """Unescaped-quote checks on a large array of adjacent strings."""
+        large_json = "[" + " ".join(f'"item{i}"' for i in range(5000)) + "]"
+
+        start = time.perf_counter_ns()
+        result = loads_relaxed(large_json)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+
+        assert elapsed < 2.0, f"Took {elapsed:.2f}s, expected < 2.0s"
+        assert result == [f"item{i}" for i in range(5000)]
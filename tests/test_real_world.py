@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import pytest
 
-from jsonfix import loads_relaxed, RepairKind
+from jsonfix import loads_relaxed, RepairKind, RepairLog
 
 
 class TestLLMOutputExamples:
     """Test typical LLM output patterns."""
 
     @pytest.mark.real_world
-    def test_chatgpt_response_with_trailing_comma(self, repair_log: list) -> None:
+    def test_chatgpt_response_with_trailing_comma(
+        self, repair_log: RepairLog
+    ) -> None:
         """Typical ChatGPT JSON response with trailing comma."""
         json_str = """{
             "response": "Here is the data you requested",
@@ -26,12 +28,11 @@ class TestLLMOutputExamples:
         assert result["items"] == ["apple", "banana", "cherry"]
         assert result["metadata"]["count"] == 3
         # Multiple trailing commas
-        trailing = [r for r in repair_log if r.kind == RepairKind.TRAILING_COMMA]
-        assert len(trailing) >= 3
+        assert repair_log.counts[RepairKind.TRAILING_COMMA] >= 3
 
     @pytest.mark.real_world
     def test_llm_with_smart_quotes(
-        self, repair_log: list, smart_double_quotes: dict[str, str]
+        self, repair_log: RepairLog, smart_double_quotes: dict[str, str]
     ) -> None:
         """LLM output that was copied through a word processor."""
         left = smart_double_quotes["left"]
@@ -39,8 +40,7 @@ class TestLLMOutputExamples:
         json_str = f'{{{left}message{right}: {left}Hello world{right}}}'
         result = loads_relaxed(json_str, repair_log=repair_log)
         assert result["message"] == "Hello world"
-        quote_repairs = [r for r in repair_log if r.kind == RepairKind.SMART_QUOTE]
-        assert len(quote_repairs) == 4
+        assert repair_log.counts[RepairKind.SMART_QUOTE] == 4
 
     @pytest.mark.real_world
     def test_llm_function_call_response(self, repair_log: list) -> None:
@@ -270,7 +270,7 @@ class TestMixedRealWorldScenarios:
     """Test mixed real-world scenarios."""
 
     @pytest.mark.real_world
-    def test_llm_config_generation(self, repair_log: list) -> None:
+    def test_llm_config_generation(self, repair_log: RepairLog) -> None:
         """LLM generating a config file with comments."""
         json_str = """{
             // Generated by AI Assistant
@@ -295,13 +295,13 @@ class TestMixedRealWorldScenarios:
         assert result["database"]["port"] == 5432
         assert result["features"]["dark_mode"] is True
         # Should have various repair types
-        kinds = {r.kind for r in repair_log}
+        kinds = repair_log.counts
         assert RepairKind.SINGLE_LINE_COMMENT in kinds
         assert RepairKind.MULTI_LINE_COMMENT in kinds
         assert RepairKind.TRAILING_COMMA in kinds
 
     @pytest.mark.real_world
-    def test_debugging_json_with_annotations(self, repair_log: list) -> None:
+    def test_debugging_json_with_annotations(self, repair_log: RepairLog) -> None:
         """JSON being debugged with inline annotations."""
         json_str = """{
             "request_id": "abc123",  // TODO: make this UUID
@@ -316,9 +316,9 @@ class TestMixedRealWorldScenarios:
         assert result["request_id"] == "abc123"
         assert result["data"]["items"] == [1, 2, 3]
         # Should have all comment types
-        comment_kinds = {
-            r.kind
-            for r in repair_log
-            if "COMMENT" in r.kind.name
+        comment_kinds = repair_log.counts.keys() & {
+            RepairKind.SINGLE_LINE_COMMENT,
+            RepairKind.MULTI_LINE_COMMENT,
+            RepairKind.HASH_COMMENT,
         }
         assert len(comment_kinds) >= 2  # At least 2 different comment types
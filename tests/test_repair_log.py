@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+import pickle
+from collections import deque
+
 import pytest
 
-from jsonfix import loads_relaxed, Repair, RepairKind
+from jsonfix import get_repairs, loads_relaxed, Repair, RepairKind, RepairLog
 
 
 class TestBasicFunctionality:
@@ -34,6 +39,13 @@ class TestBasicFunctionality:
         loads_relaxed('{"b": 2,}', repair_log=log)
         assert len(log) == 2
 
+    def test_bounded_deque_keeps_latest(self) -> None:
+        """A deque with a maxlen keeps only the most recent repairs."""
+        log: deque[Repair] = deque(maxlen=2)
+        loads_relaxed("{'a': 1, 'b': [1,],}", repair_log=log)
+        assert len(log) == 2
+        assert all(r.kind == RepairKind.TRAILING_COMMA for r in log)
+
 
 class TestRepairObjectFields:
     """Test Repair object field values."""
@@ -128,6 +140,17 @@ class TestPositionAccuracy:
         assert len(repair_log) == 1
         assert repair_log[0].line == 3  # Trailing comma is on line 3
 
+    def test_line_column_of_many_repairs(self, repair_log: list) -> None:
+        """Every repair in one pass gets its own line and column."""
+        json_str = "[\n  [1,],\n\n    [2,],\n[3,],\n]"
+        loads_relaxed(json_str, repair_log=repair_log)
+        assert [(r.line, r.column) for r in repair_log] == [
+            (2, 5),
+            (4, 7),
+            (5, 3),
+            (5, 5),
+        ]
+
     def test_position_with_unicode(
         self, repair_log: list, smart_double_quotes: dict[str, str]
     ) -> None:
@@ -155,25 +178,28 @@ class TestPositionAccuracy:
 class TestRepairKindEnum:
     """Test RepairKind enum values."""
 
-    def test_repair_kind_trailing_comma(self, repair_log: list) -> None:
-        """TRAILING_COMMA kind."""
-        loads_relaxed('{"a": 1,}', repair_log=repair_log)
-        assert repair_log[0].kind == RepairKind.TRAILING_COMMA
-
-    def test_repair_kind_single_line_comment(self, repair_log: list) -> None:
-        """SINGLE_LINE_COMMENT kind."""
-        loads_relaxed('{"a": 1} // comment', repair_log=repair_log)
-        assert repair_log[0].kind == RepairKind.SINGLE_LINE_COMMENT
-
-    def test_repair_kind_multi_line_comment(self, repair_log: list) -> None:
-        """MULTI_LINE_COMMENT kind."""
-        loads_relaxed('{"a": /* comment */ 1}', repair_log=repair_log)
-        assert repair_log[0].kind == RepairKind.MULTI_LINE_COMMENT
-
-    def test_repair_kind_hash_comment(self, repair_log: list) -> None:
-        """HASH_COMMENT kind."""
-        loads_relaxed('{"a": 1} # comment', repair_log=repair_log)
-        assert repair_log[0].kind == RepairKind.HASH_COMMENT
+    def test_repair_kind_usable_as_key_after_pickling(self) -> None:
+        """Unpickled kinds are the same members and find the same entries."""
+        counts = {kind: i for i, kind in enumerate(RepairKind)}
+        for kind in RepairKind:
+            assert counts[pickle.loads(pickle.dumps(kind))] == counts[kind]
+
+    @pytest.mark.parametrize(
+        ("text", "expected_kind"),
+        [
+            ('{"a": 1,}', RepairKind.TRAILING_COMMA),
+            ('{"a": 1} // comment', RepairKind.SINGLE_LINE_COMMENT),
+            ('{"a": /* comment */ 1}', RepairKind.MULTI_LINE_COMMENT),
+            ('{"a": 1} # comment', RepairKind.HASH_COMMENT),
+        ],
+        ids=["trailing-comma", "single-line", "multi-line", "hash"],
+    )
+    def test_repair_kind(
+        self, text: str, expected_kind: RepairKind, repair_log: list
+    ) -> None:
+        """Each repair is logged with the kind that names it."""
+        loads_relaxed(text, repair_log=repair_log)
+        assert repair_log[0].kind == expected_kind
 
     def test_repair_kind_smart_quote(
         self, repair_log: list, smart_double_quotes: dict[str, str]
@@ -223,3 +249,162 @@ class TestRepairDataclass:
         _ = repair.original
         _ = repair.replacement
         _ = repair.message
+
+    def test_repair_has_no_instance_dict(self, repair_log: list) -> None:
+        """Repair stores its fields in slots."""
+        loads_relaxed('{"a": 1,}', repair_log=repair_log)
+        assert not hasattr(repair_log[0], "__dict__")
+
+    def test_repair_pickle_and_copy(self, repair_log: list) -> None:
+        """Repairs survive pickling and copying despite being frozen."""
+        loads_relaxed('{"a": 1,}', repair_log=repair_log)
+        repair = repair_log[0]
+        assert pickle.loads(pickle.dumps(repair)) == repair
+        assert copy.copy(repair) == repair
+        assert copy.deepcopy(repair) == repair
+
+    def test_fixed_message_shared(self, repair_log: list) -> None:
+        """Repairs whose message has no placeholders share one string."""
+        loads_relaxed("[[1,], [2,]]", repair_log=repair_log)
+        first, second = repair_log
+        assert first.message == "Removed trailing comma"
+        assert first.message is second.message
+
+    def test_created_repair_matches_constructor(self, repair_log: list) -> None:
+        """Logged repairs equal, and are as frozen as, constructed ones."""
+        loads_relaxed('{"a": 1,}', repair_log=repair_log)
+        repair = repair_log[0]
+        assert repair == Repair(
+            kind=RepairKind.TRAILING_COMMA,
+            position=7,
+            line=1,
+            column=8,
+            original=",",
+            replacement="",
+            message="Removed trailing comma",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            repair.position = 0  # type: ignore[misc]
+
+    def test_created_repair_sets_every_field(self, repair_log: list) -> None:
+        """Logged repairs have a value for every Repair field."""
+        loads_relaxed("{'a': 1,} // note", repair_log=repair_log)
+        assert len(repair_log) == 3
+        for repair in repair_log:
+            for field in dataclasses.fields(Repair):
+                getattr(repair, field.name)  # AttributeError if left unset
+
+
+class TestRepairLogContainer:
+    """Test the RepairLog list subclass."""
+
+    def test_repair_log_is_list(self) -> None:
+        """RepairLog can be used wherever a list is expected."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1,}', repair_log=log)
+        assert isinstance(log, list)
+        assert len(log) == 1
+
+    def test_by_kind(self) -> None:
+        """by_kind selects repairs of one kind in log order."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1, // x\n "b": [1, 2,],}', repair_log=log)
+        commas = log.by_kind(RepairKind.TRAILING_COMMA)
+        assert len(commas) == 2
+        assert commas[0].position < commas[1].position
+        assert log.by_kind(RepairKind.SINGLE_LINE_COMMENT)[0].original == "// x"
+        assert log.by_kind(RepairKind.SMART_QUOTE) == []
+
+    def test_by_kind_sees_later_appends(self) -> None:
+        """The kind index stays current as repairs are appended."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1,}', repair_log=log)
+        assert len(log.by_kind(RepairKind.TRAILING_COMMA)) == 1
+        loads_relaxed('{"b": 2,}', repair_log=log)
+        assert len(log.by_kind(RepairKind.TRAILING_COMMA)) == 2
+
+    def test_by_kind_after_mutation(self) -> None:
+        """The kind index is rebuilt after non-append mutations."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1,} // x', repair_log=log)
+        assert len(log.by_kind(RepairKind.SINGLE_LINE_COMMENT)) == 1
+        del log[0]
+        assert log.by_kind(RepairKind.SINGLE_LINE_COMMENT) == []
+        log.clear()
+        assert log.by_kind(RepairKind.TRAILING_COMMA) == []
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            pytest.param(lambda log, r: log.extend([r]), id="extend"),
+            pytest.param(lambda log, r: log.insert(0, r), id="insert"),
+            pytest.param(lambda log, r: log.pop(), id="pop"),
+            pytest.param(lambda log, r: log.remove(log[0]), id="remove"),
+            pytest.param(lambda log, r: log.reverse(), id="reverse"),
+            pytest.param(lambda log, r: log.sort(key=lambda x: x.position), id="sort"),
+            pytest.param(lambda log, r: log.__setitem__(0, r), id="setitem"),
+            pytest.param(lambda log, r: log.__setitem__(slice(0, 1), [r]), id="slice"),
+            pytest.param(lambda log, r: log.__iadd__([r]), id="iadd"),
+            pytest.param(lambda log, r: log.__imul__(2), id="imul"),
+        ],
+    )
+    def test_by_kind_matches_list_after_mutation(self, mutate: object) -> None:
+        """Every list mutation leaves by_kind consistent with the contents."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1,} // x', repair_log=log)
+        log.by_kind(RepairKind.TRAILING_COMMA)  # build the index
+        extra = get_repairs("[1,]")[0]
+        mutate(log, extra)  # type: ignore[operator]
+        for kind in RepairKind:
+            assert log.by_kind(kind) == [r for r in log if r.kind == kind]
+
+    def test_by_kind_returns_copy(self) -> None:
+        """Mutating a by_kind result does not affect the log."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1,}', repair_log=log)
+        log.by_kind(RepairKind.TRAILING_COMMA).clear()
+        assert len(log.by_kind(RepairKind.TRAILING_COMMA)) == 1
+
+    def test_counts(self) -> None:
+        """counts tallies repairs per kind and stays current."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1, // x\n "b": [1, 2,],}', repair_log=log)
+        assert log.counts[RepairKind.TRAILING_COMMA] == 2
+        assert log.counts[RepairKind.SINGLE_LINE_COMMENT] == 1
+        assert log.counts[RepairKind.SMART_QUOTE] == 0
+        loads_relaxed("[1,]", repair_log=log)
+        assert log.counts[RepairKind.TRAILING_COMMA] == 3
+        log.clear()
+        assert not log.counts
+
+    def test_count_and_first(self) -> None:
+        """count and first look repairs up by kind."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1, // x\n "b": [1, 2,],}', repair_log=log)
+        assert log.count(RepairKind.TRAILING_COMMA) == 2
+        assert log.count(RepairKind.SMART_QUOTE) == 0
+        first = log.first(RepairKind.TRAILING_COMMA)
+        assert first is log.by_kind(RepairKind.TRAILING_COMMA)[0]
+        assert log.first(RepairKind.SMART_QUOTE) is None
+
+    def test_has(self) -> None:
+        """has reports whether a kind was logged and stays current."""
+        log = RepairLog()
+        loads_relaxed('{"a": 1,}', repair_log=log)
+        assert log.has(RepairKind.TRAILING_COMMA)
+        assert not log.has(RepairKind.SMART_QUOTE)
+        del log[0]
+        assert not log.has(RepairKind.TRAILING_COMMA)
+
+    def test_count_repair_is_list_count(self) -> None:
+        """count given a Repair keeps list semantics."""
+        log = RepairLog()
+        loads_relaxed("[1,]", repair_log=log)
+        loads_relaxed("[1,]", repair_log=log)
+        assert log.count(log[0]) == 2
+
+    def test_get_repairs_returns_repair_log(self) -> None:
+        """get_repairs returns a RepairLog."""
+        repairs = get_repairs('{"a": 1,}')
+        assert isinstance(repairs, RepairLog)
+        assert len(repairs.by_kind(RepairKind.TRAILING_COMMA)) == 1
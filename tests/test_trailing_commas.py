@@ -116,6 +116,13 @@ class TestRepairLog:
         ]
         assert len(trailing_comma_repairs) == 3
 
+    def test_comma_before_bracket_in_string_kept(self, repair_log: list) -> None:
+        """Only the comma outside the strings is a trailing comma."""
+        text = '[",]", "a\\",}",]'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == [",]", 'a",}']
+        assert [r.position for r in repair_log] == [len(text) - 2]
+
     def test_repair_message_descriptive(self, repair_log: list) -> None:
         """Repair message is descriptive."""
         loads_relaxed('{"a": 1,}', repair_log=repair_log)
@@ -127,6 +127,21 @@ class TestBracketOrder:
         result = loads_relaxed('{"arr": [1, 2], "obj": {"x": 1', repair_log=repair_log)
         assert result == {"arr": [1, 2], "obj": {"x": 1}}
 
+    @pytest.mark.parametrize(
+        ("json_str", "added"),
+        [
+            pytest.param('{"a": [1}', ["]", "}"], id="brace-closes-array"),
+            pytest.param('[{"a": 1]', ["}", "]"], id="bracket-closes-object"),
+        ],
+    )
+    def test_mismatched_closer_not_matched(
+        self, repair_log: list, json_str: str, added: list[str]
+    ) -> None:
+        """A closer of the wrong type does not close the open bracket."""
+        with pytest.raises(json.JSONDecodeError):
+            loads_relaxed(json_str, repair_log=repair_log)
+        assert [r.replacement for r in repair_log] == added
+
 
 class TestRepairLog:
     """Test repair log for auto-close."""
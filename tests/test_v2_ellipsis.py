@@ -61,6 +61,13 @@ class TestEllipsisPreservedInStrings:
         assert result == {"text": "Loading…"}
         assert len(repair_log) == 0
 
+    def test_strings_with_ellipses_before_marker(self, repair_log: list) -> None:
+        """Only the marker after the strings is removed."""
+        text = '["a...b", "say \\"…\\" .", 3.5, ...]'
+        result = loads_relaxed(text, repair_log=repair_log)
+        assert result == ["a...b", 'say "…" .', 3.5]
+        assert [r.position for r in repair_log] == [text.rindex("...")]
+
 
 class TestWithOtherFeatures:
     """Test ellipsis with other features."""
@@ -142,3 +149,15 @@ class TestEllipsisWithWhitespace:
         """Unicode ellipsis followed by mixed whitespace."""
         result = loads_relaxed("[1, 2, … \t\n ]", repair_log=repair_log)
         assert result == [1, 2]
+
+    def test_consecutive_ellipses(self, repair_log: list) -> None:
+        """Back-to-back markers are both removed along with their commas."""
+        result = loads_relaxed("[1, ..., ...]", repair_log=repair_log)
+        assert result == [1]
+        assert [r.original for r in repair_log] == [", ...", ", ..."]
+
+    def test_adjacent_ellipses(self, repair_log: list) -> None:
+        """A marker directly after another marker is removed on its own."""
+        result = loads_relaxed("[1, ... ...]", repair_log=repair_log)
+        assert result == [1]
+        assert [r.original for r in repair_log] == [", ...", "..."]
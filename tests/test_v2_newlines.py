@@ -70,6 +70,13 @@ class TestAlreadyEscaped:
         assert result == {"a": "line1\rline2"}
         assert len(repair_log) == 0
 
+    def test_escape_sequence_before_literal_newline(self, repair_log: list) -> None:
+        """An escaped quote before a literal newline does not end the string."""
+        json_str = '{"a": "say \\"hi\\"\nbye"}'
+        result = loads_relaxed(json_str, repair_log=repair_log)
+        assert result == {"a": 'say "hi"\nbye'}
+        assert len(repair_log) == 1
+
 
 class TestNewlinesOutsideStrings:
     """Test newlines outside strings."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from jsonfix import loads_relaxed
+from jsonfix import RepairKind, RepairLog, loads_relaxed
 
 
 class TestRelaxedInputCompatibility:
@@ -107,15 +107,14 @@ class TestCombinedIssues:
 class TestRepairLogging:
     """Test that all repairs are logged correctly."""
 
-    def test_multiple_repair_types_logged(self, repair_log: list) -> None:
+    def test_multiple_repair_types_logged(self, repair_log: RepairLog) -> None:
         """All repair types are logged for complex input."""
         loads_relaxed("{key: 'value', flag: True,}", repair_log=repair_log)
 
-        repair_kinds = {r.kind.name for r in repair_log}
-        assert "UNQUOTED_KEY" in repair_kinds
-        assert "SINGLE_QUOTE_STRING" in repair_kinds
-        assert "PYTHON_LITERAL" in repair_kinds
-        assert "TRAILING_COMMA" in repair_kinds
+        assert repair_log.has(RepairKind.UNQUOTED_KEY)
+        assert repair_log.has(RepairKind.SINGLE_QUOTE_STRING)
+        assert repair_log.has(RepairKind.PYTHON_LITERAL)
+        assert repair_log.has(RepairKind.TRAILING_COMMA)
 
     def test_repairs_contain_useful_info(self, repair_log: list) -> None:
         """Each repair contains useful information."""
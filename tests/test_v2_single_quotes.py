@@ -166,6 +166,11 @@ class TestEscapeSequencesInSingleQuotes:
         result = loads_relaxed(r"{'path': 'C:\\Users'}", repair_log=repair_log)
         assert result == {"path": "C:\\Users"}
 
+    def test_escaped_backslash_before_escaped_quote(self, repair_log: list) -> None:
+        """An escaped backslash does not swallow the quote escape after it."""
+        result = loads_relaxed(r"{'text': 'a\\\'b', 'c': 'd'}", repair_log=repair_log)
+        assert result == {"text": "a\\'b", "c": "d"}
+
     def test_unclosed_single_quote_causes_error(self) -> None:
         """Unclosed single quote causes JSON decode error."""
         # Covers normalizers.py lines 206-208
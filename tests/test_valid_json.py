@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from jsonfix import loads_relaxed
+from jsonfix import RepairKind, RepairLog, loads_relaxed
 
 
 class TestBasicTypes:
@@ -179,3 +179,25 @@ class TestEdgeCases:
             repair_log.clear()
             loads_relaxed(json_str, repair_log=repair_log)
             assert repair_log == [], f"Unexpected repairs for: {json_str}"
+
+
+class TestRepairsStillApplied:
+    """Valid JSON that the repair passes still rewrite."""
+
+    def test_nan_converted_to_null(self, repair_log: RepairLog) -> None:
+        """NaN is accepted by json.loads but still converted to null."""
+        result = loads_relaxed('{"a": NaN, "b": [Infinity]}', repair_log=repair_log)
+        assert result == {"a": None, "b": [None]}
+        assert repair_log.counts[RepairKind.JAVASCRIPT_VALUE] == 2
+
+    def test_smart_quotes_in_string_normalized(self, repair_log: RepairLog) -> None:
+        """Smart quotes inside a valid string are still normalized."""
+        result = loads_relaxed('{"a": "\u2018x\u2019"}', repair_log=repair_log)
+        assert result == {"a": "'x'"}
+        assert repair_log.counts[RepairKind.SMART_QUOTE] == 2
+
+    def test_windows_path_escaped(self, repair_log: RepairLog) -> None:
+        """A drive-letter path keeps its backslashes even if they form escapes."""
+        result = loads_relaxed('{"p": "C:\\temp"}', repair_log=repair_log)
+        assert result == {"p": "C:\\temp"}
+        assert repair_log.counts[RepairKind.UNESCAPED_BACKSLASH] == 1